@@ -13,6 +13,7 @@ import urllib.request
 import urllib.error
 from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple, Callable
 import webbrowser
 
@@ -24,7 +25,7 @@ except ImportError:
     HAS_REQUESTS = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DriverInfo:
     """Represents information about a device driver"""
     device_name: str
@@ -41,7 +42,7 @@ class DriverInfo:
     device_class: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OnlineDriverInfo:
     """Represents driver information from online sources"""
     name: str
@@ -472,6 +473,18 @@ class DriverScanner:
         except:
             return {"Manufacturer": "Unknown", "Model": "Unknown"}
     
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _format_driver_date(date_str: str) -> str:
+        """Format a WMI DriverDate as YYYY-MM-DD; many drivers share the same date"""
+        try:
+            if '/Date(' in date_str:
+                timestamp = int(date_str.replace('/Date(', '').replace(')/', '').split('-')[0].split('+')[0])
+                return datetime.fromtimestamp(timestamp/1000).strftime('%Y-%m-%d')
+        except (ValueError, OSError, OverflowError):
+            pass
+        return date_str[:10]
+    
     def scan_installed_drivers(self) -> List[DriverInfo]:
         """Scan all installed drivers using WMI"""
         self.log("Scanning installed drivers...")
@@ -494,29 +507,23 @@ class DriverScanner:
                 if item.get('DeviceName'):
                     driver_date = ""
                     if item.get('DriverDate'):
-                        try:
-                            date_str = item['DriverDate']
-                            if '/Date(' in date_str:
-                                timestamp = int(date_str.replace('/Date(', '').replace(')/', '').split('-')[0].split('+')[0])
-                                driver_date = datetime.fromtimestamp(timestamp/1000).strftime('%Y-%m-%d')
-                            else:
-                                driver_date = str(date_str)[:10]
-                        except:
-                            driver_date = str(item.get('DriverDate', ''))[:10]
+                        driver_date = self._format_driver_date(str(item['DriverDate']))
                     
                     hw_id = item.get('HardWareID', '')
                     if isinstance(hw_id, list):
                         hw_id = hw_id[0] if hw_id else ''
                     
+                    # Manufacturer, version, date and class repeat across
+                    # hundreds of drivers; intern them so rows share one copy
                     drivers.append(DriverInfo(
                         device_name=item.get('DeviceName', 'Unknown'),
                         device_id=item.get('DeviceID', ''),
-                        manufacturer=item.get('Manufacturer', 'Unknown'),
-                        driver_version=item.get('DriverVersion', 'Unknown'),
-                        driver_date=driver_date,
+                        manufacturer=sys.intern(item.get('Manufacturer') or 'Unknown'),
+                        driver_version=sys.intern(item.get('DriverVersion') or 'Unknown'),
+                        driver_date=sys.intern(driver_date),
                         status="OK" if item.get('IsSigned') else "Unsigned",
                         inf_name=item.get('InfName', ''),
-                        device_class=item.get('DeviceClass', ''),
+                        device_class=sys.intern(item.get('DeviceClass') or ''),
                         hardware_id=hw_id
                     ))
             
@@ -6,17 +6,23 @@ A Python GUI application to scan for and install driver updates
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import queue
 import subprocess
 import json
 import os
 import sys
 import ctypes
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from itertools import groupby
 import urllib.request
 import urllib.error
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple, Callable
 import webbrowser
 
 # Try to import requests for better HTTP handling
@@ -27,7 +33,7 @@ except ImportError:
     HAS_REQUESTS = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DriverInfo:
     """Represents information about a device driver"""
     device_name: str
@@ -44,7 +50,7 @@ class DriverInfo:
     device_class: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OnlineDriverInfo:
     """Represents driver information from online sources"""
     name: str
@@ -519,6 +525,18 @@ class DriverScanner:
         except:
             return {"Manufacturer": "Unknown", "Model": "Unknown"}
     
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _format_driver_date(date_str: str) -> str:
+        """Format a WMI DriverDate as YYYY-MM-DD; many drivers share the same date"""
+        try:
+            if '/Date(' in date_str:
+                timestamp = int(date_str.replace('/Date(', '').replace(')/', '').split('-')[0].split('+')[0])
+                return datetime.fromtimestamp(timestamp/1000).strftime('%Y-%m-%d')
+        except (ValueError, OSError, OverflowError):
+            pass
+        return date_str[:10]
+    
     def scan_installed_drivers(self) -> List[DriverInfo]:
         """Scan all installed drivers using WMI"""
         self.log("Scanning installed drivers...")
@@ -543,31 +561,24 @@ class DriverScanner:
                 if item.get('DeviceName'):
                     driver_date = ""
                     if item.get('DriverDate'):
-                        try:
-                            # Parse WMI date format
-                            date_str = item['DriverDate']
-                            if '/Date(' in date_str:
-                                timestamp = int(date_str.replace('/Date(', '').replace(')/', '').split('-')[0].split('+')[0])
-                                driver_date = datetime.fromtimestamp(timestamp/1000).strftime('%Y-%m-%d')
-                            else:
-                                driver_date = str(date_str)[:10]
-                        except:
-                            driver_date = str(item.get('DriverDate', ''))[:10]
+                        driver_date = self._format_driver_date(str(item['DriverDate']))
                     
                     # Get hardware ID (can be string or array)
                     hw_id = item.get('HardWareID', '')
                     if isinstance(hw_id, list):
                         hw_id = hw_id[0] if hw_id else ''
                     
+                    # Manufacturer, version, date and class repeat across
+                    # hundreds of drivers; intern them so rows share one copy
                     drivers.append(DriverInfo(
                         device_name=item.get('DeviceName', 'Unknown'),
                         device_id=item.get('DeviceID', ''),
-                        manufacturer=item.get('Manufacturer', 'Unknown'),
-                        driver_version=item.get('DriverVersion', 'Unknown'),
-                        driver_date=driver_date,
+                        manufacturer=sys.intern(item.get('Manufacturer') or 'Unknown'),
+                        driver_version=sys.intern(item.get('DriverVersion') or 'Unknown'),
+                        driver_date=sys.intern(driver_date),
                         status="OK" if item.get('IsSigned') else "Unsigned",
                         inf_name=item.get('InfName', ''),
-                        device_class=item.get('DeviceClass', ''),
+                        device_class=sys.intern(item.get('DeviceClass') or ''),
                         hardware_id=hw_id
                     ))
             
@@ -1199,9 +1210,64 @@ class DriverScanner:
             return False
 
 
+class BackgroundPool:
+    """Fixed pool of reusable daemon worker threads for blocking operations.
+    
+    Threads are created once on first use and then shared by every scan,
+    so repeated actions don't pay thread creation/teardown each time. The
+    pool size also caps how many short operations run concurrently; jobs
+    that take minutes (SFC, DISM, CHKDSK, installs) go through submit_long
+    so they can't hold every worker and leave quick actions queued.
+    """
+    
+    def __init__(self, max_workers: int = 4,
+                 on_error: Optional[Callable[[str, Exception], None]] = None):
+        self.max_workers = max_workers
+        self.on_error = on_error  # on_error(task name, exception), called on the failing thread
+        self._tasks = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+    
+    def submit(self, func: Callable, *args, **kwargs):
+        """Queue func(*args, **kwargs) to run on a pool thread"""
+        with self._lock:
+            if not self._workers:
+                for i in range(self.max_workers):
+                    worker = threading.Thread(target=self._worker_loop,
+                                              name=f"BackgroundPool-{i}", daemon=True)
+                    worker.start()
+                    self._workers.append(worker)
+        self._tasks.put((func, args, kwargs))
+    
+    def submit_long(self, func: Callable, *args, **kwargs):
+        """Run a long job on a thread of its own, outside the fixed workers"""
+        threading.Thread(target=self._run, args=(func, args, kwargs),
+                         name=f"BackgroundPool-{getattr(func, '__name__', 'job')}", daemon=True).start()
+    
+    def _worker_loop(self):
+        while True:
+            func, args, kwargs = self._tasks.get()
+            self._run(func, args, kwargs)
+    
+    def _run(self, func: Callable, args: tuple, kwargs: dict):
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(getattr(func, '__name__', repr(func)), e)
+
+
 class DriverUpdaterApp:
     """Main application GUI"""
     
+    LOG_MAX_LINES = 2000      # Oldest log lines are dropped beyond this
+    OUTPUT_MAX_LINES = 5000   # Same cap for the health/disk tool output panes
+    OUTPUT_FLUSH_MS = 50      # Queued output/log text is written in one batch
+    ROW_TAGS = ('evenrow', 'oddrow')  # Indexed by row number & 1
+    TREE_FILL_CHUNK = 200     # Rows inserted per event-loop slice when filling a tree
+    HEALTH_CHECK_WORKERS = 4  # Health check queries allowed to run at once
+    SMART_POLL_INTERVAL = 30 * 60  # Seconds a disk SMART reading is reused by the health check
+    
     # Modern glass-style color scheme
     COLORS = {
         'bg': '#0a0a0f',
@@ -1242,6 +1308,19 @@ class DriverUpdaterApp:
         self.manufacturer_urls = {}
         self.update_items = {}
         
+        # Shared worker threads for all background operations
+        self._pool = BackgroundPool(max_workers=4, on_error=self._on_background_error)
+        
+        # Latest fill per tree; a newer fill cancels slices of an older one
+        self._tree_fills = {}
+        
+        # Log/health/disk output is queued from any thread and flushed in batches
+        self._output_pending = deque()
+        self._output_flush_scheduled = False
+        self._output_lock = threading.Lock()
+        self._pending_task_status = None  # Latest streamed (task, percent), applied on flush
+        self._smart_reading = None  # (time.monotonic(), parsed SMART query) from check_disk_health
+        
         self.setup_ui()
     
     def setup_styles(self):
@@ -1515,15 +1594,45 @@ class DriverUpdaterApp:
                                        style='Card.TLabel', font=('Century Gothic', 9), width=6)
         self.percent_label.grid(row=0, column=2, sticky="e", padx=(8, 12), pady=6)
         
+    def _configure_row_stripes(self, tree: ttk.Treeview):
+        """Set up the alternating row background tags once per tree"""
+        tree.tag_configure('evenrow', background=self.COLORS['bg_row_alt'])
+        tree.tag_configure('oddrow', background=self.COLORS['bg_glass'])
+    
+    def _make_toolbar(self, parent, row: int, *specs, label: str = "",
+                      pady=(0, 16)) -> Tuple[ttk.Frame, List[ttk.Button]]:
+        """Build a full-width bar of an optional muted label and buttons.
+        
+        Each spec is (text, style, command) or (text, style, command, side);
+        None inserts a small gap between button groups. Returns the bar and
+        its buttons in spec order.
+        """
+        bar = ttk.Frame(parent, style='Card.TFrame')
+        bar.grid(row=row, column=0, columnspan=2, sticky="ew", padx=16, pady=pady)
+        
+        if label:
+            ttk.Label(bar, text=label, style='Muted.TLabel').pack(side=tk.LEFT)
+        
+        buttons = []
+        for spec in specs:
+            if spec is None:
+                ttk.Frame(bar, width=8, style='Card.TFrame').pack(side=tk.LEFT)
+                continue
+            text, style, command, *side = spec
+            btn = ttk.Button(bar, text=text, style=style, command=command)
+            if side and side[0] == tk.RIGHT:
+                btn.pack(side=tk.RIGHT)
+            else:
+                btn.pack(side=tk.LEFT, padx=(0, 4))
+            buttons.append(btn)
+        return bar, buttons
+    
     def setup_drivers_tab(self):
         """Setup the installed drivers tab"""
         self.drivers_frame.columnconfigure(0, weight=1)
         self.drivers_frame.rowconfigure(1, weight=1)
         
-        # Header
-        header = ttk.Frame(self.drivers_frame, style='Card.TFrame')
-        header.grid(row=0, column=0, columnspan=2, sticky="ew", padx=16, pady=(16, 8))
-        ttk.Label(header, text="Installed device drivers", style='Muted.TLabel').pack(side=tk.LEFT)
+        self._make_toolbar(self.drivers_frame, 0, label="Installed device drivers", pady=(16, 8))
         
         # Treeview
         columns = ('Device', 'Manufacturer', 'Version', 'Date', 'Status')
@@ -1544,6 +1653,7 @@ class DriverUpdaterApp:
         
         vsb = ttk.Scrollbar(self.drivers_frame, orient="vertical", command=self.drivers_tree.yview)
         self.drivers_tree.configure(yscrollcommand=vsb.set)
+        self._configure_row_stripes(self.drivers_tree)
         
         self.drivers_tree.grid(row=1, column=0, sticky="nsew", padx=(16, 0), pady=(0, 16))
         vsb.grid(row=1, column=1, sticky="ns", padx=(2, 16), pady=(0, 16))
@@ -1553,10 +1663,8 @@ class DriverUpdaterApp:
         self.updates_frame.columnconfigure(0, weight=1)
         self.updates_frame.rowconfigure(1, weight=1)
         
-        # Header
-        header = ttk.Frame(self.updates_frame, style='Card.TFrame')
-        header.grid(row=0, column=0, columnspan=2, sticky="ew", padx=16, pady=(16, 8))
-        ttk.Label(header, text="Available updates from Windows Update", style='Muted.TLabel').pack(side=tk.LEFT)
+        self._make_toolbar(self.updates_frame, 0, label="Available updates from Windows Update",
+                           pady=(16, 8))
         
         # Treeview
         columns = ('Select', 'Update', 'Publisher', 'Date', 'Restart')
@@ -1576,36 +1684,30 @@ class DriverUpdaterApp:
         
         vsb = ttk.Scrollbar(self.updates_frame, orient="vertical", command=self.updates_tree.yview)
         self.updates_tree.configure(yscrollcommand=vsb.set)
+        self._configure_row_stripes(self.updates_tree)
+        self.updates_tree.bind('<ButtonRelease-1>', self.on_update_click)
         
         self.updates_tree.grid(row=1, column=0, sticky="nsew", padx=(16, 0), pady=(0, 8))
         vsb.grid(row=1, column=1, sticky="ns", padx=(2, 16), pady=(0, 8))
         
         # Action bar
-        action_bar = ttk.Frame(self.updates_frame, style='Card.TFrame')
-        action_bar.grid(row=2, column=0, columnspan=2, sticky="ew", padx=16, pady=(0, 16))
-        
-        ttk.Button(action_bar, text="Select All", style='Small.TButton',
-                   command=self.select_all_updates).pack(side=tk.LEFT, padx=(0, 4))
-        ttk.Button(action_bar, text="Clear", style='Small.TButton',
-                   command=self.deselect_all_updates).pack(side=tk.LEFT, padx=(0, 12))
-        
-        self.download_install_btn = ttk.Button(action_bar, text="Download & Install", 
-                                                command=self.download_and_install_selected,
-                                                style='Accent.TButton')
-        self.download_install_btn.pack(side=tk.LEFT)
-        
-        ttk.Button(action_bar, text="MS Catalog", style='Small.TButton',
-                   command=self.open_update_catalog).pack(side=tk.RIGHT)
+        _, buttons = self._make_toolbar(
+            self.updates_frame, 2,
+            ("Select All", 'Small.TButton', self.select_all_updates),
+            ("Clear", 'Small.TButton', self.deselect_all_updates),
+            None,
+            ("Download & Install", 'Accent.TButton', self.download_and_install_selected),
+            ("MS Catalog", 'Small.TButton', self.open_update_catalog, tk.RIGHT),
+        )
+        self.download_install_btn = buttons[2]
         
     def setup_problems_tab(self):
         """Setup the problem devices tab"""
         self.problems_frame.columnconfigure(0, weight=1)
         self.problems_frame.rowconfigure(1, weight=1)
         
-        # Header
-        header = ttk.Frame(self.problems_frame, style='Card.TFrame')
-        header.grid(row=0, column=0, columnspan=2, sticky="ew", padx=16, pady=(16, 8))
-        ttk.Label(header, text="Devices with missing or problematic drivers", style='Muted.TLabel').pack(side=tk.LEFT)
+        self._make_toolbar(self.problems_frame, 0, label="Devices with missing or problematic drivers",
+                           pady=(16, 8))
         
         columns = ('Device', 'Status', 'Error', 'ID')
         self.problems_tree = ttk.Treeview(self.problems_frame, columns=columns, show='headings')
@@ -1622,6 +1724,7 @@ class DriverUpdaterApp:
         
         vsb = ttk.Scrollbar(self.problems_frame, orient="vertical", command=self.problems_tree.yview)
         self.problems_tree.configure(yscrollcommand=vsb.set)
+        self._configure_row_stripes(self.problems_tree)
         
         self.problems_tree.grid(row=1, column=0, sticky="nsew", padx=(16, 0), pady=(0, 16))
         vsb.grid(row=1, column=1, sticky="ns", padx=(2, 16), pady=(0, 16))
@@ -1634,6 +1737,8 @@ class DriverUpdaterApp:
         self.log_text = scrolledtext.ScrolledText(
             self.log_frame, 
             wrap=tk.WORD, 
+            undo=False,
+            autoseparators=False,
             font=('Consolas', 10),
             bg=self.COLORS['bg_glass'],
             fg=self.COLORS['text_secondary'],
@@ -1651,11 +1756,9 @@ class DriverUpdaterApp:
         self.online_frame.columnconfigure(0, weight=1)
         self.online_frame.rowconfigure(1, weight=1)
         
-        # Header
-        header = ttk.Frame(self.online_frame, style='Card.TFrame')
-        header.grid(row=0, column=0, columnspan=2, sticky="ew", padx=16, pady=(16, 8))
-        ttk.Label(header, text="Download drivers from vendor websites (double-click to open)", 
-                 style='Muted.TLabel').pack(side=tk.LEFT)
+        self._make_toolbar(self.online_frame, 0,
+                           label="Download drivers from vendor websites (double-click to open)",
+                           pady=(16, 8))
         
         columns = ('Device', 'Version', 'Source', 'Description')
         self.online_tree = ttk.Treeview(self.online_frame, columns=columns, show='headings')
@@ -1672,6 +1775,7 @@ class DriverUpdaterApp:
         
         vsb = ttk.Scrollbar(self.online_frame, orient="vertical", command=self.online_tree.yview)
         self.online_tree.configure(yscrollcommand=vsb.set)
+        self._configure_row_stripes(self.online_tree)
         
         self.online_tree.grid(row=1, column=0, sticky="nsew", padx=(16, 0), pady=(0, 8))
         vsb.grid(row=1, column=1, sticky="ns", padx=(2, 16), pady=(0, 8))
@@ -1679,13 +1783,11 @@ class DriverUpdaterApp:
         self.online_tree.bind('<Double-1>', self.on_online_driver_double_click)
         
         # Action bar
-        action_bar = ttk.Frame(self.online_frame, style='Card.TFrame')
-        action_bar.grid(row=2, column=0, columnspan=2, sticky="ew", padx=16, pady=(0, 16))
-        
-        ttk.Button(action_bar, text="Open Selected", style='Small.TButton',
-                   command=self.open_selected_online_driver).pack(side=tk.LEFT, padx=(0, 4))
-        ttk.Button(action_bar, text="Open All", style='Small.TButton',
-                   command=self.open_all_online_sources).pack(side=tk.LEFT)
+        self._make_toolbar(
+            self.online_frame, 2,
+            ("Open Selected", 'Small.TButton', self.open_selected_online_driver),
+            ("Open All", 'Small.TButton', self.open_all_online_sources),
+        )
     
     def setup_manufacturer_tools_tab(self):
         """Setup the manufacturer tools tab"""
@@ -1857,6 +1959,7 @@ class DriverUpdaterApp:
         outdated_scroll = ttk.Scrollbar(outdated_tree_frame, orient=tk.VERTICAL, command=self.outdated_tree.yview)
         outdated_scroll.grid(row=0, column=1, sticky="ns")
         self.outdated_tree.configure(yscrollcommand=outdated_scroll.set)
+        self._configure_row_stripes(self.outdated_tree)
         
         # Status label with summary
         status_frame = ttk.Frame(self.cleanup_frame, style='Glass.TFrame')
@@ -1885,9 +1988,7 @@ class DriverUpdaterApp:
             self.set_status("Creating restore point...", "busy")
             self.update_task_status("Creating restore point...", 50)
             
-            thread = threading.Thread(target=self.perform_restore_point_creation)
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_restore_point_creation, long_running=True)
     
     def perform_restore_point_creation(self):
         """Create restore point in background"""
@@ -1924,16 +2025,12 @@ class DriverUpdaterApp:
         self.update_task_status("Cleanup: Scanning driver store...", 0)
         
         # Clear existing items
-        for item in self.unused_tree.get_children():
-            self.unused_tree.delete(item)
-        for item in self.outdated_tree.get_children():
-            self.outdated_tree.delete(item)
+        self.unused_tree.delete(*self.unused_tree.get_children())
+        self.outdated_tree.delete(*self.outdated_tree.get_children())
         
         self.cleanup_status.config(text="Scanning driver store...")
         
-        thread = threading.Thread(target=self.perform_cleanup_scan)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_cleanup_scan)
     
     def perform_cleanup_scan(self):
         """Perform cleanup scan in background"""
@@ -1969,29 +2066,34 @@ class DriverUpdaterApp:
             'protected': '🔒'
         }
         
-        # Add unused drivers with risk-based colors
-        for i, driver in enumerate(unused_drivers):
-            risk = driver.get('risk', 'safe')
-            risk_symbol = risk_symbols.get(risk, '●')
-            
-            self.unused_tree.insert("", tk.END, values=(
-                f"{risk_symbol} {risk.title()}",
-                driver.get('category', 'Other'),
-                driver.get('name', driver.get('driver', 'Unknown')),
-                driver.get('driver', ''),
-                driver.get('provider', ''),
-                driver.get('reason', '')
-            ), tags=(risk,))
+        # Group unused drivers by category so the list reads in a stable order
+        categories = defaultdict(list)
+        for driver in unused_drivers:
+            categories[driver.get('category', 'Other')].append(driver)
+        
+        # Build every row first and hand each tree a single batched fill
+        unused_rows = []
+        for category, cat_drivers in sorted(categories.items()):
+            for driver in cat_drivers:
+                risk = driver.get('risk', 'safe')
+                unused_rows.append(((
+                    f"{risk_symbols.get(risk, '●')} {risk.title()}",
+                    category,
+                    driver.get('name', driver.get('driver', 'Unknown')),
+                    driver.get('driver', ''),
+                    driver.get('provider', ''),
+                    driver.get('reason', '')
+                ), (risk,)))
+        self._fill_tree(self.unused_tree, unused_rows)
         
         # Add outdated drivers with alternating colors
-        for i, driver in enumerate(outdated_drivers):
-            tag = 'oddrow' if i % 2 else 'evenrow'
-            self.outdated_tree.insert("", tk.END, values=(
-                driver.get('name', 'Unknown'),
-                driver.get('version', ''),
-                driver.get('latest_version', 'N/A'),
-                driver.get('manufacturer', '')
-            ), tags=(tag,))
+        self._fill_tree(self.outdated_tree, [
+            ((driver.get('name', 'Unknown'),
+              driver.get('version', ''),
+              driver.get('latest_version', 'N/A'),
+              driver.get('manufacturer', '')), (self.ROW_TAGS[i & 1],))
+            for i, driver in enumerate(outdated_drivers)
+        ])
         
         # Enable remove button if there are unused drivers
         if unused_drivers:
@@ -2053,9 +2155,7 @@ class DriverUpdaterApp:
             self.remove_unused_btn.config(state=tk.DISABLED)
             self.set_status("Removing drivers...", "busy")
             
-            thread = threading.Thread(target=self.perform_driver_removal, args=(inf_files,))
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_driver_removal, inf_files)
     
     def check_driver_in_use(self, inf_name: str) -> bool:
         """Check if a driver is currently in use by any device"""
@@ -2269,6 +2369,7 @@ class DriverUpdaterApp:
         disk_scroll = ttk.Scrollbar(disk_tree_frame, orient=tk.VERTICAL, command=self.disk_tree.yview)
         disk_scroll.grid(row=0, column=1, sticky="ns")
         self.disk_tree.configure(yscrollcommand=disk_scroll.set)
+        self._configure_row_stripes(self.disk_tree)
         
         # Bind selection event
         self.disk_tree.bind('<<TreeviewSelect>>', self.on_disk_selected)
@@ -2369,6 +2470,8 @@ class DriverUpdaterApp:
         self.disk_output = scrolledtext.ScrolledText(
             output_card, 
             wrap=tk.WORD, 
+            undo=False,
+            autoseparators=False,
             font=('Consolas', 9),
             bg=self.COLORS['bg_glass'],
             fg=self.COLORS['text'],
@@ -2388,8 +2491,9 @@ class DriverUpdaterApp:
         self.disk_output.tag_configure('error', foreground='#ef4444')
         self.disk_output.tag_configure('info', foreground='#3b82f6')
         
-        # Store disk data
+        # Store disk data; the selected row is cached by on_disk_selected
         self.disk_data = {}
+        self._selected_disk = {}
         
         # Initial load
         self.root.after(100, self.refresh_disk_info)
@@ -2401,12 +2505,10 @@ class DriverUpdaterApp:
         self.update_task_status("Disk: Scanning...", 50)
         
         # Clear existing
-        for item in self.disk_tree.get_children():
-            self.disk_tree.delete(item)
+        self.disk_tree.delete(*self.disk_tree.get_children())
+        self._selected_disk = {}
         
-        thread = threading.Thread(target=self.perform_disk_refresh)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_disk_refresh)
     
     def perform_disk_refresh(self):
         """Perform disk info refresh in background"""
@@ -2471,7 +2573,7 @@ class DriverUpdaterApp:
             
             self.root.after(0, lambda: self.populate_disk_list(disks))
         except Exception as e:
-            self.root.after(0, lambda: self.append_disk_output(f"Error refreshing disks: {e}\n", 'error'))
+            self.append_disk_output(f"Error refreshing disks: {e}\n", 'error')
         finally:
             self.root.after(0, lambda: self.refresh_disks_btn.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.set_status("Ready", "success"))
@@ -2502,7 +2604,7 @@ class DriverUpdaterApp:
             else:
                 status = f"● {health}"
             
-            tag = 'oddrow' if i % 2 else 'evenrow'
+            tag = self.ROW_TAGS[i & 1]
             item_id = self.disk_tree.insert("", tk.END, values=(
                 f"{drive}:",
                 label,
@@ -2521,10 +2623,12 @@ class DriverUpdaterApp:
         """Handle disk selection"""
         selected = self.disk_tree.selection()
         if not selected:
+            self._selected_disk = {}
             return
         
         item_id = selected[0]
         disk = self.disk_data.get(item_id, {})
+        self._selected_disk = disk
         
         if not disk:
             return
@@ -2556,12 +2660,7 @@ class DriverUpdaterApp:
     
     def get_selected_drive(self):
         """Get the currently selected drive letter"""
-        selected = self.disk_tree.selection()
-        if not selected:
-            return None
-        
-        disk = self.disk_data.get(selected[0], {})
-        return disk.get('DriveLetter')
+        return self._selected_disk.get('DriveLetter')
     
     def run_chkdsk_on_selected(self):
         """Run CHKDSK on selected drive"""
@@ -2585,9 +2684,7 @@ class DriverUpdaterApp:
             self.append_disk_output(f"\n{'='*40}\n", 'info')
             self.append_disk_output(f"Starting CHKDSK on {drive}: ...\n", 'info')
             
-            thread = threading.Thread(target=self.perform_chkdsk, args=(drive, False))
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_chkdsk, drive, False, long_running=True)
     
     def run_chkdsk_repair_on_selected(self):
         """Run CHKDSK /F on selected drive"""
@@ -2622,9 +2719,7 @@ class DriverUpdaterApp:
                 self.append_disk_output(f"\n{'='*40}\n", 'info')
                 self.append_disk_output(f"Starting CHKDSK /F on {drive}: ...\n", 'info')
                 
-                thread = threading.Thread(target=self.perform_chkdsk, args=(drive, True))
-                thread.daemon = True
-                thread.start()
+                self.run_bg(self.perform_chkdsk, drive, True, long_running=True)
     
     def schedule_chkdsk_on_restart(self, drive):
         """Schedule CHKDSK on system drive for next restart"""
@@ -2649,46 +2744,28 @@ class DriverUpdaterApp:
     
     def perform_chkdsk(self, drive, fix=False):
         """Perform CHKDSK in background"""
+        def on_line(line):
+            self.append_disk_output(line + "\n")
+            # Update progress if percentage found
+            match = re.search(r'(\d+)\s*(?:percent|%)', line)
+            if match:
+                pct = int(match.group(1))
+                self._post_task_status(f"CHKDSK: {pct}%", pct)
+        
         try:
             cmd = f'chkdsk {drive}:'
             if fix:
                 cmd += ' /F'
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                shell=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
+            returncode = self._stream_process(cmd, on_line, shell=True)
             
-            if process.stdout:
-                for line in process.stdout:
-                    line = line.strip()
-                    if line:
-                        self.root.after(0, lambda l=line: self.append_disk_output(l + "\n"))
-                        
-                        # Update progress if percentage found
-                        if '%' in line:
-                            try:
-                                import re
-                                match = re.search(r'(\d+)\s*(?:percent|%)', line)
-                                if match:
-                                    pct = int(match.group(1))
-                                    self.root.after(0, lambda p=pct: self.update_task_status(f"CHKDSK: {p}%", p))
-                            except:
-                                pass
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                self.root.after(0, lambda: self.append_disk_output("\n✓ CHKDSK completed successfully\n", 'good'))
+            if returncode == 0:
+                self.append_disk_output("\n✓ CHKDSK completed successfully\n", 'good')
             else:
-                self.root.after(0, lambda: self.append_disk_output(f"\n⚠ CHKDSK finished with code {process.returncode}\n", 'warning'))
+                self.append_disk_output(f"\n⚠ CHKDSK finished with code {returncode}\n", 'warning')
             
         except Exception as e:
-            self.root.after(0, lambda: self.append_disk_output(f"\n✗ Error: {e}\n", 'error'))
+            self.append_disk_output(f"\n✗ Error: {e}\n", 'error')
         finally:
             self.root.after(0, lambda: self.disk_chkdsk_btn.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.disk_repair_btn.config(state=tk.NORMAL))
@@ -2704,9 +2781,7 @@ class DriverUpdaterApp:
             return
         
         # Get media type
-        selected = self.disk_tree.selection()
-        disk = self.disk_data.get(selected[0], {}) if selected else {}
-        media_type = disk.get('MediaType', 'Unknown')
+        media_type = self._selected_disk.get('MediaType', 'Unknown')
         
         if media_type == 'SSD':
             action = "TRIM optimization"
@@ -2723,38 +2798,23 @@ class DriverUpdaterApp:
             self.append_disk_output(f"\n{'='*40}\n", 'info')
             self.append_disk_output(f"Starting {action} on {drive}: ...\n", 'info')
             
-            thread = threading.Thread(target=self.perform_optimize, args=(drive,))
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_optimize, drive, long_running=True)
     
     def perform_optimize(self, drive):
         """Perform drive optimization"""
         try:
             # Use defrag command with optimize flag
-            process = subprocess.Popen(
-                f'defrag {drive}: /O /U /V',
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                shell=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            if process.stdout:
-                for line in process.stdout:
-                    line = line.strip()
-                    if line:
-                        self.root.after(0, lambda l=line: self.append_disk_output(l + "\n"))
-            
-            process.wait()
+            returncode = self._stream_process(f'defrag {drive}: /O /U /V',
+                                              lambda line: self.append_disk_output(line + "\n"),
+                                              shell=True)
             
-            if process.returncode == 0:
-                self.root.after(0, lambda: self.append_disk_output("\n✓ Optimization completed\n", 'good'))
+            if returncode == 0:
+                self.append_disk_output("\n✓ Optimization completed\n", 'good')
             else:
-                self.root.after(0, lambda: self.append_disk_output(f"\n⚠ Optimization finished with code {process.returncode}\n", 'warning'))
+                self.append_disk_output(f"\n⚠ Optimization finished with code {returncode}\n", 'warning')
                 
         except Exception as e:
-            self.root.after(0, lambda: self.append_disk_output(f"\n✗ Error: {e}\n", 'error'))
+            self.append_disk_output(f"\n✗ Error: {e}\n", 'error')
         finally:
             self.root.after(0, lambda: self.disk_optimize_btn.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.set_status("Ready", "success"))
@@ -2787,8 +2847,7 @@ class DriverUpdaterApp:
     
     def append_disk_output(self, text, tag=None):
         """Append text to disk output with optional tag"""
-        self.disk_output.insert(tk.END, text, tag)
-        self.disk_output.see(tk.END)
+        self._queue_output(self.disk_output, text, tag)
     
     def setup_health_tab(self):
         """Setup the comprehensive Windows health check tab"""
@@ -2809,6 +2868,11 @@ class DriverUpdaterApp:
                                            command=self.run_full_health_check)
         self.quick_health_btn.pack(side=tk.RIGHT, padx=(0, 8))
         
+        # Same check, but skips the recently cached SMART reading
+        self.smart_reread_btn = ttk.Button(header_row, text="Re-read SMART",
+                                           command=lambda: self.run_full_health_check(force=True))
+        self.smart_reread_btn.pack(side=tk.RIGHT, padx=(0, 8))
+        
         ttk.Label(header_card, text="Comprehensive system health analysis - Windows Update, Security, Disk, Memory, and more", 
                  style='Card.TLabel').pack(anchor=tk.W, pady=(0, 8))
         
@@ -2917,6 +2981,8 @@ class DriverUpdaterApp:
         self.health_output = scrolledtext.ScrolledText(
             output_card, 
             wrap=tk.WORD, 
+            undo=False,
+            autoseparators=False,
             font=('Consolas', 9),
             bg=self.COLORS['bg_glass'],
             fg=self.COLORS['text'],
@@ -2991,14 +3057,15 @@ class DriverUpdaterApp:
         card.status_text.config(text=text or default_text)
         self.health_items[key]['status'] = status
     
-    def run_full_health_check(self):
+    def run_full_health_check(self, force: bool = False):
         """Run comprehensive health check"""
         self.quick_health_btn.config(state=tk.DISABLED)
+        self.smart_reread_btn.config(state=tk.DISABLED)
         self.set_status("Running health check...", "busy")
         self.update_task_status("Health: Starting...", 0)
         
         # Clear output
-        self.health_output.delete(1.0, tk.END)
+        self._clear_output(self.health_output)
         self.health_output.insert(tk.END, "═" * 50 + "\n", 'header')
         self.health_output.insert(tk.END, "    SYSTEM HEALTH CHECK REPORT\n", 'header')
         self.health_output.insert(tk.END, f"    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n", 'header')
@@ -3008,44 +3075,49 @@ class DriverUpdaterApp:
         for key in self.health_items:
             self.update_health_card(key, 'checking', 'Checking...')
         
-        thread = threading.Thread(target=self.perform_full_health_check)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_full_health_check, force)
     
-    def perform_full_health_check(self):
-        """Perform all health checks"""
+    def perform_full_health_check(self, force: bool = False):
+        """Perform all health checks; force re-reads SMART data even if recent"""
         checks = [
-            (7, "windows_update", self.check_windows_update_health),
-            (14, "security", self.check_security_health),
-            (21, "system_files", self.check_system_files_quick),
-            (28, "disk_health", self.check_disk_health),
-            (35, "disk_integrity", self.check_disk_integrity),
-            (42, "memory", self.check_memory_health),
-            (49, "storage_space", self.check_storage_space),
-            (56, "temperatures", self.check_temperatures),
-            (63, "critical_errors", self.check_critical_errors),
-            (70, "services", self.check_essential_services),
-            (77, "drivers", self.check_driver_health),
-            (84, "boot_time", self.check_boot_performance),
-            (91, "reliability", self.check_reliability_score),
-            (98, "unexpected_reboots", self.check_unexpected_reboots),
+            ("windows_update", self.check_windows_update_health),
+            ("security", self.check_security_health),
+            ("system_files", self.check_system_files_quick),
+            ("disk_health", lambda: self.check_disk_health(force)),
+            ("disk_integrity", self.check_disk_integrity),
+            ("memory", self.check_memory_health),
+            ("storage_space", self.check_storage_space),
+            ("temperatures", self.check_temperatures),
+            ("critical_errors", self.check_critical_errors),
+            ("services", self.check_essential_services),
+            ("drivers", self.check_driver_health),
+            ("boot_time", self.check_boot_performance),
+            ("reliability", self.check_reliability_score),
+            ("unexpected_reboots", self.check_unexpected_reboots),
         ]
         
-        for progress, key, check_func in checks:
-            self.root.after(0, lambda p=progress, k=key: (
-                self.update_task_status(f"Health: Checking {self.health_items[k]['title']}...", p)
-            ))
-            try:
-                check_func()
-            except Exception as e:
-                self.root.after(0, lambda k=key, e=e: (
-                    self.update_health_card(k, 'error', f'Error: {str(e)[:30]}'),
-                    self.append_health_output(f"[ERROR] {self.health_items[k]['title']}: {e}\n")
+        # Each check is an independent read-only PowerShell query, so several
+        # run at once and the total time approaches that of the slowest ones
+        with ThreadPoolExecutor(max_workers=self.HEALTH_CHECK_WORKERS) as executor:
+            futures = {executor.submit(check_func): key for key, check_func in checks}
+            for done, future in enumerate(as_completed(futures), 1):
+                key = futures[future]
+                progress = done * 98 // len(checks)
+                self.root.after(0, lambda p=progress, k=key: (
+                    self.update_task_status(f"Health: Checked {self.health_items[k]['title']}", p)
                 ))
+                try:
+                    future.result()
+                except Exception as e:
+                    self.root.after(0, lambda k=key, e=e: (
+                        self.update_health_card(k, 'error', f'Error: {str(e)[:30]}'),
+                        self.append_health_output(f"[ERROR] {self.health_items[k]['title']}: {e}\n")
+                    ))
         
         # Summary with health score
         self.root.after(0, self.show_health_summary)
         self.root.after(0, lambda: self.quick_health_btn.config(state=tk.NORMAL))
+        self.root.after(0, lambda: self.smart_reread_btn.config(state=tk.NORMAL))
         self.root.after(0, lambda: self.set_status("Health check complete", "success"))
         self.root.after(0, lambda: self.update_task_status("Idle", 100))
     
@@ -3241,8 +3313,8 @@ class DriverUpdaterApp:
         except:
             self.root.after(0, lambda: self.update_health_card('system_files', 'unknown', 'Run SFC to check'))
     
-    def check_disk_health(self):
-        """Check disk SMART health"""
+    def check_disk_health(self, force: bool = False):
+        """Check disk SMART health (a reading is reused for SMART_POLL_INTERVAL unless forced)"""
         command = """
         $result = @{ Status = 'good'; Details = @(); Disks = @() }
         
@@ -3283,26 +3355,37 @@ class DriverUpdaterApp:
         $result | ConvertTo-Json -Depth 3
         """
         
-        output = self.scanner.run_powershell(command)
+        # SMART state rarely changes and querying it can wake idle drives, so a
+        # recent reading is reused; Shift+click on the check button forces one
+        reading = self._smart_reading
+        if force or reading is None or time.monotonic() - reading[0] >= self.SMART_POLL_INTERVAL:
+            reading = None
+            output = self.scanner.run_powershell(command)
         try:
-            data = json.loads(output)
+            data = json.loads(output) if reading is None else reading[1]
             status = data.get('Status', 'good')
             disks = data.get('Disks', [])
             details = data.get('Details', [])
             
             if disks:
-                disk_summary = f"{len(disks)} disk(s) healthy"
-                for d in disks:
-                    if d.get('Status') != 'Healthy':
-                        disk_summary = f"{d.get('Name')}: {d.get('Status')}"
-                        break
-                text = disk_summary
+                if reading is None:
+                    self._smart_reading = (time.monotonic(), data)
+                
+                # Stop at the first unhealthy disk; it is the one worth reporting
+                unhealthy = next((d for d in disks if d.get('Status') != 'Healthy'), None)
+                if unhealthy is None:
+                    text = f"{len(disks)} disk(s) healthy"
+                else:
+                    text = f"{unhealthy.get('Name')}: {unhealthy.get('Status')}"
             else:
                 text = "Could not query"
             
             self.root.after(0, lambda: self.update_health_card('disk_health', status, text))
+            age_note = ""
+            if reading is not None:
+                age_note = f" (reading from {int((time.monotonic() - reading[0]) // 60)} min ago)"
             self.root.after(0, lambda: self.append_health_output(
-                f"[{'✓' if status == 'good' else '⚠'}] Disk Health: {text}\n",
+                f"[{'✓' if status == 'good' else '⚠'}] Disk Health: {text}{age_note}\n",
                 'good' if status == 'good' else 'warning'))
         except:
             self.root.after(0, lambda: self.update_health_card('disk_health', 'unknown', 'Check failed'))
@@ -4030,8 +4113,7 @@ class DriverUpdaterApp:
     
     def append_health_output(self, text, tag=None):
         """Append text to health output with optional tag"""
-        self.health_output.insert(tk.END, text, tag)
-        self.health_output.see(tk.END)
+        self._queue_output(self.health_output, text, tag)
     
     def run_sfc_scan(self):
         """Run System File Checker"""
@@ -4050,51 +4132,32 @@ class DriverUpdaterApp:
             self.set_status("Running SFC scan...", "busy")
             self.root.after(0, lambda: self.update_task_status("SFC: Initializing...", 0))
             
-            self.health_output.delete(1.0, tk.END)
+            self._clear_output(self.health_output)
             self.health_output.insert(tk.END, "Starting SFC scan...\n")
             self.health_output.insert(tk.END, "This may take 10-30 minutes. Please wait...\n\n")
             
-            thread = threading.Thread(target=self.perform_sfc_scan)
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_sfc_scan, long_running=True)
     
     def perform_sfc_scan(self):
         """Perform SFC scan in background"""
+        def on_line(line):
+            self.append_health_output(line + "\n")
+            # Parse percentage from SFC output (e.g., "Verification 45% complete")
+            match = re.search(r'(\d+)\s*%', line)
+            if match:
+                pct = int(match.group(1))
+                stage = "Verifying" if "verif" in line.lower() else "Repairing"
+                self._post_task_status(f"SFC: {stage}...", pct)
+        
         try:
-            process = subprocess.Popen(
-                ['sfc', '/scannow'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            if process.stdout:
-                for line in process.stdout:
-                    line = line.strip()
-                    if line:
-                        self.root.after(0, lambda l=line: self.append_health_output(l + "\n"))
-                        # Parse percentage from SFC output
-                        if '%' in line:
-                            try:
-                                # Extract percentage (e.g., "Verification 45% complete")
-                                import re
-                                match = re.search(r'(\d+)\s*%', line)
-                                if match:
-                                    pct = int(match.group(1))
-                                    stage = "Verifying" if "verif" in line.lower() else "Repairing"
-                                    self.root.after(0, lambda p=pct, s=stage: self.update_task_status(f"SFC: {s}...", p))
-                            except:
-                                pass
-            
-            process.wait()
+            self._stream_process(['sfc', '/scannow'], on_line)
             
             self.root.after(0, lambda: self.update_task_status("SFC: Complete", 100))
-            self.root.after(0, lambda: self.append_health_output("\n--- SFC Scan Complete ---\n"))
+            self.append_health_output("\n--- SFC Scan Complete ---\n")
             self.log_message("SFC scan completed")
             
         except Exception as e:
-            self.root.after(0, lambda: self.append_health_output(f"\nError: {e}\n"))
+            self.append_health_output(f"\nError: {e}\n")
             self.log_message(f"SFC scan error: {e}")
         finally:
             self.root.after(0, self.health_scan_complete)
@@ -4111,47 +4174,35 @@ class DriverUpdaterApp:
         self.set_status("Running DISM health check...", "busy")
         self.root.after(0, lambda: self.update_task_status("DISM: Initializing...", 0))
         
-        self.health_output.delete(1.0, tk.END)
+        self._clear_output(self.health_output)
         self.health_output.insert(tk.END, "Starting DISM CheckHealth...\n\n")
         
-        thread = threading.Thread(target=self.perform_dism_health)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_dism_health, long_running=True)
     
     def perform_dism_health(self):
         """Perform DISM health check in background"""
         try:
             # First run CheckHealth (quick)
             self.root.after(0, lambda: self.update_task_status("DISM: CheckHealth...", 10))
-            self.root.after(0, lambda: self.append_health_output("Running DISM /CheckHealth...\n"))
+            self.append_health_output("Running DISM /CheckHealth...\n")
             
-            result = subprocess.run(
-                ['dism', '/Online', '/Cleanup-Image', '/CheckHealth'],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            self.root.after(0, lambda: self.append_health_output(result.stdout))
+            self._stream_process(['dism', '/Online', '/Cleanup-Image', '/CheckHealth'],
+                                 lambda line: self.append_health_output(line + "\n"))
             self.root.after(0, lambda: self.update_task_status("DISM: CheckHealth complete", 30))
             
             # Then run ScanHealth (thorough)
             self.root.after(0, lambda: self.update_task_status("DISM: ScanHealth...", 40))
-            self.root.after(0, lambda: self.append_health_output("\nRunning DISM /ScanHealth (this may take a few minutes)...\n"))
+            self.append_health_output("\nRunning DISM /ScanHealth (this may take a few minutes)...\n")
             
-            result = subprocess.run(
-                ['dism', '/Online', '/Cleanup-Image', '/ScanHealth'],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            self.root.after(0, lambda: self.append_health_output(result.stdout))
+            self._stream_process(['dism', '/Online', '/Cleanup-Image', '/ScanHealth'],
+                                 lambda line: self.append_health_output(line + "\n"))
             
             self.root.after(0, lambda: self.update_task_status("DISM: Complete", 100))
-            self.root.after(0, lambda: self.append_health_output("\n--- DISM Health Check Complete ---\n"))
+            self.append_health_output("\n--- DISM Health Check Complete ---\n")
             self.log_message("DISM health check completed")
             
         except Exception as e:
-            self.root.after(0, lambda: self.append_health_output(f"\nError: {e}\n"))
+            self.append_health_output(f"\nError: {e}\n")
             self.log_message(f"DISM error: {e}")
         finally:
             self.root.after(0, self.health_scan_complete)
@@ -4174,50 +4225,32 @@ class DriverUpdaterApp:
             self.set_status("Running DISM RestoreHealth...", "busy")
             self.root.after(0, lambda: self.update_task_status("DISM: RestoreHealth starting...", 0))
             
-            self.health_output.delete(1.0, tk.END)
+            self._clear_output(self.health_output)
             self.health_output.insert(tk.END, "Starting DISM RestoreHealth...\n")
             self.health_output.insert(tk.END, "This may take 15-30 minutes. Please wait...\n\n")
             
-            thread = threading.Thread(target=self.perform_dism_restore)
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_dism_restore, long_running=True)
     
     def perform_dism_restore(self):
         """Perform DISM RestoreHealth in background"""
+        def on_line(line):
+            self.append_health_output(line + "\n")
+            # Parse percentage from DISM output
+            match = re.search(r'(\d+(\.\d+)?)\s*%', line)
+            if match:
+                pct = int(float(match.group(1)))
+                self._post_task_status("DISM: RestoreHealth...", pct)
+        
         try:
-            import re
-            process = subprocess.Popen(
-                ['dism', '/Online', '/Cleanup-Image', '/RestoreHealth'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            if process.stdout:
-                for line in process.stdout:
-                    line = line.strip()
-                    if line:
-                        self.root.after(0, lambda l=line: self.append_health_output(l + "\n"))
-                        # Parse percentage from DISM output
-                        if '%' in line:
-                            try:
-                                match = re.search(r'(\d+(\.\d+)?)\s*%', line)
-                                if match:
-                                    pct = int(float(match.group(1)))
-                                    self.root.after(0, lambda p=pct: self.update_task_status(f"DISM: RestoreHealth...", p))
-                            except:
-                                pass
-            
-            process.wait()
+            self._stream_process(['dism', '/Online', '/Cleanup-Image', '/RestoreHealth'], on_line)
             
             self.root.after(0, lambda: self.update_task_status("DISM: RestoreHealth complete", 100))
-            self.root.after(0, lambda: self.append_health_output("\n--- DISM RestoreHealth Complete ---\n"))
-            self.root.after(0, lambda: self.append_health_output("\nIf repairs were made, run SFC scan next.\n"))
+            self.append_health_output("\n--- DISM RestoreHealth Complete ---\n")
+            self.append_health_output("\nIf repairs were made, run SFC scan next.\n")
             self.log_message("DISM RestoreHealth completed")
             
         except Exception as e:
-            self.root.after(0, lambda: self.append_health_output(f"\nError: {e}\n"))
+            self.append_health_output(f"\nError: {e}\n")
             self.log_message(f"DISM RestoreHealth error: {e}")
         finally:
             self.root.after(0, self.health_scan_complete)
@@ -4244,7 +4277,7 @@ class DriverUpdaterApp:
                     creationflags=subprocess.CREATE_NO_WINDOW
                 )
                 
-                self.health_output.delete(1.0, tk.END)
+                self._clear_output(self.health_output)
                 self.health_output.insert(tk.END, "Check Disk Scheduled\n\n")
                 self.health_output.insert(tk.END, result.stdout)
                 self.health_output.insert(tk.END, "\nDisk check will run on next restart.\n")
@@ -4258,14 +4291,11 @@ class DriverUpdaterApp:
                 messagebox.showerror("Error", f"Failed to schedule Check Disk:\n{e}")
                 self.log_message(f"Check Disk error: {e}")
     
-    def append_health_output(self, text):
-        """Append text to health output"""
-        self.health_output.insert(tk.END, text)
-        self.health_output.see(tk.END)
-        self.root.update_idletasks()
-    
     def update_task_status(self, task: str, percent: int = -1):
         """Update the bottom status bar with current task and percentage"""
+        # A direct update supersedes any streamed progress still waiting to flush
+        with self._output_lock:
+            self._pending_task_status = None
         self.task_label.config(text=task)
         if percent >= 0:
             self.progress.config(mode='determinate')
@@ -4294,12 +4324,102 @@ class DriverUpdaterApp:
         self.dism_btn.config(state=tk.NORMAL)
         self.dism_restore_btn.config(state=tk.NORMAL)
 
+    def _stream_process(self, cmd, on_line: Callable[[str], None], shell: bool = False) -> int:
+        """Run cmd, passing each non-empty output line to on_line as it arrives.
+        
+        Returns the exit code. Call from a worker thread; on_line runs there too.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            shell=shell,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        if process.stdout:
+            for line in process.stdout:
+                line = line.strip()
+                if line:
+                    on_line(line)
+        return process.wait()
+    
+    def run_bg(self, func: Callable, *args, long_running: bool = False, **kwargs):
+        """Run func on the shared worker pool.
+        
+        long_running jobs (minutes, e.g. SFC/DISM/CHKDSK) get their own thread
+        so they never hold up quick actions. Uncaught errors go to the log.
+        """
+        if long_running:
+            self._pool.submit_long(func, *args, **kwargs)
+        else:
+            self._pool.submit(func, *args, **kwargs)
+    
+    def _on_background_error(self, name: str, error: Exception):
+        """Log an exception that escaped a background task (any thread)"""
+        self.log_message(f"Background task {name} failed: {error}")
+
     def log_message(self, message: str):
-        """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue message for the log (safe to call from worker threads)"""
+        self._queue_output(self.log_text, f"[{datetime.now():%H:%M:%S}] {message}\n")
+    
+    def _queue_output(self, widget, text: str, tag: Optional[str] = None):
+        """Queue text for a ScrolledText (safe to call from worker threads).
+        
+        Pending text is written every OUTPUT_FLUSH_MS, so a burst of lines
+        costs one insert/see per widget instead of one per line.
+        """
+        with self._output_lock:
+            self._output_pending.append((widget, text, tag))
+            if self._output_flush_scheduled:
+                return
+            self._output_flush_scheduled = True
+        self.root.after(self.OUTPUT_FLUSH_MS, self._flush_output)
+    
+    def _post_task_status(self, task: str, percent: int = -1):
+        """Report streamed progress from a worker thread.
+        
+        Tools like SFC and DISM print a percentage on nearly every line; only
+        the latest value is kept and applied with the next output flush.
+        """
+        with self._output_lock:
+            self._pending_task_status = (task, percent)
+            if self._output_flush_scheduled:
+                return
+            self._output_flush_scheduled = True
+        self.root.after(self.OUTPUT_FLUSH_MS, self._flush_output)
+    
+    def _flush_output(self):
+        """Write all queued output, coalescing runs with the same widget and tag"""
+        with self._output_lock:
+            pending = list(self._output_pending)
+            self._output_pending.clear()
+            self._output_flush_scheduled = False
+            task_status = self._pending_task_status
+        
+        if task_status:
+            self.update_task_status(*task_status)
+        
+        touched = []
+        for (widget, tag), run in groupby(pending, key=lambda p: (p[0], p[2])):
+            widget.insert(tk.END, "".join(text for _, text, _ in run), tag)
+            if widget not in touched:
+                touched.append(widget)
+        
+        for widget in touched:
+            max_lines = self.LOG_MAX_LINES if widget is self.log_text else self.OUTPUT_MAX_LINES
+            line_count = int(widget.index("end-1c").split(".")[0])
+            if line_count > max_lines:
+                widget.delete("1.0", f"{line_count - max_lines + 1}.0")
+            widget.see(tk.END)
+    
+    def _clear_output(self, widget):
+        """Clear a ScrolledText, dropping any text still queued for it"""
+        with self._output_lock:
+            kept = [p for p in self._output_pending if p[0] is not widget]
+            self._output_pending.clear()
+            self._output_pending.extend(kept)
+        widget.delete(1.0, tk.END)
         
     def set_status(self, status: str, state: str = "normal"):
         """Update status label and indicator"""
@@ -4323,27 +4443,31 @@ class DriverUpdaterApp:
         self.set_status("Scanning...", "busy")
         self.update_task_status("Scanning system...", 0)
         
-        thread = threading.Thread(target=self.perform_scan)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_scan)
         
     def perform_scan(self):
         """Perform the actual driver scan"""
         try:
-            # Get system info
+            # The three queries are independent PowerShell calls, so start them
+            # together and publish each result as soon as it is ready
             self.root.after(0, lambda: self.update_task_status("Getting system info...", 10))
-            self.system_info = self.scanner.get_system_info()
-            self.root.after(0, self.update_system_info)
-            
-            # Scan installed drivers
-            self.root.after(0, lambda: self.update_task_status("Scanning drivers...", 40))
-            self.installed_drivers = self.scanner.scan_installed_drivers()
-            self.root.after(0, self.populate_drivers_tree)
-            
-            # Check for problem devices
-            self.root.after(0, lambda: self.update_task_status("Checking problem devices...", 80))
-            self.problem_devices = self.scanner.scan_problem_devices()
-            self.root.after(0, self.populate_problems_tree)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                system_future = executor.submit(self.scanner.get_system_info)
+                drivers_future = executor.submit(self.scanner.scan_installed_drivers)
+                problems_future = executor.submit(self.scanner.scan_problem_devices)
+                
+                self.system_info = system_future.result()
+                self.root.after(0, self.update_system_info)
+                
+                # Scan installed drivers
+                self.root.after(0, lambda: self.update_task_status("Scanning drivers...", 40))
+                self.installed_drivers = drivers_future.result()
+                self.root.after(0, self.populate_drivers_tree)
+                
+                # Check for problem devices
+                self.root.after(0, lambda: self.update_task_status("Checking problem devices...", 80))
+                self.problem_devices = problems_future.result()
+                self.root.after(0, self.populate_problems_tree)
             
             self.root.after(0, lambda: self.update_task_status("Scan complete", 100))
             
@@ -4365,9 +4489,7 @@ class DriverUpdaterApp:
         self.set_status("Checking Windows Update...", "busy")
         self.update_task_status("Checking Windows Update...", -1)
         
-        thread = threading.Thread(target=self.perform_online_check)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_online_check)
         
     def perform_online_check(self):
         """Perform online update check"""
@@ -4407,9 +4529,7 @@ class DriverUpdaterApp:
             self.progress.start()
             self.set_status("Installing updates...")
             
-            thread = threading.Thread(target=self.perform_install)
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_install, long_running=True)
             
     def perform_install(self):
         """Perform update installation"""
@@ -4441,90 +4561,80 @@ class DriverUpdaterApp:
         # Also update manufacturer tools tab
         self.update_manufacturer_tools_tab()
         
+    def _fill_tree(self, tree: ttk.Treeview, rows: List[Tuple[tuple, tuple]],
+                   iids: Optional[List[str]] = None):
+        """Replace a tree's rows with (values, tags) pairs, a slice at a time.
+        
+        Inserting hundreds of rows in one go stalls the event loop; filling
+        TREE_FILL_CHUNK rows per after() slice keeps the window responsive
+        and shows the first page immediately. Pass iids when callers need to
+        map rows back to their data before the fill has finished.
+        """
+        tree.delete(*tree.get_children())
+        token = object()
+        self._tree_fills[tree] = token
+        
+        def fill_slice(start=0):
+            if self._tree_fills.get(tree) is not token:
+                return  # Superseded by a newer fill
+            end = start + self.TREE_FILL_CHUNK
+            for i, (values, tags) in enumerate(rows[start:end], start):
+                tree.insert('', tk.END, iid=iids[i] if iids else None, values=values, tags=tags)
+            if end < len(rows):
+                self.root.after(1, fill_slice, end)
+            else:
+                del self._tree_fills[tree]
+        
+        fill_slice()
+    
     def populate_drivers_tree(self):
         """Populate the drivers treeview"""
-        # Clear existing items
-        for item in self.drivers_tree.get_children():
-            self.drivers_tree.delete(item)
-        
-        # Configure alternating row tags
-        self.drivers_tree.tag_configure('oddrow', background=self.COLORS['bg_glass'])
-        self.drivers_tree.tag_configure('evenrow', background=self.COLORS['bg_row_alt'])
-            
         # Add drivers with alternating colors
-        for idx, driver in enumerate(self.installed_drivers):
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            self.drivers_tree.insert('', tk.END, values=(
-                driver.device_name,
-                driver.manufacturer,
-                driver.driver_version,
-                driver.driver_date,
-                driver.status
-            ), tags=(tag,))
+        self._fill_tree(self.drivers_tree, [
+            ((driver.device_name,
+              driver.manufacturer,
+              driver.driver_version,
+              driver.driver_date,
+              driver.status), (self.ROW_TAGS[idx & 1],))
+            for idx, driver in enumerate(self.installed_drivers)
+        ])
             
     def populate_updates_tree(self):
         """Populate the updates treeview"""
-        for item in self.updates_tree.get_children():
-            self.updates_tree.delete(item)
-        
-        # Configure alternating row tags
-        self.updates_tree.tag_configure('oddrow', background=self.COLORS['bg_glass'])
-        self.updates_tree.tag_configure('evenrow', background=self.COLORS['bg_row_alt'])
-        
-        # Store update objects for later reference
-        self.update_items = {}
-        
-        for idx, update in enumerate(self.available_updates):
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            item_id = self.updates_tree.insert('', tk.END, values=(
-                '☐',  # Unchecked checkbox
-                update.get('title', ''),
-                update.get('manufacturer', ''),
-                update.get('date', ''),
-                '⟳' if update.get('reboot_required') else ''
-            ), tags=(tag,))
-            self.update_items[item_id] = update
-        
-        # Bind click to toggle selection
-        self.updates_tree.bind('<ButtonRelease-1>', self.on_update_click)
+        # Store update objects for later reference, keyed by row iid
+        iids = [f"update{idx}" for idx in range(len(self.available_updates))]
+        self.update_items = dict(zip(iids, self.available_updates))
+        
+        self._fill_tree(self.updates_tree, [
+            (('☐',  # Unchecked checkbox
+              update.get('title', ''),
+              update.get('manufacturer', ''),
+              update.get('date', ''),
+              '⟳' if update.get('reboot_required') else ''), (self.ROW_TAGS[idx & 1],))
+            for idx, update in enumerate(self.available_updates)
+        ], iids=iids)
             
     def populate_problems_tree(self):
         """Populate the problems treeview"""
-        for item in self.problems_tree.get_children():
-            self.problems_tree.delete(item)
-        
-        # Configure alternating row tags
-        self.problems_tree.tag_configure('oddrow', background=self.COLORS['bg_glass'])
-        self.problems_tree.tag_configure('evenrow', background=self.COLORS['bg_row_alt'])
-            
-        for idx, problem in enumerate(self.problem_devices):
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            self.problems_tree.insert('', tk.END, values=(
-                problem.get('name', ''),
-                problem.get('status', ''),
-                problem.get('error_code', ''),
-                problem.get('device_id', '')
-            ), tags=(tag,))
+        self._fill_tree(self.problems_tree, [
+            ((problem.get('name', ''),
+              problem.get('status', ''),
+              problem.get('error_code', ''),
+              problem.get('device_id', '')), (self.ROW_TAGS[idx & 1],))
+            for idx, problem in enumerate(self.problem_devices)
+        ])
     
     def populate_online_tree(self):
         """Populate the online drivers treeview"""
-        for item in self.online_tree.get_children():
-            self.online_tree.delete(item)
-        
-        # Configure alternating row tags
-        self.online_tree.tag_configure('oddrow', background=self.COLORS['bg_glass'])
-        self.online_tree.tag_configure('evenrow', background=self.COLORS['bg_row_alt'])
-        
+        rows = []
         for idx, driver_info in enumerate(self.online_drivers):
             online = driver_info.get('online_info')
             if online:
-                tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-                self.online_tree.insert('', tk.END, values=(
-                    driver_info.get('device_name', ''),
-                    driver_info.get('current_version', ''),
-                    online.source,
-                    online.description
-                ), tags=(tag, online.download_url))
+                rows.append(((driver_info.get('device_name', ''),
+                              driver_info.get('current_version', ''),
+                              online.source,
+                              online.description), (self.ROW_TAGS[idx & 1], online.download_url)))
+        self._fill_tree(self.online_tree, rows)
     
     def on_update_click(self, event):
         """Handle click on update item to toggle checkbox"""
@@ -4597,9 +4707,7 @@ class DriverUpdaterApp:
             self.progress.start()
             self.set_status(f"Installing {len(selected)} update(s)...")
             
-            thread = threading.Thread(target=lambda: self.perform_download_install(selected))
-            thread.daemon = True
-            thread.start()
+            self.run_bg(self.perform_download_install, selected, long_running=True)
     
     def perform_download_install(self, updates):
         """Perform the download and installation of selected updates"""
@@ -4664,9 +4772,7 @@ class DriverUpdaterApp:
         self.progress.start()
         self.set_status("Checking vendor driver sources...")
         
-        thread = threading.Thread(target=self.perform_vendor_check)
-        thread.daemon = True
-        thread.start()
+        self.run_bg(self.perform_vendor_check)
     
     def perform_vendor_check(self):
         """Perform vendor driver check in background"""
@@ -4860,7 +4966,8 @@ class DriverUpdaterApp:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
+                # One large buffer so the many small writes below hit the disk once
+                with open(filename, 'w', buffering=1 << 20, encoding='utf-8') as f:
                     f.write("=" * 60 + "\n")
                     f.write("DRIVER UPDATE REPORT\n")
                     f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
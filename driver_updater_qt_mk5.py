@@ -3,7 +3,7 @@ Windows Health Checker Pro - MK5
 Refined professional UI with proper visual polish
 
 Performance optimizations:
-- QThread workers for blocking operations (hardware/startup scans)
+- Shared QThreadPool workers for blocking operations (hardware/startup scans)
 - Cached static data (motherboard, BIOS)
 - Optimized real-time graphs (no subprocess for CPU/RAM)
 - Batch UI updates to reduce repaints
@@ -15,20 +15,33 @@ import json
 import os
 import subprocess
 import ctypes
+import math
+import random
+import weakref
 from ctypes import wintypes
+from collections import defaultdict, deque
+from concurrent.futures import Future
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QScrollArea, QProgressBar,
     QStackedWidget, QGraphicsDropShadowEffect, QGraphicsOpacityEffect,
-    QSizePolicy, QDialog, QGridLayout, QTextEdit, QSpacerItem
+    QSizePolicy, QDialog, QGridLayout, QTextEdit, QSpacerItem,
+    QComboBox, QFileDialog, QMessageBox
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QPropertyAnimation, QEasingCurve, pyqtSignal, QThread, QObject,
+    QThreadPool, QRunnable, QEvent, QPointF, QRect, QRectF
+)
+from PyQt6.QtGui import (
+    QFont, QColor, QPainter, QPen, QBrush, QFontDatabase, QPainterPath, QIcon, QPixmap, QPolygonF,
+    QStaticText, QTransform
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, QPropertyAnimation, QEasingCurve, pyqtSignal, QThread, QObject
-from PyQt6.QtGui import QFont, QColor, QPainter, QPen, QBrush, QFontDatabase, QPainterPath, QIcon, QPixmap
 
 from driver_backend import (
     DriverScanner, OnlineDriverChecker, ManufacturerSupport,
@@ -104,7 +117,6 @@ class AnimatedStackedWidget(QStackedWidget):
 def get_app_icon_from_registry(app_name: str) -> QPixmap | None:
     """Try to extract application icon from Windows registry install location"""
     import winreg
-    import os
     
     # Common registry paths for installed apps
     reg_paths = [
@@ -503,7 +515,6 @@ QMainWindow {{
 }}
 
 QWidget {{
-    background: transparent;
     color: {Theme.TEXT_PRIMARY};
 }}
 
@@ -512,11 +523,69 @@ QLabel {{
     color: {Theme.TEXT_PRIMARY};
 }}
 
+/* Page titles and the overview's section headings */
+QLabel#pageTitle {{
+    font-size: 28px;
+    font-weight: 600;
+}}
+
+QLabel#pageSection {{
+    font-size: 16px;
+    font-weight: 600;
+    margin-top: 8px;
+}}
+
+/* List section headings, built in loops on the result pages; matched here
+   by object name instead of each heading parsing its own stylesheet */
+QLabel#categoryHeader, QLabel#sectionHeader {{
+    font-size: 14px;
+    font-weight: 600;
+    padding: 8px 0;
+}}
+
+QLabel#categoryHeader {{
+    padding: 12px 0 4px 0;
+}}
+
+/* Overview status cards (GlassCard); the icon and subtitle switch colour
+   through set_style_state as the card's status changes */
+QLabel#glassCardIcon, QLabel#glassCardChevron {{
+    color: {Theme.TEXT_TERTIARY};
+    font-size: 16px;
+}}
+
+QLabel#glassCardIcon[state="pending"] {{ font-weight: bold; }}
+QLabel#glassCardIcon[state="check"] {{ color: {Theme.GLOW_SUCCESS}; font-weight: bold; }}
+QLabel#glassCardIcon[state="warning"] {{ color: {Theme.GLOW_WARNING}; font-weight: bold; }}
+QLabel#glassCardIcon[state="error"] {{ color: {Theme.GLOW_ERROR}; font-weight: bold; }}
+QLabel#glassCardIcon[state="info"] {{ color: {Theme.GLOW_INFO}; font-weight: bold; }}
+QLabel#glassCardIcon[state="running"] {{ color: {Theme.GLOW_RUNNING}; font-weight: bold; }}
+
+QLabel#glassCardTitle {{
+    font-size: 13px;
+    font-weight: 600;
+}}
+
+QLabel#glassCardSubtitle {{
+    color: {Theme.TEXT_TERTIARY};
+    font-size: 11px;
+}}
+
+QLabel#glassCardSubtitle[state="set"] {{
+    color: {Theme.TEXT_SECONDARY};
+}}
+
 QScrollArea {{
     border: none;
     background: transparent;
 }}
 
+/* Scroll areas auto-fill their viewport and content widget; keep them
+   see-through without a universal background rule on every QWidget */
+#qt_scrollarea_viewport, QScrollArea > QWidget > QWidget {{
+    background: transparent;
+}}
+
 QScrollBar:vertical {{
     background: {Theme.SURFACE_01DP};
     width: 10px;
@@ -613,9 +682,169 @@ QPushButton:disabled {{
 """
 
 
+# =============================================================================
+# SHARED STAT STYLES - built once rather than formatted on every _create_stat
+# =============================================================================
+
+STAT_LABEL_STYLE = f"""
+    background: transparent;
+    color: {Theme.TEXT_TERTIARY};
+    font-size: 11px;
+    font-weight: 500;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+"""
+
+
+@lru_cache(maxsize=None)
+def stat_value_style(color: str, font_size: int = 24) -> str:
+    """Stylesheet for a stat value label, cached per color/size"""
+    return f"""
+    background: transparent;
+    color: {color};
+    font-size: {font_size}px;
+    font-weight: 700;
+"""
+
+
+def set_style_state(widget: QWidget, state: str):
+    """Switch a widget between [state="..."] rules of its own stylesheet.
+    
+    Toggling a dynamic property and repolishing reuses the already parsed
+    stylesheet, where setStyleSheet would reparse it and restyle every child.
+    """
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+@lru_cache(maxsize=None)
+def tab_button_style(accent: str) -> str:
+    """Stylesheet for page tab buttons, cached per accent color.
+    
+    Holds both looks; the active tab is picked out with set_style_state
+    so switching tabs doesn't reparse a stylesheet per button.
+    """
+    return f"""
+    QPushButton {{
+        background: transparent;
+        color: {Theme.TEXT_SECONDARY};
+        border: none;
+        border-bottom: 2px solid transparent;
+        padding: 12px 24px;
+        font-size: 13px;
+        font-weight: 500;
+    }}
+    QPushButton:hover {{
+        color: {Theme.TEXT_PRIMARY};
+        background: {Theme.BG_CARD};
+    }}
+    QPushButton[state="active"] {{
+        background: {Theme.BG_CARD};
+        color: {Theme.TEXT_PRIMARY};
+        border-bottom: 2px solid {accent};
+        font-weight: 600;
+    }}
+"""
+
+
+@lru_cache(maxsize=None)
+def filter_button_style(accent: str, accent_hover: str) -> str:
+    """Stylesheet for filter pill buttons, cached per accent color.
+    
+    Like tab_button_style, the selected filter is marked with
+    set_style_state(btn, "active") instead of a second stylesheet.
+    """
+    return f"""
+    QPushButton {{
+        background: {Theme.BG_CARD};
+        color: {Theme.TEXT_SECONDARY};
+        border: 1px solid {Theme.BORDER};
+        padding: 10px 24px;
+        border-radius: {Theme.RADIUS_SM}px;
+        font-size: 13px;
+        font-weight: 500;
+    }}
+    QPushButton:hover {{
+        background: {Theme.BG_CARD_HOVER};
+        color: {Theme.TEXT_PRIMARY};
+    }}
+    QPushButton[state="active"] {{
+        background: {accent};
+        color: white;
+        border: none;
+        font-weight: 600;
+    }}
+    QPushButton[state="active"]:hover {{
+        background: {accent_hover};
+    }}
+"""
+
+
 # =============================================================================
 # BACKGROUND WORKER CLASSES (For non-blocking operations)
 # =============================================================================
+# Result signals are declared as `object`: a dict/list signature makes PyQt
+# convert the whole payload to QVariantMap/QVariantList and back on every
+# queued emit (and drops non-string dict keys), while `object` just passes
+# the Python reference across threads.
+#
+# One-shot workers run on the shared QThreadPool via start_worker() rather
+# than each getting its own QThread. The worker object itself stays on the
+# GUI thread, so its finished signal reaches GUI slots as a queued call.
+
+class WorkerTask(QRunnable):
+    """QRunnable that calls a worker's run() on a pool thread"""
+    
+    def __init__(self, worker: QObject):
+        super().__init__()
+        self.worker = worker
+    
+    def run(self):
+        self.worker.run()  # type: ignore[attr-defined]
+
+
+# Workers mostly wait on PowerShell/WMI rather than the CPU, so the pool is
+# sized for a full scan's checks to all run at once even on 2-4 core machines
+MIN_WORKER_THREADS = 8
+
+
+def start_worker(worker: QObject):
+    """Run a one-shot worker on the shared thread pool"""
+    QThreadPool.globalInstance().start(WorkerTask(worker))
+
+
+class _CallTask:
+    """Runs func(*args) into a Future; the run() target for WorkerTask"""
+    
+    def __init__(self, future: Future, func, args):
+        self.future = future
+        self.func = func
+        self.args = args
+    
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            self.future.set_result(self.func(*self.args))
+        except BaseException as e:
+            self.future.set_exception(e)
+
+
+def submit_to_pool(func, *args) -> Future:
+    """Run func(*args) on the shared thread pool and return a Future for its result.
+    
+    For use from a worker that wants to overlap two blocking calls. When no
+    pool thread is free the call runs inline, so waiting on it can't deadlock.
+    """
+    future = Future()
+    task = _CallTask(future, func, args)
+    if not QThreadPool.globalInstance().tryStart(WorkerTask(task)):  # type: ignore[arg-type]
+        task.run()
+    return future
+
 
 class HardwareScanWorker(QObject):
     """Worker to run hardware scanning in background thread"""
@@ -638,7 +867,7 @@ class HardwareScanWorker(QObject):
 
 class StartupScanWorker(QObject):
     """Worker to run startup scanning in background thread"""
-    finished = pyqtSignal(list)   # Emits list of startup items
+    finished = pyqtSignal(object)  # Emits list of startup items
     error = pyqtSignal(str)       # Emits error message
     
     def run(self):
@@ -668,9 +897,19 @@ class StartupScanWorker(QObject):
             self.finished.emit([])
 
 
+class StartupSummaryWorker(QObject):
+    """Worker to build the dashboard startup summary in background thread"""
+    finished = pyqtSignal(object)  # Emits startup summary dict
+    
+    def run(self):
+        """Execute the startup summary"""
+        # get_startup_data falls back to placeholder data on any scanner error
+        self.finished.emit(get_startup_data())
+
+
 class WindowsUpdateWorker(QObject):
     """Worker to check Windows Update status in background thread"""
-    finished = pyqtSignal(dict)   # Emits update info dict
+    finished = pyqtSignal(object)  # Emits update info dict
     
     def __init__(self, health_checker):
         super().__init__()
@@ -687,7 +926,7 @@ class WindowsUpdateWorker(QObject):
 
 class StorageCheckWorker(QObject):
     """Worker to check storage health in background thread"""
-    finished = pyqtSignal(list)   # Emits volume info list
+    finished = pyqtSignal(object)  # Emits volume info list
     
     def __init__(self, health_checker):
         super().__init__()
@@ -704,7 +943,7 @@ class StorageCheckWorker(QObject):
 
 class SecurityCheckWorker(QObject):
     """Worker to check Windows Defender status in background thread"""
-    finished = pyqtSignal(dict)   # Emits defender status dict
+    finished = pyqtSignal(object)  # Emits defender status dict
     
     def __init__(self, health_checker):
         super().__init__()
@@ -721,13 +960,11 @@ class SecurityCheckWorker(QObject):
 
 class EventScanWorker(QObject):
     """Worker to scan event logs in background thread"""
-    finished = pyqtSignal(dict)   # Emits event data dict
+    finished = pyqtSignal(object)  # Emits event data dict
     
     def run(self):
         """Execute the event log scan"""
         try:
-            import subprocess
-            import json
             cmd = '''
             $output = @{
                 ErrorCount = 0
@@ -795,13 +1032,11 @@ class EventScanWorker(QObject):
 
 class HardwareMemoryWorker(QObject):
     """Worker to check hardware/memory info in background thread"""
-    finished = pyqtSignal(dict)   # Emits hardware data dict
+    finished = pyqtSignal(object)  # Emits hardware data dict
     
     def run(self):
         """Execute the hardware check"""
         try:
-            import subprocess
-            import json
             cmd = '''
             $os = Get-CimInstance Win32_OperatingSystem
             $mem = @{
@@ -956,6 +1191,21 @@ class MetricsCollector(QObject):
             self.start()
 
 
+# =============================================================================
+# SHARED FONTS - QFont needs a QGuiApplication, so build lazily and reuse
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def ui_font(size: int, weight: QFont.Weight = QFont.Weight.Normal,
+            family: str = "Segoe UI") -> QFont:
+    """Shared QFont instance for a family/size/weight.
+    
+    Paint handlers call this every frame; caching avoids a font database
+    lookup per call. Callers must not modify the returned font.
+    """
+    return QFont(family, size, weight)
+
+
 # =============================================================================
 # CUSTOM ICON PAINTER (No external dependencies)
 # =============================================================================
@@ -1007,6 +1257,72 @@ class IconPainter:
         # Draw X
         painter.drawLine(int(cx - size), int(cy - size), int(cx + size), int(cy + size))
         painter.drawLine(int(cx + size), int(cy - size), int(cx - size), int(cy + size))
+    
+    @staticmethod
+    def draw_warning_triangle(painter: QPainter, rect, color):
+        """Exclamation inside a triangle outline, for warnings drawn without a status circle"""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        r = QRectF(rect)
+        pen = QPen(QColor(color))
+        pen.setWidthF(max(1.5, min(r.width(), r.height()) / 12))
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        
+        inset = pen.widthF()
+        r = r.adjusted(inset, inset, -inset, -inset)
+        cx, h = r.center().x(), r.height()
+        painter.drawPolygon(QPolygonF([
+            QPointF(cx, r.top()), QPointF(r.right(), r.bottom()), QPointF(r.left(), r.bottom())
+        ]))
+        
+        # Draw exclamation
+        painter.drawLine(QPointF(cx, r.top() + h * 0.38), QPointF(cx, r.top() + h * 0.66))
+        painter.drawPoint(QPointF(cx, r.top() + h * 0.83))
+    
+    @staticmethod
+    def draw_dot(painter: QPainter, rect, color):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawEllipse(rect)
+
+
+def status_pixmap(status: str, color: str, size: int = 20) -> QPixmap:
+    """Pre-rendered check/warning/error/dot glyph, drawn once per status/color/size.
+    
+    Used in place of emoji/dingbat text, which Qt has to resolve through the
+    font fallback chain and shape again on every repaint. Rendered at the
+    highest screen scale so it stays sharp on HiDPI displays.
+    """
+    return _status_pixmap(status, color, size, QApplication.instance().devicePixelRatio())  # type: ignore[union-attr]
+
+
+@lru_cache(maxsize=None)
+def _status_pixmap(status: str, color: str, size: int, dpr: float) -> QPixmap:
+    pixmap = QPixmap(round(size * dpr), round(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)  # Paint below in logical (size x size) units
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    draw = {
+        "check": IconPainter.draw_check,
+        "warning": IconPainter.draw_warning_triangle,
+        "error": IconPainter.draw_error,
+        "dot": IconPainter.draw_dot,
+    }[status]
+    draw(painter, QRect(0, 0, size, size), color)
+    painter.end()
+    return pixmap
+
+
+def status_icon_label(status: str, color: str, size: int = 20) -> QLabel:
+    """QLabel showing a cached status_pixmap"""
+    label = QLabel()
+    label.setPixmap(status_pixmap(status, color, size))
+    label.setFixedSize(size, size)
+    label.setStyleSheet("background: transparent;")
+    return label
 
 
 # =============================================================================
@@ -1024,6 +1340,21 @@ class StatusIcon(QWidget):
     - Glass-like appearance
     """
     
+    # One timer drives every pulsing icon. Lists can hold hundreds of rows,
+    # and a QTimer per icon meant hundreds of wakeups every 50 ms.
+    _glowing = weakref.WeakSet()
+    _glow_timer: QTimer | None = None
+    
+    # Status colors, built once rather than on every paint (glow colors are
+    # the shared GLOW_COLORS QColors)
+    _ICON_COLORS = {
+        "check": Theme.SUCCESS,
+        "warning": Theme.WARNING,
+        "error": Theme.ERROR,
+        "pending": Theme.TEXT_TERTIARY,
+        "info": Theme.INFO,
+    }
+    
     def __init__(self, status: str = "check", size: int = 20, parent=None):
         super().__init__(parent)
         self.status = status
@@ -1032,20 +1363,33 @@ class StatusIcon(QWidget):
         self._glow_direction = 1
         self._glow_enabled = True
         self.setFixedSize(size + 12, size + 12)  # Extra space for glow
-        
-        # Glow animation timer
-        self._glow_timer = QTimer(self)
-        self._glow_timer.timeout.connect(self._animate_glow)
         self._start_glow_animation()
     
+    @classmethod
+    def _tick_glows(cls):
+        """Advance the glow of every visible animated icon"""
+        for icon in list(cls._glowing):
+            try:
+                if icon.isVisible():
+                    icon._animate_glow()
+            except RuntimeError:  # Underlying C++ widget already deleted
+                cls._glowing.discard(icon)
+        if not cls._glowing and cls._glow_timer is not None:
+            cls._glow_timer.stop()
+    
     def _start_glow_animation(self):
         """Start the pulsing glow animation"""
         if self._glow_enabled and self.status in ("check", "error", "warning"):
-            self._glow_timer.start(50)  # 20fps for smooth pulse
+            StatusIcon._glowing.add(self)
+            if StatusIcon._glow_timer is None:
+                StatusIcon._glow_timer = QTimer()
+                StatusIcon._glow_timer.timeout.connect(StatusIcon._tick_glows)
+            if not StatusIcon._glow_timer.isActive():
+                StatusIcon._glow_timer.start(50)  # 20fps for smooth pulse
     
     def _stop_glow_animation(self):
         """Stop the glow animation"""
-        self._glow_timer.stop()
+        StatusIcon._glowing.discard(self)
     
     def _animate_glow(self):
         """Animate the glow intensity"""
@@ -1081,34 +1425,19 @@ class StatusIcon(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Get glow color based on status
-        glow_colors = {
-            "check": Theme.GLOW_SUCCESS,
-            "warning": Theme.GLOW_WARNING,
-            "error": Theme.GLOW_ERROR,
-            "info": Theme.GLOW_INFO,
-            "running": Theme.GLOW_RUNNING,
-            "pending": Theme.TEXT_TERTIARY,
-        }
-        glow_color = glow_colors.get(self.status, Theme.TEXT_TERTIARY)
-        
-        # Icon colors (slightly different from glow for depth)
-        icon_colors = {
-            "check": Theme.SUCCESS,
-            "warning": Theme.WARNING,
-            "error": Theme.ERROR,
-            "pending": Theme.TEXT_TERTIARY,
-            "running": Theme.ACCENT,
-            "info": Theme.INFO,
-        }
-        icon_color = icon_colors.get(self.status, Theme.TEXT_TERTIARY)
+        # Icon colors (slightly different from glow for depth); the accent
+        # can change at runtime so "running" is read from Theme each time
+        if self.status == "running":
+            icon_color = Theme.ACCENT
+        else:
+            icon_color = self._ICON_COLORS.get(self.status, Theme.TEXT_TERTIARY)
         
         center_x = self.width() // 2
         center_y = self.height() // 2
         
         # Draw glow effect for check, error, warning statuses
         if self._glow_enabled and self.status in ("check", "error", "warning"):
-            glow_qcolor = QColor(glow_color)
+            glow_qcolor = QColor(GLOW_COLORS[self.status])  # Copy; alpha changes below
             
             # Outer glow (larger, more transparent)
             for i in range(3, 0, -1):
@@ -1402,6 +1731,45 @@ class ModernListRow(QFrame):
     
     clicked = pyqtSignal()
     
+    # Lists can hold hundreds of rows, so the per-row stylesheets are built
+    # once here instead of being formatted again for every row
+    _ROW_STYLES = {
+        alternate: f"""
+            ModernListRow {{
+                background: {"#292930" if alternate else Theme.BG_CARD};
+                border: none;
+                border-radius: 0px;
+            }}
+            ModernListRow:hover {{
+                background: {Theme.BG_CARD_HOVER};
+            }}
+        """
+        for alternate in (False, True)
+    }
+    _BADGE_STYLES = {
+        status: f"""
+                background: {bg};
+                color: {color};
+                font-size: 11px;
+                font-weight: 600;
+                padding: 4px 10px;
+                border-radius: 4px;
+            """
+        for status, color, bg in (
+            ("ok", Theme.SUCCESS, Theme.SUCCESS_BG),
+            ("warning", Theme.WARNING, Theme.WARNING_BG),
+            ("error", Theme.ERROR, Theme.ERROR_BG),
+            ("info", Theme.ACCENT_LIGHT, Theme.INFO_BG),
+            (None, Theme.TEXT_SECONDARY, "transparent"),
+        )
+    }
+    _ICON_TYPES = {
+        "ok": "check",
+        "warning": "warning",
+        "error": "error",
+        "info": "info",
+    }
+    
     def __init__(self, 
                  title: str = "",
                  subtitle: str = "",
@@ -1415,6 +1783,8 @@ class ModernListRow(QFrame):
         self.status = status
         self._setup_ui(title, subtitle, status, status_text, show_chevron)
         self._apply_style()
+        # Rows keep their natural height so the list never re-distributes space
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
     
     def _setup_ui(self, title: str, subtitle: str, status: str, status_text: str, show_chevron: bool):
@@ -1423,13 +1793,7 @@ class ModernListRow(QFrame):
         self.main_layout.setSpacing(14)
         
         # Status icon
-        icon_type = {
-            "ok": "check",
-            "warning": "warning", 
-            "error": "error",
-            "info": "info"
-        }.get(status, "check")
-        self.status_icon = StatusIcon(icon_type, 18)
+        self.status_icon = StatusIcon(self._ICON_TYPES.get(status, "check"), 18)
         self.main_layout.addWidget(self.status_icon)
         
         # Content area
@@ -1459,26 +1823,7 @@ class ModernListRow(QFrame):
         # Status text/badge
         if status_text:
             self.status_badge = QLabel(status_text)
-            status_color = {
-                "ok": Theme.SUCCESS,
-                "warning": Theme.WARNING,
-                "error": Theme.ERROR,
-                "info": Theme.ACCENT_LIGHT
-            }.get(status, Theme.TEXT_SECONDARY)
-            status_bg = {
-                "ok": Theme.SUCCESS_BG,
-                "warning": Theme.WARNING_BG,
-                "error": Theme.ERROR_BG,
-                "info": Theme.INFO_BG
-            }.get(status, "transparent")
-            self.status_badge.setStyleSheet(f"""
-                background: {status_bg};
-                color: {status_color};
-                font-size: 11px;
-                font-weight: 600;
-                padding: 4px 10px;
-                border-radius: 4px;
-            """)
+            self.status_badge.setStyleSheet(self._BADGE_STYLES.get(status, self._BADGE_STYLES[None]))
             self.main_layout.addWidget(self.status_badge)
         
         # Chevron for clickable items
@@ -1492,20 +1837,18 @@ class ModernListRow(QFrame):
             """)
             self.main_layout.addWidget(chevron)
         
-        # Placeholder for action buttons
-        self.action_layout = QHBoxLayout()
-        self.action_layout.setSpacing(8)
-        self.main_layout.addLayout(self.action_layout)
+        # Action buttons get a layout on first add_action_button; most rows
+        # never have any
+        self.action_layout: QHBoxLayout | None = None
     
-    def add_action_button(self, text: str, callback, primary: bool = False) -> QPushButton:
-        """Add an action button to the row"""
-        btn = QPushButton(text)
-        btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setFixedHeight(28)
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _action_button_style(primary: bool, accent: str, accent_hover: str) -> str:
+        """Action button sheet; only rebuilt when the accent changes"""
         if primary:
-            btn.setStyleSheet(f"""
+            return f"""
                 QPushButton {{
-                    background: {Theme.ACCENT};
+                    background: {accent};
                     color: white;
                     border: none;
                     padding: 4px 14px;
@@ -1514,11 +1857,10 @@ class ModernListRow(QFrame):
                     font-weight: 600;
                 }}
                 QPushButton:hover {{
-                    background: {Theme.ACCENT_HOVER};
+                    background: {accent_hover};
                 }}
-            """)
-        else:
-            btn.setStyleSheet(f"""
+            """
+        return f"""
                 QPushButton {{
                     background: {Theme.BG_ELEVATED};
                     color: {Theme.TEXT_SECONDARY};
@@ -1531,27 +1873,26 @@ class ModernListRow(QFrame):
                 QPushButton:hover {{
                     background: {Theme.BG_CARD_HOVER};
                     color: {Theme.TEXT_PRIMARY};
-                    border-color: {Theme.ACCENT};
+                    border-color: {accent};
                 }}
-            """)
+            """
+    
+    def add_action_button(self, text: str, callback, primary: bool = False) -> QPushButton:
+        """Add an action button to the row"""
+        btn = QPushButton(text)
+        btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        btn.setFixedHeight(28)
+        btn.setStyleSheet(self._action_button_style(primary, Theme.ACCENT, Theme.ACCENT_HOVER))
         btn.clicked.connect(callback)
+        if self.action_layout is None:
+            self.action_layout = QHBoxLayout()
+            self.action_layout.setSpacing(8)
+            self.main_layout.addLayout(self.action_layout)
         self.action_layout.addWidget(btn)
         return btn
     
     def _apply_style(self):
-        bg = Theme.BG_CARD if not self.is_alternate else "#292930"
-        hover_bg = Theme.BG_CARD_HOVER
-        
-        self.setStyleSheet(f"""
-            ModernListRow {{
-                background: {bg};
-                border: none;
-                border-radius: 0px;
-            }}
-            ModernListRow:hover {{
-                background: {hover_bg};
-            }}
-        """)
+        self.setStyleSheet(self._ROW_STYLES[self.is_alternate])
     
     def set_title(self, title: str):
         self.title_label.setText(title)
@@ -1627,9 +1968,6 @@ class ModernListContainer(QFrame):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        
-        # Apply subtle shadow
-        Theme.apply_shadow(self, blur_radius=12, offset_y=3, opacity=50)
     
     def add_category(self, title: str, count: int = 0) -> ModernCategoryHeader:
         """Add a category header"""
@@ -1722,146 +2060,161 @@ class NavIcon(QWidget):
         s = self.icon_size
         m = 3  # margin
         
-        if self.icon_name == "grid":
-            # 2x2 grid
-            gap = 2
-            box = (s - 2*m - gap) // 2
-            painter.drawRoundedRect(m, m, box, box, 2, 2)
-            painter.drawRoundedRect(m+box+gap, m, box, box, 2, 2)
-            painter.drawRoundedRect(m, m+box+gap, box, box, 2, 2)
-            painter.drawRoundedRect(m+box+gap, m+box+gap, box, box, 2, 2)
-            
-        elif self.icon_name == "download":
-            cx = s // 2
-            painter.drawLine(cx, m+2, cx, s-m-4)
-            painter.drawLine(cx-4, s-m-7, cx, s-m-3)
-            painter.drawLine(cx+4, s-m-7, cx, s-m-3)
-            painter.drawLine(m+2, s-m, s-m-2, s-m)
-            
-        elif self.icon_name == "hdd":
-            painter.drawRoundedRect(m, m+2, s-2*m, s-2*m-4, 3, 3)
-            painter.drawLine(m+3, s//2, s-m-3, s//2)
-            # LED dot
-            painter.setBrush(QBrush(QColor(self.color)))
-            painter.drawEllipse(s-m-5, s//2+3, 3, 3)
-            
-        elif self.icon_name == "shield":
-            path = QPainterPath()
-            cx = s / 2
-            path.moveTo(cx, m)
-            path.lineTo(s-m, m+4)
-            path.lineTo(s-m, s//2+2)
-            path.quadTo(s-m, s-m-2, cx, s-m)
-            path.quadTo(m, s-m-2, m, s//2+2)
-            path.lineTo(m, m+4)
-            path.closeSubpath()
-            painter.drawPath(path)
-            
-        elif self.icon_name == "cpu":
-            # Main chip
-            painter.drawRoundedRect(m+3, m+3, s-2*m-6, s-2*m-6, 2, 2)
-            # Pins
-            for i in range(3):
-                x = m + 5 + i * 4
-                painter.drawLine(x, m, x, m+3)
-                painter.drawLine(x, s-m-3, x, s-m)
-                painter.drawLine(m, m+5+i*4, m+3, m+5+i*4)
-                painter.drawLine(s-m-3, m+5+i*4, s-m, m+5+i*4)
-                
-        elif self.icon_name == "file":
-            painter.drawRoundedRect(m+2, m, s-2*m-4, s-2*m, 2, 2)
-            # Lines
-            for i in range(3):
-                y = m + 5 + i * 4
-                painter.drawLine(m+5, y, s-m-5, y)
-                
-        elif self.icon_name == "alert":
-            # Triangle
-            path = QPainterPath()
-            cx = s / 2
-            path.moveTo(cx, m+1)
-            path.lineTo(s-m, s-m-1)
-            path.lineTo(m, s-m-1)
-            path.closeSubpath()
-            painter.drawPath(path)
-            # Exclamation
-            painter.drawLine(int(cx), m+6, int(cx), s-m-6)
-            painter.setBrush(QBrush(QColor(self.color)))
-            painter.drawEllipse(int(cx)-1, s-m-4, 2, 2)
-            
-        elif self.icon_name == "gear":
-            # Simple gear
-            cx, cy = s//2, s//2
-            painter.drawEllipse(cx-3, cy-3, 6, 6)
-            for i in range(8):
-                import math
-                angle = i * math.pi / 4
-                x1 = int(cx + 4 * math.cos(angle))
-                y1 = int(cy + 4 * math.sin(angle))
-                x2 = int(cx + 7 * math.cos(angle))
-                y2 = int(cy + 7 * math.sin(angle))
-                painter.drawLine(x1, y1, x2, y2)
-        
-        elif self.icon_name == "chip":
-            # Chip/driver icon - circuit board style
-            painter.drawRoundedRect(m+2, m+2, s-2*m-4, s-2*m-4, 2, 2)
-            # Inner square
-            painter.drawRect(m+5, m+5, s-2*m-10, s-2*m-10)
-            # Connection pins on all sides
-            cx, cy = s//2, s//2
-            pin_len = 3
-            # Top and bottom pins
-            painter.drawLine(cx-3, m+2, cx-3, m+2-pin_len)
-            painter.drawLine(cx+3, m+2, cx+3, m+2-pin_len)
-            painter.drawLine(cx-3, s-m-2, cx-3, s-m-2+pin_len)
-            painter.drawLine(cx+3, s-m-2, cx+3, s-m-2+pin_len)
-            # Left and right pins
-            painter.drawLine(m+2, cy-3, m+2-pin_len, cy-3)
-            painter.drawLine(m+2, cy+3, m+2-pin_len, cy+3)
-            painter.drawLine(s-m-2, cy-3, s-m-2+pin_len, cy-3)
-            painter.drawLine(s-m-2, cy+3, s-m-2+pin_len, cy+3)
-        
-        elif self.icon_name == "rocket":
-            # Rocket icon for startup programs
-            import math
-            cx, cy = s // 2, s // 2
-            # Rocket body (rotated 45 degrees - pointing up-right)
-            path = QPainterPath()
-            path.moveTo(s - m - 2, m + 2)  # nose
-            path.lineTo(s - m - 5, m + 5)
-            path.lineTo(m + 5, s - m - 5)
-            path.lineTo(m + 2, s - m - 2)  # tail
-            path.lineTo(m + 5, s - m - 5)
-            path.lineTo(s - m - 5, m + 5)
-            path.closeSubpath()
-            painter.drawPath(path)
-            # Fins
-            painter.drawLine(m + 3, s - m - 6, m + 6, s - m - 3)
-            painter.drawLine(s - m - 6, m + 3, s - m - 3, m + 6)
-            # Exhaust flames
-            painter.drawLine(m + 1, s - m - 1, m + 4, s - m - 4)
-            painter.drawLine(m + 3, s - m + 1, m + 6, s - m - 2)
-        
-        elif self.icon_name == "speaker":
-            # Speaker/audio icon
-            import math
-            # Speaker cone
-            path = QPainterPath()
-            path.moveTo(m + 2, s // 2 - 3)
-            path.lineTo(m + 5, s // 2 - 3)
-            path.lineTo(m + 9, s // 2 - 6)
-            path.lineTo(m + 9, s // 2 + 6)
-            path.lineTo(m + 5, s // 2 + 3)
-            path.lineTo(m + 2, s // 2 + 3)
-            path.closeSubpath()
-            painter.drawPath(path)
-            # Sound waves
-            for i, radius in enumerate([4, 7]):
-                cx = m + 9
-                cy = s // 2
-                start_angle = -45
-                span_angle = 90
-                painter.drawArc(cx, cy - radius, radius * 2, radius * 2, start_angle * 16, span_angle * 16)
+        draw = self._PAINTERS.get(self.icon_name)
+        if draw:
+            draw(self, painter, s, m)
+    
+    def _draw_grid(self, painter: QPainter, s: int, m: int):
+        # 2x2 grid
+        gap = 2
+        box = (s - 2*m - gap) // 2
+        painter.drawRoundedRect(m, m, box, box, 2, 2)
+        painter.drawRoundedRect(m+box+gap, m, box, box, 2, 2)
+        painter.drawRoundedRect(m, m+box+gap, box, box, 2, 2)
+        painter.drawRoundedRect(m+box+gap, m+box+gap, box, box, 2, 2)
+    
+    def _draw_download(self, painter: QPainter, s: int, m: int):
+        cx = s // 2
+        painter.drawLine(cx, m+2, cx, s-m-4)
+        painter.drawLine(cx-4, s-m-7, cx, s-m-3)
+        painter.drawLine(cx+4, s-m-7, cx, s-m-3)
+        painter.drawLine(m+2, s-m, s-m-2, s-m)
+    
+    def _draw_hdd(self, painter: QPainter, s: int, m: int):
+        painter.drawRoundedRect(m, m+2, s-2*m, s-2*m-4, 3, 3)
+        painter.drawLine(m+3, s//2, s-m-3, s//2)
+        # LED dot
+        painter.setBrush(QBrush(QColor(self.color)))
+        painter.drawEllipse(s-m-5, s//2+3, 3, 3)
+    
+    def _draw_shield(self, painter: QPainter, s: int, m: int):
+        path = QPainterPath()
+        cx = s / 2
+        path.moveTo(cx, m)
+        path.lineTo(s-m, m+4)
+        path.lineTo(s-m, s//2+2)
+        path.quadTo(s-m, s-m-2, cx, s-m)
+        path.quadTo(m, s-m-2, m, s//2+2)
+        path.lineTo(m, m+4)
+        path.closeSubpath()
+        painter.drawPath(path)
+    
+    def _draw_cpu(self, painter: QPainter, s: int, m: int):
+        # Main chip
+        painter.drawRoundedRect(m+3, m+3, s-2*m-6, s-2*m-6, 2, 2)
+        # Pins
+        for i in range(3):
+            x = m + 5 + i * 4
+            painter.drawLine(x, m, x, m+3)
+            painter.drawLine(x, s-m-3, x, s-m)
+            painter.drawLine(m, m+5+i*4, m+3, m+5+i*4)
+            painter.drawLine(s-m-3, m+5+i*4, s-m, m+5+i*4)
+    
+    def _draw_file(self, painter: QPainter, s: int, m: int):
+        painter.drawRoundedRect(m+2, m, s-2*m-4, s-2*m, 2, 2)
+        # Lines
+        for i in range(3):
+            y = m + 5 + i * 4
+            painter.drawLine(m+5, y, s-m-5, y)
+    
+    def _draw_alert(self, painter: QPainter, s: int, m: int):
+        # Triangle
+        path = QPainterPath()
+        cx = s / 2
+        path.moveTo(cx, m+1)
+        path.lineTo(s-m, s-m-1)
+        path.lineTo(m, s-m-1)
+        path.closeSubpath()
+        painter.drawPath(path)
+        # Exclamation
+        painter.drawLine(int(cx), m+6, int(cx), s-m-6)
+        painter.setBrush(QBrush(QColor(self.color)))
+        painter.drawEllipse(int(cx)-1, s-m-4, 2, 2)
+    
+    def _draw_gear(self, painter: QPainter, s: int, m: int):
+        # Simple gear
+        cx, cy = s//2, s//2
+        painter.drawEllipse(cx-3, cy-3, 6, 6)
+        for i in range(8):
+            angle = i * math.pi / 4
+            x1 = int(cx + 4 * math.cos(angle))
+            y1 = int(cy + 4 * math.sin(angle))
+            x2 = int(cx + 7 * math.cos(angle))
+            y2 = int(cy + 7 * math.sin(angle))
+            painter.drawLine(x1, y1, x2, y2)
+    
+    def _draw_chip(self, painter: QPainter, s: int, m: int):
+        # Chip/driver icon - circuit board style
+        painter.drawRoundedRect(m+2, m+2, s-2*m-4, s-2*m-4, 2, 2)
+        # Inner square
+        painter.drawRect(m+5, m+5, s-2*m-10, s-2*m-10)
+        # Connection pins on all sides
+        cx, cy = s//2, s//2
+        pin_len = 3
+        # Top and bottom pins
+        painter.drawLine(cx-3, m+2, cx-3, m+2-pin_len)
+        painter.drawLine(cx+3, m+2, cx+3, m+2-pin_len)
+        painter.drawLine(cx-3, s-m-2, cx-3, s-m-2+pin_len)
+        painter.drawLine(cx+3, s-m-2, cx+3, s-m-2+pin_len)
+        # Left and right pins
+        painter.drawLine(m+2, cy-3, m+2-pin_len, cy-3)
+        painter.drawLine(m+2, cy+3, m+2-pin_len, cy+3)
+        painter.drawLine(s-m-2, cy-3, s-m-2+pin_len, cy-3)
+        painter.drawLine(s-m-2, cy+3, s-m-2+pin_len, cy+3)
+    
+    def _draw_rocket(self, painter: QPainter, s: int, m: int):
+        # Rocket icon for startup programs
+        # Rocket body (rotated 45 degrees - pointing up-right)
+        path = QPainterPath()
+        path.moveTo(s - m - 2, m + 2)  # nose
+        path.lineTo(s - m - 5, m + 5)
+        path.lineTo(m + 5, s - m - 5)
+        path.lineTo(m + 2, s - m - 2)  # tail
+        path.lineTo(m + 5, s - m - 5)
+        path.lineTo(s - m - 5, m + 5)
+        path.closeSubpath()
+        painter.drawPath(path)
+        # Fins
+        painter.drawLine(m + 3, s - m - 6, m + 6, s - m - 3)
+        painter.drawLine(s - m - 6, m + 3, s - m - 3, m + 6)
+        # Exhaust flames
+        painter.drawLine(m + 1, s - m - 1, m + 4, s - m - 4)
+        painter.drawLine(m + 3, s - m + 1, m + 6, s - m - 2)
+    
+    def _draw_speaker(self, painter: QPainter, s: int, m: int):
+        # Speaker/audio icon
+        # Speaker cone
+        path = QPainterPath()
+        path.moveTo(m + 2, s // 2 - 3)
+        path.lineTo(m + 5, s // 2 - 3)
+        path.lineTo(m + 9, s // 2 - 6)
+        path.lineTo(m + 9, s // 2 + 6)
+        path.lineTo(m + 5, s // 2 + 3)
+        path.lineTo(m + 2, s // 2 + 3)
+        path.closeSubpath()
+        painter.drawPath(path)
+        # Sound waves
+        for i, radius in enumerate([4, 7]):
+            cx = m + 9
+            cy = s // 2
+            start_angle = -45
+            span_angle = 90
+            painter.drawArc(cx, cy - radius, radius * 2, radius * 2, start_angle * 16, span_angle * 16)
+    
+    # icon name -> draw method; one dict lookup per paint instead of an elif chain
+    _PAINTERS = {
+        "grid": _draw_grid,
+        "download": _draw_download,
+        "hdd": _draw_hdd,
+        "shield": _draw_shield,
+        "cpu": _draw_cpu,
+        "file": _draw_file,
+        "alert": _draw_alert,
+        "gear": _draw_gear,
+        "chip": _draw_chip,
+        "rocket": _draw_rocket,
+        "speaker": _draw_speaker,
+    }
 
 
 class SidebarItem(QFrame):
@@ -1890,65 +2243,78 @@ class SidebarItem(QFrame):
         
         # Label
         self.label = QLabel(self.label_text)
-        self.label.setFont(QFont("Segoe UI", 10))
+        self.label.setFont(ui_font(10))
         layout.addWidget(self.label)
         layout.addStretch()
     
-    def mousePressEvent(self, event):  # type: ignore[override]
-        if event.button() == Qt.MouseButton.LeftButton:
+    def mouseReleaseEvent(self, event):  # type: ignore[override]
+        # Click on release inside the item, as a button does, so pressing and
+        # dragging off the item cancels instead of navigating
+        if (event.button() == Qt.MouseButton.LeftButton
+                and self.rect().contains(event.position().toPoint())):
             self.clicked.emit()
-        super().mousePressEvent(event)
+        super().mouseReleaseEvent(event)
     
     def set_active(self, active: bool):
         self.is_active = active
         self._update_style()
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _stylesheet(accent: str, accent_subtle: str) -> str:
+        """All item states in one sheet; only rebuilt when the accent changes"""
+        return f"""
+            SidebarItem {{
+                background: transparent;
+                border-left: 3px solid transparent;
+                border-radius: 0px;
+                margin-left: 0px;
+                margin-right: 12px;
+                padding-left: 9px;
+            }}
+            SidebarItem[state="hover"] {{
+                background: {Theme.BG_CARD_HOVER};
+            }}
+            SidebarItem[state="active"] {{
+                background: {accent_subtle};
+                border-left: 3px solid {accent};
+            }}
+            QLabel {{
+                background: transparent;
+                color: {Theme.TEXT_SECONDARY};
+                font-weight: normal;
+            }}
+            QLabel[state="hover"] {{
+                color: {Theme.TEXT_PRIMARY};
+            }}
+            QLabel[state="active"] {{
+                color: {Theme.TEXT_PRIMARY};
+                font-weight: 600;
+            }}
+        """
+    
+    def _set_state(self, state: str, icon_color: str):
+        """Switch between default/hover/active without reparsing the stylesheet"""
+        set_style_state(self, state)
+        set_style_state(self.label, state)
+        self.icon.set_color(icon_color)
+    
     def _update_style(self):
         """Update style - Apple-style glass with vibrant accent"""
+        sheet = self._stylesheet(Theme.ACCENT, Theme.ACCENT_SUBTLE)
+        if self.styleSheet() != sheet:
+            self.setStyleSheet(sheet)
         if self.is_active:
             # Selected state: glowing left border, glass background
-            self.setStyleSheet(f"""
-                SidebarItem {{
-                    background: {Theme.ACCENT_SUBTLE};
-                    border-left: 3px solid {Theme.ACCENT};
-                    border-radius: 0px;
-                    margin-left: 0px;
-                    margin-right: 12px;
-                    padding-left: 9px;
-                }}
-            """)
-            self.icon.set_color(Theme.ACCENT)
-            self.label.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-weight: 600;")
+            self._set_state("active", Theme.ACCENT)
         else:
             # Default state: transparent
-            self.setStyleSheet(f"""
-                SidebarItem {{
-                    background: transparent;
-                    border-left: 3px solid transparent;
-                    border-radius: 0px;
-                    margin-left: 0px;
-                    margin-right: 12px;
-                    padding-left: 9px;
-                }}
-            """)
-            self.icon.set_color(Theme.TEXT_SECONDARY)
-            self.label.setStyleSheet(f"background: transparent; color: {Theme.TEXT_SECONDARY}; font-weight: normal;")
+            self._set_state("default", Theme.TEXT_SECONDARY)
     
     def enterEvent(self, event):
         if not self.is_active:
             # Hover state: subtle background
-            self.setStyleSheet(f"""
-                SidebarItem {{
-                    background: {Theme.BG_CARD_HOVER};
-                    border-left: 3px solid transparent;
-                    border-radius: 0px;
-                    margin-left: 0px;
-                    margin-right: 12px;
-                    padding-left: 9px;
-                }}
-            """)
-            self.icon.set_color(Theme.TEXT_PRIMARY)
-            self.label.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-weight: normal;")
+            self._set_state("hover", Theme.TEXT_PRIMARY)
     
     def leaveEvent(self, event): # pyright: ignore[reportIncompatibleMethodOverride]
         self._update_style()
@@ -1957,6 +2323,9 @@ class SidebarItem(QFrame):
 class ScoreRing(QWidget):
     """Animated score ring widget"""
     
+    RING_WIDTH = 10  # Slightly thicker for more presence
+    _TEXT_COLOR = QColor(Theme.TEXT_PRIMARY)
+    
     def __init__(self, size: int = 120, parent=None):
         super().__init__(parent)
         self.ring_size = size
@@ -1985,69 +2354,114 @@ class ScoreRing(QWidget):
             self.score += diff * 0.1
         self.update()
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _pens(status: str) -> tuple[tuple[QPen, ...], QPen, QPen]:
+        """(glow pens, background pen, progress pen) for a score band.
+        
+        Built once per band; the ring repaints every animation frame.
+        """
+        def ring_pen(color: QColor, width: int) -> QPen:
+            pen = QPen(color)
+            pen.setWidth(width)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            return pen
+        
+        color = GLOW_COLORS[status]
+        glow_pens = []
+        for i in range(2, 0, -1):
+            glow_color = QColor(color)
+            glow_color.setAlpha(int(15 * (3 - i)))
+            glow_pens.append(ring_pen(glow_color, ScoreRing.RING_WIDTH + i * 3))
+        
+        return (tuple(glow_pens),
+                ring_pen(QColor(Theme.SURFACE_04DP), ScoreRing.RING_WIDTH),
+                ring_pen(color, ScoreRing.RING_WIDTH))
+    
+    @staticmethod
+    @lru_cache(maxsize=101)
+    def _score_text(score: int) -> QStaticText:
+        """Laid-out score digits, so animation frames skip text shaping"""
+        text = QStaticText(str(score))
+        text.setTextFormat(Qt.TextFormat.PlainText)
+        text.prepare(QTransform(), ui_font(32, QFont.Weight.Bold, "Segoe UI Variable"))
+        return text
+    
     def paintEvent(self, event): # pyright: ignore[reportIncompatibleMethodOverride]
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         size = self.ring_size
-        ring_width = 10  # Slightly thicker for more presence
-        margin = ring_width // 2 + 4
+        margin = self.RING_WIDTH // 2 + 4
         
         # Determine color based on score (use Apple-style glow colors)
         if self.score >= 80:
-            color = QColor(Theme.GLOW_SUCCESS)
-            glow_color = QColor(Theme.GLOW_SUCCESS)
+            glow_pens, track_pen, pen = self._pens("check")
         elif self.score >= 50:
-            color = QColor(Theme.GLOW_WARNING)
-            glow_color = QColor(Theme.GLOW_WARNING)
+            glow_pens, track_pen, pen = self._pens("warning")
         else:
-            color = QColor(Theme.GLOW_ERROR)
-            glow_color = QColor(Theme.GLOW_ERROR)
+            glow_pens, track_pen, pen = self._pens("error")
         
-        center = size // 2
-        radius = (size - 2 * margin) // 2
+        span = int((self.score / 100) * 360 * 16)
         
         # Draw subtle glow effect behind the progress arc
         if self.score > 0:
-            for i in range(2, 0, -1):
-                glow_color.setAlpha(int(15 * (3 - i)))
-                glow_pen = QPen(glow_color)
-                glow_pen.setWidth(ring_width + i * 3)
-                glow_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            for i, glow_pen in zip((2, 1), glow_pens):
                 painter.setPen(glow_pen)
-                span = int((self.score / 100) * 360 * 16)
                 painter.drawArc(margin - i, margin - i, 
                                size - 2*margin + i*2, size - 2*margin + i*2, 
                                90*16, -span)
         
         # Background ring
-        pen = QPen(QColor(Theme.SURFACE_04DP))
-        pen.setWidth(ring_width)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(track_pen)
         painter.drawArc(margin, margin, size-2*margin, size-2*margin, 0, 360*16)
         
         # Progress ring (main)
-        pen.setColor(color)
         painter.setPen(pen)
-        span = int((self.score / 100) * 360 * 16)
         painter.drawArc(margin, margin, size-2*margin, size-2*margin, 90*16, -span)
         
         # Score text
-        painter.setPen(QColor(Theme.TEXT_PRIMARY))
-        font = QFont("Segoe UI Variable", 32, QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, str(int(self.score)))
+        painter.setPen(self._TEXT_COLOR)
+        painter.setFont(ui_font(32, QFont.Weight.Bold, "Segoe UI Variable"))
+        text = self._score_text(int(self.score))
+        text_size = text.size()
+        painter.drawStaticText(QPointF((self.width() - text_size.width()) / 2,
+                                       (self.height() - text_size.height()) / 2), text)
+
+
+# Colors used by the card paint handlers every frame; parsed once here.
+# These are shared instances - copy with QColor(c) before changing alpha.
+CARD_BG_COLOR = QColor(32, 32, 36)
+CARD_BORDER_COLOR = QColor(55, 55, 60)
+GLOW_COLORS = {
+    "check": QColor(Theme.GLOW_SUCCESS),
+    "warning": QColor(Theme.GLOW_WARNING),
+    "error": QColor(Theme.GLOW_ERROR),
+    "info": QColor(Theme.GLOW_INFO),
+    "running": QColor(Theme.GLOW_RUNNING),
+}
+NO_GLOW_COLOR = QColor(0, 0, 0, 0)
 
 
 class GlassCard(QFrame):
     """Clean glass card without glow - glow is painted by parent container"""
     
-    clicked = pyqtSignal()
+    clicked = pyqtSignal(str)  # Emits the card's nav_id
+    
+    # Status -> icon glyph; the matching colours live in GLOBAL_STYLE
+    _STATUS_GLYPHS = {
+        "check": "✓",
+        "warning": "!",
+        "error": "✕",
+        "info": "i",
+        "running": "◐",
+        "pending": "○",
+    }
     
-    def __init__(self, title: str, parent=None):
+    def __init__(self, title: str, nav_id: str = "", parent=None):
         super().__init__(parent)
         self.title_text = title
+        self.nav_id = nav_id
         self._status = "pending"
         self.setFixedHeight(72)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -2063,7 +2477,7 @@ class GlassCard(QFrame):
         self.status_icon = QLabel("○")
         self.status_icon.setFixedSize(22, 22)
         self.status_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_icon.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 16px;")
+        self.status_icon.setObjectName("glassCardIcon")
         layout.addWidget(self.status_icon)
         
         # Text
@@ -2071,11 +2485,11 @@ class GlassCard(QFrame):
         text_layout.setSpacing(2)
         
         self.title = QLabel(self.title_text)
-        self.title.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 13px; font-weight: 600;")
+        self.title.setObjectName("glassCardTitle")
         text_layout.addWidget(self.title)
         
         self.subtitle = QLabel("Checking...")
-        self.subtitle.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 11px;")
+        self.subtitle.setObjectName("glassCardSubtitle")
         text_layout.addWidget(self.subtitle)
         
         layout.addLayout(text_layout)
@@ -2083,44 +2497,32 @@ class GlassCard(QFrame):
         
         # Chevron
         chevron = QLabel("›")
-        chevron.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 16px;")
+        chevron.setObjectName("glassCardChevron")
         layout.addWidget(chevron)
     
     def get_status(self) -> str:
         return self._status
     
     def get_glow_color(self) -> QColor:
-        """Return the glow color for this card's status"""
-        colors = {
-            "check": QColor(Theme.GLOW_SUCCESS),
-            "warning": QColor(Theme.GLOW_WARNING),
-            "error": QColor(Theme.GLOW_ERROR),
-            "info": QColor(Theme.GLOW_INFO),
-            "running": QColor(Theme.GLOW_RUNNING),
-        }
-        return colors.get(self._status, QColor(0, 0, 0, 0))
-    
-    def mousePressEvent(self, event): # pyright: ignore[reportIncompatibleMethodOverride]
-        self.clicked.emit()
-        super().mousePressEvent(event)
+        """Return the (shared) glow color for this card's status"""
+        return GLOW_COLORS.get(self._status, NO_GLOW_COLOR)
+    
+    def mouseReleaseEvent(self, event): # pyright: ignore[reportIncompatibleMethodOverride]
+        # Same button-style click as SidebarItem: left release inside the card
+        if (event.button() == Qt.MouseButton.LeftButton
+                and self.rect().contains(event.position().toPoint())):
+            self.clicked.emit(self.nav_id)
+        super().mouseReleaseEvent(event)
     
     def set_status(self, status: str, subtitle: str):
-        self._status = status
         self.subtitle.setText(subtitle)
-        self.subtitle.setStyleSheet(f"background: transparent; color: {Theme.TEXT_SECONDARY}; font-size: 11px;")
+        set_style_state(self.subtitle, "set")
         
         # Update icon with vibrant colors
-        icons = {
-            "check": ("✓", Theme.GLOW_SUCCESS),
-            "warning": ("!", Theme.GLOW_WARNING),
-            "error": ("✕", Theme.GLOW_ERROR),
-            "info": ("i", Theme.GLOW_INFO),
-            "running": ("◐", Theme.GLOW_RUNNING),
-            "pending": ("○", Theme.TEXT_TERTIARY),
-        }
-        icon_char, icon_color = icons.get(status, ("○", Theme.TEXT_TERTIARY))
-        self.status_icon.setText(icon_char)
-        self.status_icon.setStyleSheet(f"background: transparent; color: {icon_color}; font-size: 16px; font-weight: bold;")
+        icon_state = status if status in self._STATUS_GLYPHS else "pending"
+        self.status_icon.setText(self._STATUS_GLYPHS[icon_state])
+        set_style_state(self.status_icon, icon_state)
+        self._status = status
         
         # Trigger parent repaint for glow update
         if self.parent():
@@ -2153,7 +2555,6 @@ class GlowingCardGrid(QWidget):
     
     def _animate(self):
         """Animate glow intensity and phase"""
-        import math
         self._glow_phase += 0.04
         if self._glow_phase > math.pi * 2:
             self._glow_phase = 0
@@ -2175,7 +2576,6 @@ class GlowingCardGrid(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        import math
         radius = Theme.RADIUS_LG
         
         # Subtle pulsing
@@ -2217,9 +2617,8 @@ class GlowingCardGrid(QWidget):
             status = card.get_status()
             
             # Card background - solid dark
-            bg_color = QColor(32, 32, 36)
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(bg_color))
+            painter.setBrush(QBrush(CARD_BG_COLOR))
             
             path = QPainterPath()
             path.addRoundedRect(
@@ -2236,7 +2635,7 @@ class GlowingCardGrid(QWidget):
                 border_color = QColor(glow_color.red(), glow_color.green(), glow_color.blue(), border_alpha)
                 painter.setPen(QPen(border_color, 1.5))
             else:
-                painter.setPen(QPen(QColor(55, 55, 60), 1))
+                painter.setPen(QPen(CARD_BORDER_COLOR, 1))
             
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawRoundedRect(
@@ -2265,9 +2664,8 @@ class HealthSummaryCard(QWidget):
         radius = Theme.RADIUS_LG
         
         # Simple solid card background
-        bg_color = QColor(32, 32, 36)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(bg_color))
+        painter.setBrush(QBrush(CARD_BG_COLOR))
         
         path = QPainterPath()
         path.addRoundedRect(float(rect.x()), float(rect.y()),
@@ -2277,11 +2675,11 @@ class HealthSummaryCard(QWidget):
         
         # Subtle colored border based on score
         if self._score >= 80:
-            border_color = QColor(Theme.GLOW_SUCCESS)
+            border_color = QColor(GLOW_COLORS["check"])
         elif self._score >= 50:
-            border_color = QColor(Theme.GLOW_WARNING)
+            border_color = QColor(GLOW_COLORS["warning"])
         else:
-            border_color = QColor(Theme.GLOW_ERROR)
+            border_color = QColor(GLOW_COLORS["error"])
         border_color.setAlpha(100)  # Subtle
         painter.setPen(QPen(border_color, 1.5))
         painter.setBrush(Qt.BrushStyle.NoBrush)
@@ -2368,6 +2766,14 @@ class HealthSummaryCard(QWidget):
 class ActivityItem(QFrame):
     """Single activity log item with glowing status indicator"""
     
+    _DOT_COLORS = {
+        "success": Theme.GLOW_SUCCESS,
+        "warning": Theme.GLOW_WARNING,
+        "error": Theme.GLOW_ERROR,
+        "info": Theme.GLOW_INFO,
+        None: Theme.TEXT_TERTIARY,
+    }
+    
     def __init__(self, status: str, text: str, time: str = "", parent=None):
         super().__init__(parent)
         self.setFixedHeight(36)
@@ -2377,15 +2783,7 @@ class ActivityItem(QFrame):
         layout.setSpacing(10)
         
         # Status dot with glow color
-        dot = QLabel("●")  # Filled circle instead of bullet
-        glow_color = {
-            "success": Theme.GLOW_SUCCESS,
-            "warning": Theme.GLOW_WARNING,
-            "error": Theme.GLOW_ERROR,
-            "info": Theme.GLOW_INFO,
-        }.get(status, Theme.TEXT_TERTIARY)
-        # Add text-shadow effect via rich text for glow illusion
-        dot.setStyleSheet(f"background: transparent; color: {glow_color}; font-size: 12px;")
+        dot = status_icon_label("dot", self._DOT_COLORS.get(status, self._DOT_COLORS[None]), 8)
         layout.addWidget(dot)
         
         # Text
@@ -2451,15 +2849,38 @@ class StartupProgramsCard(QFrame):
     
     manage_clicked = pyqtSignal()  # Signal to navigate to startup page
     
+    # Chip colors are switched with set_style_state rather than new stylesheets
+    _CHIP_STYLE = f"""
+        QLabel {{
+            background: {Theme.SUCCESS_BG};
+            color: {Theme.SUCCESS};
+            font-size: 10px;
+            font-weight: 600;
+            padding: 3px 8px;
+            border-radius: 4px;
+        }}
+        QLabel[state="ok"] {{
+            background: rgba(48, 209, 88, 0.2);
+            color: {Theme.GLOW_SUCCESS};
+        }}
+        QLabel[state="warn"] {{
+            background: rgba(255, 214, 10, 0.2);
+            color: {Theme.GLOW_WARNING};
+        }}
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._data_requested = False
         self.setup_ui()
-        self.load_data()
-        self._setup_shadow()
     
-    def _setup_shadow(self):
-        """Apply card shadow for elevation"""
-        Theme.apply_shadow(self, blur_radius=16, offset_y=4, opacity=80)
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        # The startup scan runs several PowerShell queries; start it once,
+        # on the worker pool, the first time the card is shown
+        if not self._data_requested:
+            self._data_requested = True
+            self.load_data()
     
     def setup_ui(self):
         self.setStyleSheet(f"""
@@ -2510,14 +2931,7 @@ class StartupProgramsCard(QFrame):
         title_row.addWidget(title)
         
         self.status_chip = QLabel("Healthy")
-        self.status_chip.setStyleSheet(f"""
-            background: {Theme.SUCCESS_BG};
-            color: {Theme.SUCCESS};
-            font-size: 10px;
-            font-weight: 600;
-            padding: 3px 8px;
-            border-radius: 4px;
-        """)
+        self.status_chip.setStyleSheet(self._CHIP_STYLE)
         title_row.addWidget(self.status_chip)
         title_row.addStretch()
         
@@ -2566,9 +2980,15 @@ class StartupProgramsCard(QFrame):
         layout.addWidget(self.action_btn)
     
     def load_data(self):
-        """Load and display startup data"""
-        data = get_startup_data()
+        """Load startup data in the background"""
+        self._summary_worker = StartupSummaryWorker()
+        self._summary_worker.finished.connect(self._on_summary_loaded)
+        self._summary_worker.finished.connect(self._summary_worker.deleteLater)
         
+        start_worker(self._summary_worker)
+    
+    def _on_summary_loaded(self, data: dict):
+        """Display startup data from the summary worker"""
         enabled = data["enabled_count"]
         disabled = data["disabled_count"]
         unknown = data["unknown_count"]
@@ -2580,24 +3000,10 @@ class StartupProgramsCard(QFrame):
         # Update status chip with vibrant glow colors
         if enabled > threshold or unknown > 0:
             self.status_chip.setText("Warning")
-            self.status_chip.setStyleSheet(f"""
-                background: rgba(255, 214, 10, 0.2);
-                color: {Theme.GLOW_WARNING};
-                font-size: 10px;
-                font-weight: 600;
-                padding: 3px 8px;
-                border-radius: 4px;
-            """)
+            set_style_state(self.status_chip, "warn")
         else:
             self.status_chip.setText("Healthy")
-            self.status_chip.setStyleSheet(f"""
-                background: rgba(48, 209, 88, 0.2);
-                color: {Theme.GLOW_SUCCESS};
-                font-size: 10px;
-                font-weight: 600;
-                padding: 3px 8px;
-                border-radius: 4px;
-            """)
+            set_style_state(self.status_chip, "ok")
         
         # Clear existing details
         while self.details_layout.count():
@@ -2617,8 +3023,7 @@ class StartupProgramsCard(QFrame):
             
             # Impact indicator
             impact_color = Theme.WARNING if item["impact"] == "High" else Theme.TEXT_TERTIARY
-            impact_dot = QLabel("●")
-            impact_dot.setStyleSheet(f"background: transparent; color: {impact_color}; font-size: 8px;")
+            impact_dot = status_icon_label("dot", impact_color, 5)
             row_layout.addWidget(impact_dot)
             
             # Name
@@ -2641,15 +3046,22 @@ class StartupProgramsCard(QFrame):
 class BootSecurityCard(QFrame):
     """Card showing Secure Boot and BIOS mode status with Apple-style glass effect"""
     
+    # Status label colors are switched with set_style_state rather than new stylesheets
+    _STATUS_STYLE = f"""
+        QLabel {{
+            background: transparent;
+            color: {Theme.TEXT_TERTIARY};
+            font-size: 13px;
+        }}
+        QLabel[state="success"] {{ color: {Theme.GLOW_SUCCESS}; font-weight: 600; }}
+        QLabel[state="warning"] {{ color: {Theme.GLOW_WARNING}; font-weight: 600; }}
+        QLabel[state="info"] {{ color: {Theme.GLOW_INFO}; font-weight: 600; }}
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         self.load_data()
-        self._setup_shadow()
-    
-    def _setup_shadow(self):
-        """Apply card shadow for elevation"""
-        Theme.apply_shadow(self, blur_radius=16, offset_y=4, opacity=80)
     
     def setup_ui(self):
         self.setStyleSheet(f"""
@@ -2715,11 +3127,10 @@ class BootSecurityCard(QFrame):
         secure_boot_row.addStretch()
         
         self.secure_boot_status = QLabel("Checking...")
-        self.secure_boot_status.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 13px;")
+        self.secure_boot_status.setStyleSheet(self._STATUS_STYLE)
         secure_boot_row.addWidget(self.secure_boot_status)
         
-        self.secure_boot_dot = QLabel("●")
-        self.secure_boot_dot.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 10px;")
+        self.secure_boot_dot = status_icon_label("dot", Theme.TEXT_TERTIARY, 7)
         secure_boot_row.addWidget(self.secure_boot_dot)
         
         info_layout.addLayout(secure_boot_row)
@@ -2740,11 +3151,10 @@ class BootSecurityCard(QFrame):
         bios_row.addStretch()
         
         self.bios_status = QLabel("Checking...")
-        self.bios_status.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 13px;")
+        self.bios_status.setStyleSheet(self._STATUS_STYLE)
         bios_row.addWidget(self.bios_status)
         
-        self.bios_dot = QLabel("●")
-        self.bios_dot.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 10px;")
+        self.bios_dot = status_icon_label("dot", Theme.TEXT_TERTIARY, 7)
         bios_row.addWidget(self.bios_dot)
         
         info_layout.addLayout(bios_row)
@@ -2758,44 +3168,120 @@ class BootSecurityCard(QFrame):
         secure_boot = data["secure_boot"]
         bios_mode = data["bios_mode"]
         
-        # Update Secure Boot status with vibrant glow colors
-        if secure_boot is True:
-            self.secure_boot_status.setText("Enabled")
-            self.secure_boot_status.setStyleSheet(f"background: transparent; color: {Theme.GLOW_SUCCESS}; font-size: 13px; font-weight: 600;")
-            self.secure_boot_dot.setStyleSheet(f"background: transparent; color: {Theme.GLOW_SUCCESS}; font-size: 10px;")
-        elif secure_boot is False:
-            self.secure_boot_status.setText("Disabled")
-            self.secure_boot_status.setStyleSheet(f"background: transparent; color: {Theme.GLOW_WARNING}; font-size: 13px; font-weight: 600;")
-            self.secure_boot_dot.setStyleSheet(f"background: transparent; color: {Theme.GLOW_WARNING}; font-size: 10px;")
-        else:
-            self.secure_boot_status.setText("Unsupported")
-            self.secure_boot_status.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 13px;")
-            self.secure_boot_dot.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 10px;")
+        # Update Secure Boot status with vibrant glow colors
+        if secure_boot is True:
+            self.secure_boot_status.setText("Enabled")
+            set_style_state(self.secure_boot_status, "success")
+            self.secure_boot_dot.setPixmap(status_pixmap("dot", Theme.GLOW_SUCCESS, 7))
+        elif secure_boot is False:
+            self.secure_boot_status.setText("Disabled")
+            set_style_state(self.secure_boot_status, "warning")
+            self.secure_boot_dot.setPixmap(status_pixmap("dot", Theme.GLOW_WARNING, 7))
+        else:
+            self.secure_boot_status.setText("Unsupported")
+            set_style_state(self.secure_boot_status, "")
+            self.secure_boot_dot.setPixmap(status_pixmap("dot", Theme.TEXT_TERTIARY, 7))
+        
+        # Update BIOS mode status with vibrant glow colors
+        self.bios_status.setText(bios_mode)
+        if bios_mode == "UEFI":
+            set_style_state(self.bios_status, "info")
+            self.bios_dot.setPixmap(status_pixmap("dot", Theme.GLOW_INFO, 7))
+        else:
+            set_style_state(self.bios_status, "warning")
+            self.bios_dot.setPixmap(status_pixmap("dot", Theme.GLOW_WARNING, 7))
+    
+    def update_data(self, secure_boot: bool, bios_mode: str):
+        """Update with new data (for future backend integration)"""
+        # Store and reload
+        pass  # Placeholder for future backend hook
+
+
+class ScanTaskRow(QWidget):
+    """Scan dialog task row: a StatusIcon child with the name and status painted
+    
+    Replaces an HBox holding three widgets per row; a state change is now an
+    attribute update and one repaint instead of a label restyle.
+    """
+    
+    STATUS_WIDTH = 70
+    
+    # status -> text color ("running" follows Theme.ACCENT, read at paint time)
+    _STATUS_COLORS = {
+        "complete": Theme.SUCCESS,
+        "error": Theme.ERROR,
+    }
+    
+    def __init__(self, name: str, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.status = "pending"
+        self.status_text = "Waiting"
+        self.rendered = None  # Last (status, text, time_ms) applied by the dialog
+        self.icon = StatusIcon("pending", 18, self)
+        self.setFixedHeight(self.icon.height())
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+    
+    def set_status(self, status: str, text: str):
+        if (status, text) == (self.status, self.status_text):
+            return
+        self.status = status
+        self.status_text = text
+        self.update()
+    
+    def paintEvent(self, event): # type: ignore
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        height = self.height()
+        
+        # Name, between the icon and the status column
+        name_left = self.icon.width() + 12
+        name_width = self.width() - name_left - self.STATUS_WIDTH - 12
+        painter.setFont(ui_font(9))
+        painter.setPen(QColor(Theme.TEXT_PRIMARY))
+        painter.drawText(QRectF(name_left, 0, name_width, height),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.name)
         
-        # Update BIOS mode status with vibrant glow colors
-        self.bios_status.setText(bios_mode)
-        if bios_mode == "UEFI":
-            self.bios_status.setStyleSheet(f"background: transparent; color: {Theme.GLOW_INFO}; font-size: 13px; font-weight: 600;")
-            self.bios_dot.setStyleSheet(f"background: transparent; color: {Theme.GLOW_INFO}; font-size: 10px;")
+        # Status text, right-aligned in a fixed-width column
+        if self.status == "running":
+            color = Theme.ACCENT
         else:
-            self.bios_status.setStyleSheet(f"background: transparent; color: {Theme.GLOW_WARNING}; font-size: 13px; font-weight: 600;")
-            self.bios_dot.setStyleSheet(f"background: transparent; color: {Theme.GLOW_WARNING}; font-size: 10px;")
-    
-    def update_data(self, secure_boot: bool, bios_mode: str):
-        """Update with new data (for future backend integration)"""
-        # Store and reload
-        pass  # Placeholder for future backend hook
+            color = self._STATUS_COLORS.get(self.status, Theme.TEXT_TERTIARY)
+        painter.setFont(ui_font(8))
+        painter.setPen(QColor(color))
+        painter.drawText(QRectF(self.width() - self.STATUS_WIDTH, 0, self.STATUS_WIDTH, height),
+                         Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, self.status_text)
+        painter.end()
 
 
 class ScanProgressDialog(QDialog):
     """Refined scan progress dialog"""
     
+    # task status -> (icon status, default text)
+    _TASK_STATUS = {
+        "running": ("running", "Running..."),
+        "complete": ("check", "Complete"),
+        "error": ("error", "Failed"),
+    }
+    
+    # (task id, label) for each check a full scan runs, in display order
+    TASKS = (
+        ("update", "Windows Update"),
+        ("defender", "Windows Defender"),
+        ("sfc", "System File Integrity"),
+        ("smart", "Drive SMART Health"),
+        ("memory", "Memory Health"),
+        ("events", "Event Log Analysis"),
+        ("services", "Service Status"),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("System Health Check")
         self.setModal(True)
         self.setFixedSize(480, 420)
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.WindowCloseButtonHint)
+        self._progress_shown: tuple[int, str | None] | None = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -2821,51 +3307,24 @@ class ScanProgressDialog(QDialog):
         """)
         layout.addWidget(header)
         
-        # Task list container
+        # Task list container; each row paints its own name and status text
         tasks_container = QFrame()
+        tasks_container.setObjectName("scanTasks")
         tasks_container.setStyleSheet(f"""
-            background: {Theme.BG_WINDOW};
-            border-radius: {Theme.RADIUS_MD}px;
+            QFrame#scanTasks {{
+                background: {Theme.BG_WINDOW};
+                border-radius: {Theme.RADIUS_MD}px;
+            }}
         """)
         tasks_layout = QVBoxLayout(tasks_container)
         tasks_layout.setContentsMargins(16, 12, 16, 12)
         tasks_layout.setSpacing(8)
         
-        self.tasks = {}
-        task_items = [
-            ("update", "Windows Update"),
-            ("defender", "Windows Defender"),
-            ("sfc", "System File Integrity"),
-            ("smart", "Drive SMART Health"),
-            ("memory", "Memory Health"),
-            ("events", "Event Log Analysis"),
-            ("services", "Service Status"),
-        ]
-        
-        for task_id, task_name in task_items:
-            task_row = QHBoxLayout()
-            task_row.setSpacing(12)
-            
-            # Status icon
-            icon = StatusIcon("pending", 18)
-            task_row.addWidget(icon)
-            
-            # Name
-            name = QLabel(task_name)
-            name.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 12px;")
-            task_row.addWidget(name)
-            
-            task_row.addStretch()
-            
-            # Status text
-            status = QLabel("Waiting")
-            status.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 11px;")
-            status.setFixedWidth(70)
-            status.setAlignment(Qt.AlignmentFlag.AlignRight)
-            task_row.addWidget(status)
-            
-            self.tasks[task_id] = {"icon": icon, "status": status}
-            tasks_layout.addLayout(task_row)
+        self.tasks: dict[str, ScanTaskRow] = {}
+        for task_id, task_name in self.TASKS:
+            row = ScanTaskRow(task_name)
+            self.tasks[task_id] = row
+            tasks_layout.addWidget(row)
         
         layout.addWidget(tasks_container)
         
@@ -2942,15 +3401,15 @@ class ScanProgressDialog(QDialog):
         if task_id not in self.tasks:
             return
         
-        task = self.tasks[task_id]
+        row = self.tasks[task_id]
         
-        status_map = {
-            "running": ("running", Theme.ACCENT, "Running..."),
-            "complete": ("check", Theme.SUCCESS, "Complete"),
-            "error": ("error", Theme.ERROR, "Failed"),
-        }
+        # Finished rows never change again; skip repeat updates for them
+        rendered = (status, text, time_ms)
+        if row.rendered == rendered and status in ("complete", "error"):
+            return
+        row.rendered = rendered
         
-        icon_status, color, default_text = status_map.get(status, ("pending", Theme.TEXT_TERTIARY, "Waiting"))
+        icon_status, default_text = self._TASK_STATUS.get(status, ("pending", "Waiting"))
         
         # If time is provided, format it nicely
         if time_ms is not None and status == "complete":
@@ -2962,11 +3421,25 @@ class ScanProgressDialog(QDialog):
         else:
             display_text = text or default_text
         
-        task["icon"].set_status(icon_status)
-        task["status"].setText(display_text)
-        task["status"].setStyleSheet(f"background: transparent; color: {color}; font-size: 11px;")
+        # Only repaint the parts whose state actually changed
+        if row.icon.status != icon_status:
+            row.icon.set_status(icon_status)
+        row.set_status(status, display_text)
+    
+    def update_tasks(self, updates: list[tuple[str, str, float | None]], percent: int,
+                     time_remaining: str | None = None):
+        """Apply (task_id, status, time_ms) updates and the progress in one repaint"""
+        self.setUpdatesEnabled(False)
+        for task_id, status, time_ms in updates:
+            self.update_task(task_id, status, time_ms=time_ms)
+        self.set_progress(percent, time_remaining)
+        self.setUpdatesEnabled(True)
     
     def set_progress(self, percent: int, time_remaining: str | None = None):
+        # Repeated values would only relayout the labels to the same text
+        if self._progress_shown == (percent, time_remaining):
+            return
+        self._progress_shown = (percent, time_remaining)
         self.progress_bar.setValue(percent)
         self.progress_percent.setText(f"{percent}%")
         if time_remaining:
@@ -2999,12 +3472,7 @@ class OverviewPage(QWidget):
         
         # Page title
         title = QLabel("System Health")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Health summary card
@@ -3013,13 +3481,7 @@ class OverviewPage(QWidget):
         
         # Quick Status section
         section_header = QLabel("Quick Status")
-        section_header.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 16px;
-            font-weight: 600;
-            margin-top: 8px;
-        """)
+        section_header.setObjectName("pageSection")
         layout.addWidget(section_header)
         
         # Status cards in glowing grid container
@@ -3037,8 +3499,8 @@ class OverviewPage(QWidget):
         ]
         
         for i, (card_id, title, nav_target) in enumerate(cards_data):
-            card = GlassCard(title)
-            card.clicked.connect(lambda target=nav_target: self.card_clicked.emit(target))
+            card = GlassCard(title, nav_target)
+            card.clicked.connect(self.card_clicked)
             self.status_cards[card_id] = card
             self.card_grid.add_card(card, i // 3, i % 3)
         
@@ -3059,13 +3521,7 @@ class OverviewPage(QWidget):
         
         # Recent Activity section
         activity_header = QLabel("Recent Activity")
-        activity_header.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 16px;
-            font-weight: 600;
-            margin-top: 8px;
-        """)
+        activity_header.setObjectName("pageSection")
         layout.addWidget(activity_header)
         
         # Activity list
@@ -3087,13 +3543,7 @@ class OverviewPage(QWidget):
         
         # Quick Tools section
         tools_header = QLabel("Quick Tools")
-        tools_header.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 16px;
-            font-weight: 600;
-            margin-top: 8px;
-        """)
+        tools_header.setObjectName("pageSection")
         layout.addWidget(tools_header)
         
         # Tools grid
@@ -3192,7 +3642,6 @@ class OverviewPage(QWidget):
     
     def _open_task_manager(self):
         """Open Task Manager"""
-        import subprocess
         try:
             subprocess.Popen(["taskmgr"])
         except:
@@ -3200,7 +3649,6 @@ class OverviewPage(QWidget):
     
     def _open_device_manager(self):
         """Open Device Manager"""
-        import subprocess
         try:
             subprocess.Popen(["devmgmt.msc"])
         except:
@@ -3208,7 +3656,6 @@ class OverviewPage(QWidget):
     
     def _open_disk_cleanup(self):
         """Open Disk Cleanup"""
-        import subprocess
         try:
             subprocess.Popen(["cleanmgr"])
         except:
@@ -3216,7 +3663,6 @@ class OverviewPage(QWidget):
     
     def _open_windows_update(self):
         """Open Windows Update settings"""
-        import subprocess
         try:
             subprocess.Popen(["cmd", "/c", "start", "ms-settings:windowsupdate"],
                            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
@@ -3262,12 +3708,7 @@ class ModulePage(QWidget):
         header = QHBoxLayout()
         
         title = QLabel(self.title_text)
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         
         header.addStretch()
@@ -3440,7 +3881,7 @@ class ModulePage(QWidget):
 
 class DriverScanWorker(QObject):
     """Worker to scan drivers in background thread"""
-    finished = pyqtSignal(list, list)  # drivers, problems
+    finished = pyqtSignal(object, object)  # drivers, problems lists
     
     def __init__(self, scanner):
         super().__init__()
@@ -3448,16 +3889,18 @@ class DriverScanWorker(QObject):
     
     def run(self):
         try:
+            # Both queries spend their time in separate PowerShell processes,
+            # so run them side by side instead of back to back
+            problems_future = submit_to_pool(self.scanner.scan_problem_devices)
             drivers = self.scanner.scan_installed_drivers()
-            problems = self.scanner.scan_problem_devices()
-            self.finished.emit(drivers, problems)
+            self.finished.emit(drivers, problems_future.result())
         except Exception as e:
             self.finished.emit([], [])
 
 
 class UnusedDriverScanWorker(QObject):
     """Worker to scan for unused drivers in background thread"""
-    finished = pyqtSignal(list)  # unused drivers
+    finished = pyqtSignal(object)  # unused drivers
     
     def __init__(self, scanner):
         super().__init__()
@@ -3473,7 +3916,7 @@ class UnusedDriverScanWorker(QObject):
 
 class DriverUpdateCheckWorker(QObject):
     """Worker to check for driver updates in background thread"""
-    finished = pyqtSignal(list)  # available updates
+    finished = pyqtSignal(object)  # available updates
     
     def __init__(self, scanner):
         super().__init__()
@@ -3493,15 +3936,22 @@ class DriversPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scanner = DriverScanner()
-        self.online_checker = OnlineDriverChecker()
+        self._online_checker: OnlineDriverChecker | None = None  # Built on first use
         self.drivers = []
         self.unused_drivers = []
         self.available_updates = []
         self.problem_devices = []
-        self._threads = []
+        self._busy_ops: set[str] = set()  # Scans in flight; repeat clicks are ignored
         self._cached_vendors = None  # Cache for hardware vendor detection
         self.setup_ui()
     
+    @property
+    def online_checker(self) -> OnlineDriverChecker:
+        """Online lookup backend, created only when an online check is needed"""
+        if self._online_checker is None:
+            self._online_checker = OnlineDriverChecker()
+        return self._online_checker
+    
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(32, 28, 32, 28)
@@ -3512,12 +3962,7 @@ class DriversPage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Driver Manager")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -3546,7 +3991,7 @@ class DriversPage(QWidget):
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, tid=tab_id: self._switch_tab(tid))
-            btn.setStyleSheet(self._get_tab_style(False))
+            btn.setStyleSheet(tab_button_style(Theme.ACCENT))
             self.tabs[tab_id] = btn
             tab_bar.addWidget(btn)
         
@@ -3555,7 +4000,7 @@ class DriversPage(QWidget):
         
         # Select first tab by default
         self.tabs["installed"].setChecked(True)
-        self.tabs["installed"].setStyleSheet(self._get_tab_style(True))
+        set_style_state(self.tabs["installed"], "active")
         self.current_tab = "installed"
         
         # Content stack for different tabs (with smooth transitions)
@@ -3603,42 +4048,15 @@ class DriversPage(QWidget):
         # Show placeholder
         self._show_installed_placeholder()
     
-    def _get_tab_style(self, is_active: bool) -> str:
-        if is_active:
-            return f"""
-                QPushButton {{
-                    background: {Theme.BG_CARD};
-                    color: {Theme.TEXT_PRIMARY};
-                    border: none;
-                    border-bottom: 2px solid {Theme.ACCENT};
-                    padding: 12px 24px;
-                    font-size: 13px;
-                    font-weight: 600;
-                }}
-            """
-        else:
-            return f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {Theme.TEXT_SECONDARY};
-                    border: none;
-                    border-bottom: 2px solid transparent;
-                    padding: 12px 24px;
-                    font-size: 13px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    color: {Theme.TEXT_PRIMARY};
-                    background: {Theme.BG_CARD};
-                }}
-            """
-    
     def _switch_tab(self, tab_id: str):
-        # Update tab styles
+        # Update tab styles; the sheet is only replaced if the accent changed
+        style = tab_button_style(Theme.ACCENT)
         for tid, btn in self.tabs.items():
             is_active = tid == tab_id
             btn.setChecked(is_active)
-            btn.setStyleSheet(self._get_tab_style(is_active))
+            if btn.styleSheet() != style:
+                btn.setStyleSheet(style)
+            set_style_state(btn, "active" if is_active else "")
         
         self.current_tab = tab_id
         
@@ -3729,6 +4147,10 @@ class DriversPage(QWidget):
     
     def _scan_installed_drivers(self):
         """Scan installed drivers in background"""
+        if "installed" in self._busy_ops:
+            return
+        self._busy_ops.add("installed")
+        
         self._clear_layout(self.installed_layout)
         
         # Loading indicator
@@ -3749,19 +4171,15 @@ class DriversPage(QWidget):
         self.installed_layout.insertWidget(0, loading_frame)
         
         # Run scan in background
-        self._driver_scan_thread = QThread(self)
         self._driver_scan_worker = DriverScanWorker(self.scanner)
-        self._driver_scan_worker.moveToThread(self._driver_scan_thread)
-        
-        self._driver_scan_thread.started.connect(self._driver_scan_worker.run)
         self._driver_scan_worker.finished.connect(self._on_installed_scan_complete)
-        self._driver_scan_worker.finished.connect(self._driver_scan_thread.quit)
         self._driver_scan_worker.finished.connect(self._driver_scan_worker.deleteLater)
         
-        self._driver_scan_thread.start()
+        start_worker(self._driver_scan_worker)
     
     def _on_installed_scan_complete(self, drivers: list, problems: list):
         """Handle installed drivers scan complete"""
+        self._busy_ops.discard("installed")
         self.drivers = drivers
         self.problem_devices = problems
         self._clear_layout(self.installed_layout)
@@ -3782,7 +4200,6 @@ class DriversPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(stats_frame, blur_radius=10, offset_y=2, opacity=40)
         
         stats_layout = QHBoxLayout(stats_frame)
         stats_layout.setContentsMargins(24, 20, 24, 20)
@@ -3810,24 +4227,18 @@ class DriversPage(QWidget):
         self.installed_layout.insertWidget(self.installed_layout.count() - 1, stats_frame)
         
         # Group drivers by category
-        categories = {}
+        categories = defaultdict(list)
         for driver in drivers:
-            cat = driver.device_class or "Other"
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(driver)
+            categories[driver.device_class or "Other"].append(driver)
+        
+        # Hold repaints until every category section is in place
+        self.installed_content.setUpdatesEnabled(False)
         
         # Add driver categories
         for category, cat_drivers in sorted(categories.items()):
             # Category header
             header = QLabel(f"{category} ({len(cat_drivers)})")
-            header.setStyleSheet(f"""
-                background: transparent;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 14px;
-                font-weight: 600;
-                padding: 12px 0 4px 0;
-            """)
+            header.setObjectName("categoryHeader")
             self.installed_layout.insertWidget(self.installed_layout.count() - 1, header)
             
             # Drivers container
@@ -3878,6 +4289,7 @@ class DriversPage(QWidget):
         rescan_layout.addStretch()
         
         self.installed_layout.insertWidget(self.installed_layout.count() - 1, rescan_frame)
+        self.installed_content.setUpdatesEnabled(True)
     
     # =========================================================================
     # CLEANUP TAB
@@ -3885,6 +4297,10 @@ class DriversPage(QWidget):
     
     def _load_cleanup_data(self):
         """Load unused drivers data"""
+        if "cleanup" in self._busy_ops:
+            return
+        self._busy_ops.add("cleanup")
+        
         self._clear_layout(self.cleanup_layout)
         
         # Loading indicator
@@ -3905,20 +4321,17 @@ class DriversPage(QWidget):
         self.cleanup_layout.insertWidget(0, loading_frame)
         
         # Run scan in background
-        self._unused_scan_thread = QThread(self)
         self._unused_scan_worker = UnusedDriverScanWorker(self.scanner)
-        self._unused_scan_worker.moveToThread(self._unused_scan_thread)
-        
-        self._unused_scan_thread.started.connect(self._unused_scan_worker.run)
         self._unused_scan_worker.finished.connect(self._on_unused_scan_complete)
-        self._unused_scan_worker.finished.connect(self._unused_scan_thread.quit)
         self._unused_scan_worker.finished.connect(self._unused_scan_worker.deleteLater)
         
-        self._unused_scan_thread.start()
+        start_worker(self._unused_scan_worker)
     
     def _on_unused_scan_complete(self, unused: list):
         """Handle unused drivers scan complete"""
+        self._busy_ops.discard("cleanup")
         self.unused_drivers = unused
+        self.cleanup_content.setUpdatesEnabled(False)
         self._clear_layout(self.cleanup_layout)
         
         # Info card
@@ -3959,10 +4372,8 @@ class DriversPage(QWidget):
             clean_layout.setContentsMargins(24, 24, 24, 24)
             clean_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
-            check_icon = QLabel("✓")
-            check_icon.setStyleSheet(f"background: transparent; color: {Theme.SUCCESS}; font-size: 36px; font-weight: bold;")
-            check_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            clean_layout.addWidget(check_icon)
+            check_icon = status_icon_label("check", Theme.SUCCESS, 48)
+            clean_layout.addWidget(check_icon, 0, Qt.AlignmentFlag.AlignCenter)
             
             clean_title = QLabel("Your Driver Store is Clean!")
             clean_title.setStyleSheet(f"""
@@ -4069,11 +4480,10 @@ class DriversPage(QWidget):
         rescan_layout.addStretch()
         
         self.cleanup_layout.insertWidget(self.cleanup_layout.count() - 1, rescan_frame)
+        self.cleanup_content.setUpdatesEnabled(True)
     
     def _remove_driver(self, driver: dict):
         """Remove a driver from the driver store"""
-        from PyQt6.QtWidgets import QMessageBox
-        
         driver_inf = driver.get('driver', '')
         driver_name = driver.get('name', driver_inf)
         
@@ -4206,9 +4616,6 @@ class DriversPage(QWidget):
         
         # Fallback: Direct PowerShell queries (slower, but works without prior scan)
         try:
-            import json
-            import subprocess
-            
             # Check GPU vendors from display adapters
             gpu_cmd = """
             Get-CimInstance Win32_VideoController | Select-Object Name, AdapterCompatibility | ConvertTo-Json
@@ -4625,6 +5032,10 @@ class DriversPage(QWidget):
     
     def _check_windows_update_drivers(self):
         """Check Windows Update for driver updates"""
+        if "updates" in self._busy_ops:
+            return
+        self._busy_ops.add("updates")
+        
         # Clear previous results
         while self.wu_results_layout.count():
             item = self.wu_results_layout.takeAt(0)
@@ -4639,19 +5050,19 @@ class DriversPage(QWidget):
         self.wu_results_layout.addWidget(loading_label)
         
         # Run in background
-        self._wu_check_thread = QThread(self)
         self._wu_check_worker = DriverUpdateCheckWorker(self.scanner)
-        self._wu_check_worker.moveToThread(self._wu_check_thread)
-        
-        self._wu_check_thread.started.connect(self._wu_check_worker.run)
         self._wu_check_worker.finished.connect(self._on_wu_check_complete)
-        self._wu_check_worker.finished.connect(self._wu_check_thread.quit)
         self._wu_check_worker.finished.connect(self._wu_check_worker.deleteLater)
         
-        self._wu_check_thread.start()
+        start_worker(self._wu_check_worker)
     
     def _on_wu_check_complete(self, updates: list):
         """Handle Windows Update check complete"""
+        self._busy_ops.discard("updates")
+        
+        # Hold repaints while the loading label is swapped for the results
+        self.wu_results_container.setUpdatesEnabled(False)
+        
         # Clear loading
         while self.wu_results_layout.count():
             item = self.wu_results_layout.takeAt(0)
@@ -4706,6 +5117,8 @@ class DriversPage(QWidget):
             install_layout.addStretch()
             
             self.wu_results_layout.addWidget(install_frame)
+        
+        self.wu_results_container.setUpdatesEnabled(True)
     
     # =========================================================================
     # HELPER METHODS
@@ -4723,23 +5136,11 @@ class DriversPage(QWidget):
         val_label = QLabel(value)
         val_label.setObjectName("stat_value")
         actual_color = color or Theme.TEXT_PRIMARY
-        val_label.setStyleSheet(f"""
-            background: transparent;
-            color: {actual_color};
-            font-size: 24px;
-            font-weight: 700;
-        """)
+        val_label.setStyleSheet(stat_value_style(actual_color))
         layout.addWidget(val_label)
         
         name_label = QLabel(label)
-        name_label.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        name_label.setStyleSheet(STAT_LABEL_STYLE)
         layout.addWidget(name_label)
         
         return frame
@@ -4756,8 +5157,6 @@ class DriversPage(QWidget):
     
     def _fix_driver(self, driver):
         """Open Device Manager to fix a problematic driver"""
-        from PyQt6.QtWidgets import QMessageBox
-        
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setWindowTitle("Fix Driver")
@@ -4816,10 +5215,15 @@ class AppSettings:
         "show_notifications": True,
     }
     
+    # Refreshing the accent restyles the whole window, so a burst of changes
+    # (e.g. wheel-scrolling the accent dropdown) is applied once at the end
+    ACCENT_REFRESH_DELAY_MS = 50
+    
     def __init__(self):
         self.config_dir = Path.home() / ".healthchecker"
         self.config_file = self.config_dir / "settings.json"
         self.settings = self.load()
+        self._accent_timer: QTimer | None = None  # Created on first accent change
     
     def load(self) -> dict:
         """Load settings from file or return defaults"""
@@ -4851,18 +5255,28 @@ class AppSettings:
         # Notify listeners of change
         if key == "accent_color":
             apply_accent_color_from_settings()
-            # Trigger UI refresh if main window exists
-            from PyQt6.QtWidgets import QApplication
-            app = QApplication.instance()
-            if app:
-                for widget in app.topLevelWidgets():
-                    if hasattr(widget, 'refresh_accent_colors'):
-                        widget.refresh_accent_colors()
+            if self._accent_timer is None:
+                self._accent_timer = QTimer()
+                self._accent_timer.setSingleShot(True)
+                self._accent_timer.setInterval(self.ACCENT_REFRESH_DELAY_MS)
+                self._accent_timer.timeout.connect(self._refresh_accent_widgets)
+            self._accent_timer.start()  # Restarts the wait on each change
+    
+    def _refresh_accent_widgets(self):
+        """Trigger UI refresh if main window exists"""
+        app = QApplication.instance()
+        if app:
+            for widget in app.topLevelWidgets():
+                if hasattr(widget, 'refresh_accent_colors'):
+                    widget.refresh_accent_colors()
 
 
 # Global settings instance
 app_settings = AppSettings()
 
+# How long a "No" to the elevation prompt is remembered across launches
+ADMIN_PROMPT_SNOOZE_SECONDS = 3600
+
 
 def apply_accent_color_from_settings():
     """Apply the saved accent color to the Theme class"""
@@ -4894,6 +5308,8 @@ class StartupPage(QWidget):
         self.item_widgets = []
         self.loaded = False  # Track if data has been loaded
         self.current_filter = "all"  # all, enabled, disabled
+        self._enabled_count = 0  # Kept in step with toggles, see _update_summary_counts
+        self._high_impact_count = 0
         self.setup_ui()
     
     def setup_ui(self):
@@ -4911,12 +5327,7 @@ class StartupPage(QWidget):
         header.setSpacing(12)
         
         title = QLabel("Startup Programs")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -4970,7 +5381,6 @@ class StartupPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(self.stats_frame, blur_radius=10, offset_y=2, opacity=40)
         
         stats_layout = QHBoxLayout(self.stats_frame)
         stats_layout.setContentsMargins(24, 20, 24, 20)
@@ -5044,38 +5454,12 @@ class StartupPage(QWidget):
     
     def _update_filter_styles(self):
         """Update filter button styles based on current selection"""
+        # The sheet is only replaced if the accent changed
+        style = filter_button_style(Theme.ACCENT, Theme.ACCENT_HOVER)
         for filter_id, btn in self.filter_buttons.items():
-            if filter_id == self.current_filter:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: {Theme.ACCENT};
-                        color: white;
-                        border: none;
-                        padding: 10px 24px;
-                        border-radius: {Theme.RADIUS_SM}px;
-                        font-size: 13px;
-                        font-weight: 600;
-                    }}
-                    QPushButton:hover {{
-                        background: {Theme.ACCENT_HOVER};
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background: {Theme.BG_CARD};
-                        color: {Theme.TEXT_SECONDARY};
-                        border: 1px solid {Theme.BORDER};
-                        padding: 10px 24px;
-                        border-radius: {Theme.RADIUS_SM}px;
-                        font-size: 13px;
-                        font-weight: 500;
-                    }}
-                    QPushButton:hover {{
-                        background: {Theme.BG_CARD_HOVER};
-                        color: {Theme.TEXT_PRIMARY};
-                    }}
-                """)
+            if btn.styleSheet() != style:
+                btn.setStyleSheet(style)
+            set_style_state(btn, "active" if filter_id == self.current_filter else "")
     
     def _set_filter(self, filter_id: str):
         """Set the current filter and refresh the display"""
@@ -5097,23 +5481,11 @@ class StartupPage(QWidget):
         val_label = QLabel(value)
         val_label.setObjectName("stat_value")
         actual_color = color or Theme.TEXT_PRIMARY
-        val_label.setStyleSheet(f"""
-            background: transparent;
-            color: {actual_color};
-            font-size: 24px;
-            font-weight: 700;
-        """)
+        val_label.setStyleSheet(stat_value_style(actual_color))
         layout.addWidget(val_label)
         
         name_label = QLabel(label)
-        name_label.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        name_label.setStyleSheet(STAT_LABEL_STYLE)
         layout.addWidget(name_label)
         
         return frame
@@ -5132,16 +5504,11 @@ class StartupPage(QWidget):
         self.status_label.setVisible(True)
         
         # Run scan in background thread
-        self._thread = QThread(self)
         self._worker = StartupScanWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_startup_scan_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def display_cached_data(self, items: list):
         """Display startup items from cached data (from full scan)"""
@@ -5196,6 +5563,9 @@ class StartupPage(QWidget):
             else:
                 by_impact["Not measured"].append(item)
         
+        # Hold repaints until every row is in place
+        self.items_list.setUpdatesEnabled(False)
+        
         # Add items grouped by impact
         row_idx = 0
         for impact_level in ["High", "Medium", "Low", "Not measured"]:
@@ -5231,12 +5601,13 @@ class StartupPage(QWidget):
                 )
                 
                 row_idx += 1
+        
+        self.items_list.setUpdatesEnabled(True)
     
     def _toggle_startup_item(self, item: dict, row_widget):
         """Toggle a startup item's enabled/disabled state"""
         try:
             from startup_scanner import toggle_startup_item
-            from PyQt6.QtWidgets import QMessageBox
             
             name = item["name"]
             source_path = item.get("source_path", "")
@@ -5265,8 +5636,12 @@ class StartupPage(QWidget):
                 success, message = toggle_startup_item(name, source_path, new_state)
                 
                 if success:
-                    # Update the item's state
+                    # Update the item's state and the cached summary counts
                     item["enabled"] = new_state
+                    delta = 1 if new_state else -1
+                    self._enabled_count += delta
+                    if item.get("impact") == "High":
+                        self._high_impact_count += delta
                     
                     # Show success message
                     QMessageBox.information(
@@ -5277,7 +5652,7 @@ class StartupPage(QWidget):
                     )
                     
                     # Refresh the count in the summary and redisplay items
-                    self._update_summary_counts()
+                    self._show_summary_counts()
                     self._display_items()
                 else:
                     QMessageBox.warning(
@@ -5297,24 +5672,24 @@ class StartupPage(QWidget):
             self._open_task_manager_startup(item.get("name", ""))
     
     def _update_summary_counts(self):
-        """Update the summary stats with current enable/disable counts"""
+        """Recount enabled/high-impact items after a scan and update the summary"""
+        enabled = [item for item in self.startup_items if item.get("enabled", False)]
+        self._enabled_count = len(enabled)
+        self._high_impact_count = sum(1 for item in enabled if item.get("impact") == "High")
+        self._show_summary_counts()
+    
+    def _show_summary_counts(self):
+        """Update the summary stats from the cached counts"""
         try:
-            enabled = sum(1 for item in self.startup_items if item.get("enabled", False))
-            disabled = len(self.startup_items) - enabled
-            high_impact = sum(1 for item in self.startup_items if item.get("enabled", False) and item.get("impact") == "High")
-            
             self._update_stat(self.stat_total, str(len(self.startup_items)))
-            self._update_stat(self.stat_enabled, str(enabled))
-            self._update_stat(self.stat_disabled, str(disabled))
-            self._update_stat(self.stat_high_impact, str(high_impact))
+            self._update_stat(self.stat_enabled, str(self._enabled_count))
+            self._update_stat(self.stat_disabled, str(len(self.startup_items) - self._enabled_count))
+            self._update_stat(self.stat_high_impact, str(self._high_impact_count))
         except Exception:
             pass
     
     def _open_task_manager_startup(self, item_name: str = ""):
         """Open Task Manager to the Startup tab with helpful message"""
-        import subprocess
-        from PyQt6.QtWidgets import QMessageBox
-        
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setWindowTitle("Use Task Manager")
@@ -5339,7 +5714,6 @@ class StartupPage(QWidget):
     
     def open_task_manager(self):
         """Open Windows Task Manager to the Startup tab"""
-        import subprocess
         try:
             # Open Task Manager - on Windows 10/11 it opens to last viewed tab
             # We can't directly open to Startup tab, but user can navigate there
@@ -5377,12 +5751,7 @@ class EventsPage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Event Log Analysis")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -5431,7 +5800,6 @@ class EventsPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(self.stats_frame, blur_radius=10, offset_y=2, opacity=40)
         stats_layout = QHBoxLayout(self.stats_frame)
         stats_layout.setContentsMargins(24, 20, 24, 20)
         stats_layout.setSpacing(0)
@@ -5495,23 +5863,11 @@ class EventsPage(QWidget):
         value_label = QLabel(value)
         value_label.setObjectName("stat_value")
         value_color = color or Theme.TEXT_PRIMARY
-        value_label.setStyleSheet(f"""
-            background: transparent;
-            color: {value_color};
-            font-size: 24px;
-            font-weight: 700;
-        """)
+        value_label.setStyleSheet(stat_value_style(value_color))
         layout.addWidget(value_label)
         
         text_label = QLabel(label)
-        text_label.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        text_label.setStyleSheet(STAT_LABEL_STYLE)
         layout.addWidget(text_label)
         
         return frame
@@ -5585,9 +5941,6 @@ class EventsPage(QWidget):
             
             $output | ConvertTo-Json -Depth 4
             """
-            import subprocess
-            import json
-            
             result = subprocess.run(
                 ["powershell", "-NoProfile", "-WindowStyle", "Hidden", "-ExecutionPolicy", "Bypass", "-Command", command],
                 capture_output=True,
@@ -5857,7 +6210,6 @@ class EventsPage(QWidget):
     
     def _open_event_viewer(self):
         """Open Windows Event Viewer"""
-        import subprocess
         try:
             subprocess.Popen(["eventvwr.msc"], shell=True)
         except Exception as e:
@@ -5865,11 +6217,6 @@ class EventsPage(QWidget):
     
     def _export_event_log(self):
         """Export recent error events to a file"""
-        import subprocess
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        from pathlib import Path
-        from datetime import datetime
-        
         default_name = f"event_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -5967,20 +6314,23 @@ class AudioOscilloscope(QFrame):
     
     def _update_demo_waveform(self):
         """Generate demo sine wave visualization"""
-        import math
         self._demo_phase += 0.15
         
+        amplitude = self.amplitude
+        sin = math.sin
+        noise = random.random
+        step = math.pi * 4 / 256.0
+        
         # Create a composite waveform
         for i in range(256):
-            t = i / 256.0 * math.pi * 4 + self._demo_phase
+            t = i * step + self._demo_phase
             # Main wave + harmonics
-            value = math.sin(t) * 0.6
-            value += math.sin(t * 2) * 0.25 * self.amplitude
-            value += math.sin(t * 3) * 0.15 * self.amplitude
+            value = sin(t) * 0.6
+            value += sin(t * 2) * 0.25 * amplitude
+            value += sin(t * 3) * 0.15 * amplitude
             # Add some noise for realism
-            import random
-            value += (random.random() - 0.5) * 0.1 * self.amplitude
-            self.sample_data[i] = value * self.amplitude
+            value += (noise() - 0.5) * 0.1 * amplitude
+            self.sample_data[i] = value * amplitude
         
         self.update()
     
@@ -6009,14 +6359,14 @@ class AudioOscilloscope(QFrame):
         
         # Draw title
         painter.setPen(QColor(Theme.TEXT_SECONDARY))
-        painter.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
+        painter.setFont(ui_font(11, QFont.Weight.DemiBold))
         painter.drawText(padding, padding + 16, "Audio Waveform")
         
         # Status indicator
         status_text = "ACTIVE" if self.is_active else "INACTIVE"
         status_color = Theme.SUCCESS if self.is_active else Theme.TEXT_TERTIARY
         painter.setPen(QColor(status_color))
-        painter.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        painter.setFont(ui_font(10, QFont.Weight.Bold))
         status_width = painter.fontMetrics().horizontalAdvance(status_text)
         painter.drawText(self.width() - padding - status_width, padding + 16, status_text)
         
@@ -6067,7 +6417,7 @@ class AudioOscilloscope(QFrame):
             
             # Draw "No Signal" text
             painter.setPen(QColor(Theme.TEXT_TERTIARY))
-            painter.setFont(QFont("Segoe UI", 12))
+            painter.setFont(ui_font(12))
             text = "No Signal"
             text_width = painter.fontMetrics().horizontalAdvance(text)
             painter.drawText(graph_left + (graph_width - text_width) // 2, center_y + 5, text)
@@ -6201,7 +6551,7 @@ class AudioDeviceCard(QFrame):
 
 class AudioTestWorker(QObject):
     """Background worker for audio testing"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     progress = pyqtSignal(str)
     
     def __init__(self, test_type: str = "all"):
@@ -6209,7 +6559,6 @@ class AudioTestWorker(QObject):
         self.test_type = test_type
     
     def run(self):
-        import subprocess
         try:
             # Get audio devices using PowerShell
             command = '''
@@ -6328,12 +6677,7 @@ class AudioPage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Audio Devices")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -6418,7 +6762,17 @@ class AudioPage(QWidget):
         amp_layout.addWidget(amp_label)
         
         self.amp_value = QLabel("OFF")
-        self.amp_value.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 18px; font-weight: 600;")
+        self.amp_value.setStyleSheet(f"""
+            QLabel {{
+                background: transparent;
+                color: {Theme.TEXT_PRIMARY};
+                font-size: 18px;
+                font-weight: 600;
+            }}
+            QLabel[state="active"] {{
+                color: {Theme.SUCCESS};
+            }}
+        """)
         amp_layout.addWidget(self.amp_value)
         
         amp_btn_layout = QHBoxLayout()
@@ -6651,7 +7005,6 @@ class AudioPage(QWidget):
         
         # Background worker
         self._worker = None
-        self._thread = None
     
     def scan_devices(self):
         """Scan for audio devices"""
@@ -6660,16 +7013,11 @@ class AudioPage(QWidget):
         self.status_label.setText("Scanning audio devices...")
         self.status_label.setVisible(True)
         
-        self._thread = QThread(self)
         self._worker = AudioTestWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_scan_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def _on_scan_complete(self, data: dict):
         """Handle scan completion"""
@@ -6746,7 +7094,7 @@ class AudioPage(QWidget):
         self.start_scope_btn.setEnabled(False)
         self.stop_scope_btn.setEnabled(True)
         self.amp_value.setText("ACTIVE")
-        self.amp_value.setStyleSheet(f"background: transparent; color: {Theme.SUCCESS}; font-size: 18px; font-weight: 600;")
+        set_style_state(self.amp_value, "active")
     
     def _stop_oscilloscope(self):
         """Stop the oscilloscope"""
@@ -6754,7 +7102,7 @@ class AudioPage(QWidget):
         self.start_scope_btn.setEnabled(True)
         self.stop_scope_btn.setEnabled(False)
         self.amp_value.setText("OFF")
-        self.amp_value.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 18px; font-weight: 600;")
+        set_style_state(self.amp_value, "")
     
     def _set_frequency(self, freq: str):
         """Set oscilloscope frequency display"""
@@ -6771,7 +7119,6 @@ class AudioPage(QWidget):
     
     def _play_test_tone(self):
         """Play a test tone using Windows built-in beep"""
-        import subprocess
         try:
             # Use PowerShell to play a beep tone
             command = '''
@@ -6790,7 +7137,6 @@ class AudioPage(QWidget):
     
     def _play_channel_test(self, channel: str):
         """Play test tone for a specific channel"""
-        import subprocess
         try:
             freq = 440 if channel == "left" else 554
             command = f'[console]::beep({freq}, 1000)'
@@ -6803,7 +7149,6 @@ class AudioPage(QWidget):
     
     def _open_sound_settings(self):
         """Open Windows Sound Settings"""
-        import subprocess
         try:
             subprocess.Popen(["control", "mmsys.cpl", "sounds"])
         except Exception as e:
@@ -6822,7 +7167,6 @@ class WindowsUpdatePage(QWidget):
         self.update_data = {}
         self.widgets = []
         self.is_loading = False
-        self._thread = None
         self._worker = None
         self.setup_ui()
     
@@ -6841,12 +7185,7 @@ class WindowsUpdatePage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Windows Update")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -6917,7 +7256,6 @@ class WindowsUpdatePage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(self.stats_frame, blur_radius=10, offset_y=2, opacity=40)
         self.stats_frame.setVisible(False)
         stats_layout = QHBoxLayout(self.stats_frame)
         stats_layout.setContentsMargins(24, 20, 24, 20)
@@ -6953,8 +7291,7 @@ class WindowsUpdatePage(QWidget):
         reboot_layout = QHBoxLayout(self.reboot_banner)
         reboot_layout.setContentsMargins(16, 12, 16, 12)
         
-        reboot_icon = QLabel("⚠")
-        reboot_icon.setStyleSheet("background: transparent; color: #000; font-size: 16px;")
+        reboot_icon = status_icon_label("warning", "#000000", 20)
         reboot_layout.addWidget(reboot_icon)
         
         reboot_text = QLabel("A restart is required to complete the installation of updates")
@@ -7003,23 +7340,11 @@ class WindowsUpdatePage(QWidget):
         value_label = QLabel(value)
         value_label.setObjectName("stat_value")
         value_color = color or Theme.TEXT_PRIMARY
-        value_label.setStyleSheet(f"""
-            background: transparent;
-            color: {value_color};
-            font-size: 24px;
-            font-weight: 700;
-        """)
+        value_label.setStyleSheet(stat_value_style(value_color))
         layout.addWidget(value_label)
         
         text_label = QLabel(label)
-        text_label.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        text_label.setStyleSheet(STAT_LABEL_STYLE)
         layout.addWidget(text_label)
         
         return frame
@@ -7043,16 +7368,11 @@ class WindowsUpdatePage(QWidget):
         self.main_container.setVisible(False)
         
         # Run in background thread
-        self._thread = QThread(self)
         self._worker = WindowsUpdateDetailWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_check_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def _on_check_complete(self, data: dict):
         """Handle update check completion"""
@@ -7140,8 +7460,7 @@ class WindowsUpdatePage(QWidget):
             up_to_date_layout = QHBoxLayout(up_to_date)
             up_to_date_layout.setContentsMargins(16, 20, 16, 20)
             
-            check_icon = QLabel("✓")
-            check_icon.setStyleSheet(f"background: transparent; color: {Theme.SUCCESS}; font-size: 20px; font-weight: bold;")
+            check_icon = status_icon_label("check", Theme.SUCCESS, 28)
             up_to_date_layout.addWidget(check_icon)
             
             up_to_date_text = QLabel("Your device is up to date")
@@ -7369,7 +7688,6 @@ class WindowsUpdatePage(QWidget):
     
     def _open_windows_update(self):
         """Open Windows Update settings"""
-        import subprocess
         try:
             subprocess.Popen(["cmd", "/c", "start", "ms-settings:windowsupdate"], 
                            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
@@ -7379,7 +7697,7 @@ class WindowsUpdatePage(QWidget):
 
 class WindowsUpdateDetailWorker(QObject):
     """Worker to fetch detailed Windows Update info in background"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     
     def run(self):
         try:
@@ -7403,7 +7721,6 @@ class StoragePage(QWidget):
         self.storage_data = {}
         self.widgets = []
         self.is_loading = False
-        self._thread = None
         self._worker = None
         self.setup_ui()
     
@@ -7422,12 +7739,7 @@ class StoragePage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Storage Health")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -7514,7 +7826,6 @@ class StoragePage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(self.stats_frame, blur_radius=10, offset_y=2, opacity=40)
         self.stats_frame.setVisible(False)
         stats_layout = QHBoxLayout(self.stats_frame)
         stats_layout.setContentsMargins(24, 20, 24, 20)
@@ -7577,23 +7888,11 @@ class StoragePage(QWidget):
         
         value_label = QLabel(value)
         value_label.setObjectName("stat_value")
-        value_label.setStyleSheet(f"""
-            background: transparent;
-            color: {color};
-            font-size: 24px;
-            font-weight: 700;
-        """)
-        layout.addWidget(value_label)
-        
-        text_label = QLabel(label)
-        text_label.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        value_label.setStyleSheet(stat_value_style(color))
+        layout.addWidget(value_label)
+        
+        text_label = QLabel(label)
+        text_label.setStyleSheet(STAT_LABEL_STYLE)
         layout.addWidget(text_label)
         
         return frame
@@ -7617,16 +7916,11 @@ class StoragePage(QWidget):
         self.main_container.setVisible(False)
         
         # Run in background thread
-        self._thread = QThread(self)
         self._worker = StorageDetailWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_scan_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def _on_scan_complete(self, data: dict):
         """Handle storage scan completion"""
@@ -7991,7 +8285,6 @@ class StoragePage(QWidget):
     
     def _open_disk_cleanup(self):
         """Open Windows Disk Cleanup"""
-        import subprocess
         try:
             subprocess.Popen(["cleanmgr"], creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
         except Exception as e:
@@ -7999,7 +8292,6 @@ class StoragePage(QWidget):
     
     def _open_storage_settings(self):
         """Open Windows Storage Settings"""
-        import subprocess
         try:
             subprocess.Popen(["cmd", "/c", "start", "ms-settings:storagesense"], 
                            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
@@ -8008,7 +8300,6 @@ class StoragePage(QWidget):
     
     def _clear_temp_files(self):
         """Clear temporary files"""
-        import subprocess
         try:
             # Use cleanmgr with temp files preset
             subprocess.Popen(["cmd", "/c", "start", "ms-settings:storagesense"], 
@@ -8018,7 +8309,6 @@ class StoragePage(QWidget):
     
     def _empty_recycle_bin(self):
         """Empty the recycle bin"""
-        from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self,
             "Empty Recycle Bin",
@@ -8028,7 +8318,6 @@ class StoragePage(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            import subprocess
             try:
                 subprocess.run(
                     ["powershell", "-NoProfile", "-WindowStyle", "Hidden", "-Command", "Clear-RecycleBin -Force -ErrorAction SilentlyContinue"],
@@ -8041,8 +8330,6 @@ class StoragePage(QWidget):
     
     def _open_downloads(self):
         """Open the Downloads folder"""
-        import subprocess
-        import os
         downloads_path = os.path.join(os.path.expanduser("~"), "Downloads")
         try:
             subprocess.Popen(["explorer", downloads_path])
@@ -8052,7 +8339,7 @@ class StoragePage(QWidget):
 
 class StorageDetailWorker(QObject):
     """Worker to fetch detailed storage info in background"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     
     def run(self):
         try:
@@ -8070,7 +8357,7 @@ class StorageDetailWorker(QObject):
 
 class FirewallRulesWorker(QObject):
     """Worker to fetch firewall rules in background"""
-    finished = pyqtSignal(list)
+    finished = pyqtSignal(object)
     
     def run(self):
         try:
@@ -8084,7 +8371,7 @@ class FirewallRulesWorker(QObject):
 
 class FirewallStatusWorker(QObject):
     """Worker to fetch firewall status in background"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     
     def run(self):
         try:
@@ -8104,9 +8391,7 @@ class SecurityPage(QWidget):
         self.cached_defender_data = {}
         self.cached_firewall_status = {}
         self.cached_firewall_rules = []
-        self._thread = None
         self._worker = None
-        self._active_threads = []  # Keep references to prevent GC
         self.setup_ui()
     
     def setup_ui(self):
@@ -8119,12 +8404,7 @@ class SecurityPage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Security Status")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -8166,7 +8446,7 @@ class SecurityPage(QWidget):
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, tid=tab_id: self._switch_tab(tid))
-            btn.setStyleSheet(self._get_tab_style(False))
+            btn.setStyleSheet(tab_button_style(Theme.ACCENT))
             self.tabs[tab_id] = btn
             tab_bar.addWidget(btn)
         
@@ -8175,7 +8455,7 @@ class SecurityPage(QWidget):
         
         # Select first tab by default
         self.tabs["defender"].setChecked(True)
-        self.tabs["defender"].setStyleSheet(self._get_tab_style(True))
+        set_style_state(self.tabs["defender"], "active")
         self.current_tab = "defender"
         
         # Content stack for different tabs (with smooth transitions)
@@ -8223,42 +8503,15 @@ class SecurityPage(QWidget):
         # Show placeholder
         self._show_placeholder("Click 'Open Windows Security' or run a full system scan to see security status")
     
-    def _get_tab_style(self, is_active: bool) -> str:
-        if is_active:
-            return f"""
-                QPushButton {{
-                    background: {Theme.BG_CARD};
-                    color: {Theme.TEXT_PRIMARY};
-                    border: none;
-                    border-bottom: 2px solid {Theme.ACCENT};
-                    padding: 12px 24px;
-                    font-size: 13px;
-                    font-weight: 600;
-                }}
-            """
-        else:
-            return f"""
-                QPushButton {{
-                    background: transparent;
-                    color: {Theme.TEXT_SECONDARY};
-                    border: none;
-                    border-bottom: 2px solid transparent;
-                    padding: 12px 24px;
-                    font-size: 13px;
-                    font-weight: 500;
-                }}
-                QPushButton:hover {{
-                    color: {Theme.TEXT_PRIMARY};
-                    background: {Theme.BG_CARD};
-                }}
-            """
-    
     def _switch_tab(self, tab_id: str):
-        # Update tab styles
+        # Update tab styles; the sheet is only replaced if the accent changed
+        style = tab_button_style(Theme.ACCENT)
         for tid, btn in self.tabs.items():
             is_active = tid == tab_id
             btn.setChecked(is_active)
-            btn.setStyleSheet(self._get_tab_style(is_active))
+            if btn.styleSheet() != style:
+                btn.setStyleSheet(style)
+            set_style_state(btn, "active" if is_active else "")
         
         self.current_tab = tab_id
         
@@ -8458,18 +8711,11 @@ class SecurityPage(QWidget):
         self.firewall_layout.insertWidget(0, loading)
         
         # Run in background
-        self._fw_status_thread = QThread(self)
         self._fw_status_worker = FirewallStatusWorker()
-        self._fw_status_worker.moveToThread(self._fw_status_thread)
-        self._active_threads.append(self._fw_status_thread)  # Prevent GC
-        
-        self._fw_status_thread.started.connect(self._fw_status_worker.run)
         self._fw_status_worker.finished.connect(self._on_firewall_status_loaded)
-        self._fw_status_worker.finished.connect(self._fw_status_thread.quit)
         self._fw_status_worker.finished.connect(self._fw_status_worker.deleteLater)
-        self._fw_status_thread.finished.connect(lambda: self._cleanup_thread(self._fw_status_thread))
         
-        self._fw_status_thread.start()
+        start_worker(self._fw_status_worker)
     
     def _on_firewall_status_loaded(self, status: dict):
         """Handle firewall status load complete"""
@@ -8619,22 +8865,23 @@ class SecurityPage(QWidget):
         self.rules_layout.insertWidget(0, loading)
         
         # Run in background
-        self._fw_rules_thread = QThread(self)
         self._fw_rules_worker = FirewallRulesWorker()
-        self._fw_rules_worker.moveToThread(self._fw_rules_thread)
-        self._active_threads.append(self._fw_rules_thread)  # Prevent GC
-        
-        self._fw_rules_thread.started.connect(self._fw_rules_worker.run)
         self._fw_rules_worker.finished.connect(self._on_firewall_rules_loaded)
-        self._fw_rules_worker.finished.connect(self._fw_rules_thread.quit)
         self._fw_rules_worker.finished.connect(self._fw_rules_worker.deleteLater)
-        self._fw_rules_thread.finished.connect(lambda: self._cleanup_thread(self._fw_rules_thread))
         
-        self._fw_rules_thread.start()
+        start_worker(self._fw_rules_worker)
     
     def _on_firewall_rules_loaded(self, rules: list):
         """Handle firewall rules load complete"""
         self.cached_firewall_rules = rules
+        
+        # Hold repaints until every rule section is in place
+        self.rules_content.setUpdatesEnabled(False)
+        self._show_firewall_rules(rules)
+        self.rules_content.setUpdatesEnabled(True)
+    
+    def _show_firewall_rules(self, rules: list):
+        """Build the inbound/outbound rule lists"""
         self._clear_layout(self.rules_layout)
         
         if not rules:
@@ -8665,13 +8912,7 @@ class SecurityPage(QWidget):
         # Inbound section
         if inbound_rules:
             header = QLabel(f"Inbound Rules ({len(inbound_rules)})")
-            header.setStyleSheet(f"""
-                background: transparent;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 14px;
-                font-weight: 600;
-                padding: 8px 0;
-            """)
+            header.setObjectName("sectionHeader")
             self.rules_layout.insertWidget(self.rules_layout.count() - 1, header)
             
             container = ModernListContainer()
@@ -8682,13 +8923,7 @@ class SecurityPage(QWidget):
         # Outbound section
         if outbound_rules:
             header = QLabel(f"Outbound Rules ({len(outbound_rules)})")
-            header.setStyleSheet(f"""
-                background: transparent;
-                color: {Theme.TEXT_PRIMARY};
-                font-size: 14px;
-                font-weight: 600;
-                padding: 8px 0;
-            """)
+            header.setObjectName("sectionHeader")
             self.rules_layout.insertWidget(self.rules_layout.count() - 1, header)
             
             container = ModernListContainer()
@@ -8712,7 +8947,6 @@ class SecurityPage(QWidget):
             subtitle_parts.append(f"Port {local_port}")
         if program and program != 'Any':
             # Just show the filename
-            import os
             program_name = os.path.basename(program) if '\\' in program else program
             if len(program_name) > 40:
                 program_name = program_name[:37] + "..."
@@ -8731,11 +8965,6 @@ class SecurityPage(QWidget):
             status_text=status_text
         )
     
-    def _cleanup_thread(self, thread: QThread):
-        """Safely remove thread from active list after it finishes"""
-        if thread in self._active_threads:
-            self._active_threads.remove(thread)
-    
     def _open_windows_security(self):
         """Open Windows Security app"""
         subprocess.Popen(["start", "windowsdefender:"], shell=True)
@@ -8782,12 +9011,40 @@ class SecurityPage(QWidget):
 class SystemPage(QWidget):
     """Dedicated page for system files, services, and configuration"""
     
+    # Service grid styles, formatted once rather than for every service row
+    _SERVICE_ROW_STYLE = f"""
+        QFrame {{
+            background: {Theme.BG_ELEVATED};
+            border-radius: {Theme.RADIUS_SM}px;
+            padding: 0px;
+        }}
+    """
+    _SERVICE_NAME_STYLE = f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 12px;"
+    # service status (None = anything else) -> (dot color, status pill style)
+    _SERVICE_STATUS_LOOK = {
+        status: (
+            color,
+            f"""
+                background: {color}22;
+                color: {color};
+                font-size: 10px;
+                font-weight: 600;
+                padding: 3px 8px;
+                border-radius: 4px;
+            """,
+        )
+        for status, color in (
+            ("Running", Theme.SUCCESS),
+            ("Stopped", Theme.ERROR),
+            (None, Theme.WARNING),
+        )
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.system_data = {}
         self.widgets = []
         self.is_loading = False
-        self._thread = None
         self._worker = None
         self.setup_ui()
     
@@ -8806,12 +9063,7 @@ class SystemPage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("System Files & Configuration")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -8877,8 +9129,7 @@ class SystemPage(QWidget):
         banner_layout = QHBoxLayout(self.reboot_banner)
         banner_layout.setContentsMargins(16, 12, 16, 12)
         
-        banner_icon = QLabel("⚠️")
-        banner_icon.setStyleSheet("background: transparent; font-size: 18px;")
+        banner_icon = status_icon_label("warning", Theme.WARNING, 24)
         banner_layout.addWidget(banner_icon)
         
         self.reboot_text = QLabel("System restart required to complete pending operations")
@@ -8903,7 +9154,6 @@ class SystemPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(self.info_card, blur_radius=12, offset_y=3, opacity=50)
         self.info_card.setVisible(False)
         info_layout = QVBoxLayout(self.info_card)
         info_layout.setContentsMargins(24, 20, 24, 20)
@@ -8950,16 +9200,11 @@ class SystemPage(QWidget):
         self.info_card.setVisible(False)
         
         # Run in background thread
-        self._thread = QThread(self)
         self._worker = SystemDetailWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_scan_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def _on_scan_complete(self, data: dict):
         """Handle system scan completion"""
@@ -9083,7 +9328,6 @@ class SystemPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(card, blur_radius=12, offset_y=3, opacity=50)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -9119,54 +9363,27 @@ class SystemPage(QWidget):
             name = svc.get('DisplayName', svc.get('Name', 'Unknown'))
             status = svc.get('Status', 'Unknown')
             
+            dot_color, pill_style = self._SERVICE_STATUS_LOOK.get(status, self._SERVICE_STATUS_LOOK[None])
+            
             # Create a compact service row widget
             row_widget = QFrame()
-            row_widget.setStyleSheet(f"""
-                QFrame {{
-                    background: {Theme.BG_ELEVATED};
-                    border-radius: {Theme.RADIUS_SM}px;
-                    padding: 0px;
-                }}
-            """)
+            row_widget.setStyleSheet(self._SERVICE_ROW_STYLE)
             row_layout = QHBoxLayout(row_widget)
             row_layout.setContentsMargins(12, 8, 12, 8)
             row_layout.setSpacing(10)
             
             # Status dot
-            dot = QLabel("●")
-            if status == 'Running':
-                dot.setStyleSheet(f"background: transparent; color: {Theme.SUCCESS}; font-size: 10px;")
-            elif status == 'Stopped':
-                dot.setStyleSheet(f"background: transparent; color: {Theme.ERROR}; font-size: 10px;")
-            else:
-                dot.setStyleSheet(f"background: transparent; color: {Theme.WARNING}; font-size: 10px;")
+            dot = status_icon_label("dot", dot_color, 7)
             row_layout.addWidget(dot)
             
             # Service name (truncated if needed)
             name_label = QLabel(name[:30] + "..." if len(name) > 30 else name)
-            name_label.setStyleSheet(f"background: transparent; color: {Theme.TEXT_PRIMARY}; font-size: 12px;")
+            name_label.setStyleSheet(self._SERVICE_NAME_STYLE)
             row_layout.addWidget(name_label, 1)
             
             # Status pill
             status_pill = QLabel(status)
-            if status == 'Running':
-                pill_bg = f"{Theme.SUCCESS}22"
-                pill_color = Theme.SUCCESS
-            elif status == 'Stopped':
-                pill_bg = f"{Theme.ERROR}22"
-                pill_color = Theme.ERROR
-            else:
-                pill_bg = f"{Theme.WARNING}22"
-                pill_color = Theme.WARNING
-            
-            status_pill.setStyleSheet(f"""
-                background: {pill_bg};
-                color: {pill_color};
-                font-size: 10px;
-                font-weight: 600;
-                padding: 3px 8px;
-                border-radius: 4px;
-            """)
+            status_pill.setStyleSheet(pill_style)
             row_layout.addWidget(status_pill)
             
             # Add to grid (2 columns)
@@ -9186,7 +9403,6 @@ class SystemPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(card, blur_radius=12, offset_y=3, opacity=50)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -9337,7 +9553,6 @@ class SystemPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(card, blur_radius=12, offset_y=3, opacity=50)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -9481,7 +9696,6 @@ class SystemPage(QWidget):
                 border-radius: {Theme.RADIUS_MD}px;
             }}
         """)
-        Theme.apply_shadow(card, blur_radius=12, offset_y=3, opacity=50)
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -9578,7 +9792,6 @@ class SystemPage(QWidget):
     
     def _run_sfc_scan(self):
         """Run SFC /scannow in an elevated terminal"""
-        import subprocess
         try:
             subprocess.Popen(
                 ['powershell', '-Command',
@@ -9590,7 +9803,6 @@ class SystemPage(QWidget):
     
     def _run_dism_repair(self):
         """Run DISM repair commands in an elevated terminal"""
-        import subprocess
         try:
             dism_cmd = 'DISM /Online /Cleanup-Image /RestoreHealth && pause'
             subprocess.Popen(
@@ -9603,7 +9815,6 @@ class SystemPage(QWidget):
     
     def _open_system_protection(self):
         """Open System Protection dialog"""
-        import subprocess
         try:
             subprocess.Popen(["SystemPropertiesProtection"])
         except:
@@ -9611,7 +9822,6 @@ class SystemPage(QWidget):
     
     def _open_programs_features(self):
         """Open Programs and Features"""
-        import subprocess
         try:
             subprocess.Popen(["cmd", "/c", "start", "ms-settings:appsfeatures"],
                            creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0)
@@ -9620,7 +9830,6 @@ class SystemPage(QWidget):
     
     def _open_system_properties(self):
         """Open System Properties"""
-        import subprocess
         try:
             subprocess.Popen(["SystemPropertiesAdvanced"])
         except:
@@ -9628,7 +9837,6 @@ class SystemPage(QWidget):
     
     def _open_device_manager(self):
         """Open Device Manager"""
-        import subprocess
         try:
             subprocess.Popen(["devmgmt.msc"])
         except:
@@ -9636,7 +9844,6 @@ class SystemPage(QWidget):
     
     def _open_task_manager(self):
         """Open Task Manager"""
-        import subprocess
         try:
             subprocess.Popen(["taskmgr"])
         except:
@@ -9644,7 +9851,6 @@ class SystemPage(QWidget):
     
     def _open_event_viewer(self):
         """Open Event Viewer"""
-        import subprocess
         try:
             subprocess.Popen(["eventvwr.msc"])
         except:
@@ -9652,7 +9858,6 @@ class SystemPage(QWidget):
     
     def _open_services(self):
         """Open Services"""
-        import subprocess
         try:
             subprocess.Popen(["services.msc"])
         except:
@@ -9660,7 +9865,6 @@ class SystemPage(QWidget):
     
     def _open_env_vars(self):
         """Open Environment Variables"""
-        import subprocess
         try:
             subprocess.Popen(["SystemPropertiesAdvanced"])
         except:
@@ -9669,7 +9873,7 @@ class SystemPage(QWidget):
 
 class SystemDetailWorker(QObject):
     """Worker to fetch detailed system info in background"""
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     
     def run(self):
         try:
@@ -9688,12 +9892,22 @@ class SystemDetailWorker(QObject):
 class RealtimeGraph(QFrame):
     """Real-time line graph widget for displaying utilization metrics"""
     
+    # Paint colors, parsed once instead of on every metrics tick
+    _TITLE_COLOR = QColor(Theme.TEXT_SECONDARY)
+    _GRAPH_BG_COLOR = QColor(Theme.BG_CARD_HOVER)
+    _GRID_PEN = QPen(QColor(Theme.BORDER), 1)
+    
     def __init__(self, title: str, color: str | None = None, max_points: int = 60, parent=None):
         super().__init__(parent)
         self.title_text = title
         self.graph_color = color or Theme.ACCENT
+        self._line_color = QColor(self.graph_color)
+        self._line_pen = QPen(self._line_color, 2)
+        fill_color = QColor(self._line_color)
+        fill_color.setAlpha(30)
+        self._fill_brush = QBrush(fill_color)
         self.max_points = max_points
-        self.data_points = [0.0] * max_points
+        self.data_points = deque([0.0] * max_points, maxlen=max_points)
         self.current_value = 0.0
         self.setFixedHeight(100)
         self.setMinimumWidth(200)
@@ -9711,9 +9925,7 @@ class RealtimeGraph(QFrame):
     def add_value(self, value: float):
         """Add a new data point (0-100)"""
         self.current_value = max(0, min(100, value))
-        self.data_points.append(self.current_value)
-        if len(self.data_points) > self.max_points:
-            self.data_points.pop(0)
+        self.data_points.append(self.current_value)  # Oldest point falls off
         self.update()
     
     def paintEvent(self, event):
@@ -9730,63 +9942,51 @@ class RealtimeGraph(QFrame):
         graph_height = self.height() - graph_top - padding
         
         # Draw title and current value
-        painter.setPen(QColor(Theme.TEXT_SECONDARY))
-        painter.setFont(QFont("Segoe UI", 10))
+        painter.setPen(self._TITLE_COLOR)
+        painter.setFont(ui_font(10))
         painter.drawText(padding, padding + 14, self.title_text)
         
         # Current value on right
         value_text = f"{self.current_value:.0f}%"
-        painter.setPen(QColor(self.graph_color))
-        painter.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
+        painter.setPen(self._line_color)
+        painter.setFont(ui_font(11, QFont.Weight.Bold))
         value_width = painter.fontMetrics().horizontalAdvance(value_text)
         painter.drawText(self.width() - padding - value_width, padding + 14, value_text)
         
         # Draw graph background
-        graph_bg = QColor(Theme.BG_CARD_HOVER)
-        painter.fillRect(graph_left, graph_top, graph_width, graph_height, graph_bg)
+        painter.fillRect(graph_left, graph_top, graph_width, graph_height, self._GRAPH_BG_COLOR)
         
         # Draw grid lines (horizontal)
-        painter.setPen(QPen(QColor(Theme.BORDER), 1))
+        painter.setPen(self._GRID_PEN)
         for i in range(1, 4):
             y = graph_top + (graph_height * i // 4)
             painter.drawLine(graph_left, y, graph_left + graph_width, y)
         
         # Draw data line
         if len(self.data_points) > 1:
-            # Create gradient fill
-            gradient_color = QColor(self.graph_color)
-            gradient_color.setAlpha(30)
-            
-            # Build path for filled area
-            path = QPainterPath()
+            # Map every sample to a point once; fill and line share them
             point_spacing = graph_width / (self.max_points - 1)
+            graph_bottom = graph_top + graph_height
+            scale = graph_height / 100.0
+            points = [
+                QPointF(graph_left + i * point_spacing, graph_bottom - value * scale)
+                for i, value in enumerate(self.data_points)
+            ]
             
-            # Start at bottom left
-            first_x = graph_left
-            first_y = graph_top + graph_height - (self.data_points[0] / 100.0 * graph_height)
-            path.moveTo(graph_left, graph_top + graph_height)
-            path.lineTo(first_x, first_y)
-            
-            for i, value in enumerate(self.data_points[1:], 1):
-                x = graph_left + (i * point_spacing)
-                y = graph_top + graph_height - (value / 100.0 * graph_height)
-                path.lineTo(x, y)
-            
-            # Close path at bottom
-            path.lineTo(graph_left + graph_width, graph_top + graph_height)
+            # Filled area: the line closed along the bottom edge
+            path = QPainterPath()
+            path.addPolygon(QPolygonF(
+                [QPointF(graph_left, graph_bottom)] + points
+                + [QPointF(graph_left + graph_width, graph_bottom)]
+            ))
             path.closeSubpath()
             
             # Fill gradient
-            painter.fillPath(path, QBrush(gradient_color))
+            painter.fillPath(path, self._fill_brush)
             
-            # Draw line on top
-            painter.setPen(QPen(QColor(self.graph_color), 2))
-            for i in range(len(self.data_points) - 1):
-                x1 = graph_left + (i * point_spacing)
-                y1 = graph_top + graph_height - (self.data_points[i] / 100.0 * graph_height)
-                x2 = graph_left + ((i + 1) * point_spacing)
-                y2 = graph_top + graph_height - (self.data_points[i + 1] / 100.0 * graph_height)
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+            # Draw line on top in a single call
+            painter.setPen(self._line_pen)
+            painter.drawPolyline(QPolygonF(points))
 
 
 class RealtimeGraphPanel(QFrame):
@@ -9839,6 +10039,39 @@ class RealtimeGraphPanel(QFrame):
 class HardwareInfoCard(QFrame):
     """Compact card for displaying hardware category information"""
     title_clicked = pyqtSignal(str)  # Emits card_id when title is clicked
+    
+    # Status chip rules, selected per refresh with set_style_state
+    _CHIP_STYLE = f"""
+        QLabel {{
+            background: {Theme.BG_CARD_HOVER};
+            color: {Theme.TEXT_SECONDARY};
+            padding: 2px 10px;
+            border-radius: 10px;
+            font-size: 10px;
+            font-weight: 600;
+        }}
+        QLabel[state="ok"] {{
+            background: {Theme.SUCCESS_BG};
+            color: {Theme.SUCCESS};
+        }}
+        QLabel[state="warn"] {{
+            background: {Theme.WARNING_BG};
+            color: {Theme.WARNING};
+        }}
+        QLabel[state="err"] {{
+            background: {Theme.ERROR_BG};
+            color: {Theme.ERROR};
+        }}
+    """
+    
+    # status -> (chip state, default text)
+    _CHIP_STATES = {
+        "healthy": ("ok", "OK"),
+        "check": ("ok", "OK"),
+        "warning": ("warn", "Warning"),
+        "critical": ("err", "Critical"),
+        "error": ("err", "Critical"),
+    }
 
     def __init__(self, title: str, icon_char: str, card_id: str = "", parent=None):
         super().__init__(parent)
@@ -9848,8 +10081,6 @@ class HardwareInfoCard(QFrame):
         self.is_expanded = True
         self.info_rows = []
         self.setup_ui()
-        # Apply card shadow per UI spec section 14.6
-        Theme.apply_card_shadow(self)
 
     def setup_ui(self):
         self.setStyleSheet(f"""
@@ -9907,14 +10138,8 @@ class HardwareInfoCard(QFrame):
         header.addStretch()        # Status chip
         self.status_chip = QLabel("OK")
         self.status_chip.setFixedHeight(22)
-        self.status_chip.setStyleSheet(f"""
-            background: {Theme.SUCCESS_BG};
-            color: {Theme.SUCCESS};
-            padding: 2px 10px;
-            border-radius: 10px;
-            font-size: 10px;
-            font-weight: 600;
-        """)
+        self.status_chip.setProperty("state", "ok")
+        self.status_chip.setStyleSheet(self._CHIP_STYLE)
         header.addWidget(self.status_chip)
         
         # Expand/collapse chevron
@@ -9942,37 +10167,9 @@ class HardwareInfoCard(QFrame):
 
     def set_status(self, status: str, text: str = ""):
         """Set the status chip"""
-        # Common style base - note the fixed height is set on widget itself
-        base_style = "padding: 2px 10px; border-radius: 10px; font-size: 10px; font-weight: 600;"
-        
-        if status == "healthy" or status == "check":
-            self.status_chip.setStyleSheet(f"""
-                background: {Theme.SUCCESS_BG};
-                color: {Theme.SUCCESS};
-                {base_style}
-            """)
-            self.status_chip.setText(text or "OK")
-        elif status == "warning":
-            self.status_chip.setStyleSheet(f"""
-                background: {Theme.WARNING_BG};
-                color: {Theme.WARNING};
-                {base_style}
-            """)
-            self.status_chip.setText(text or "Warning")
-        elif status == "critical" or status == "error":
-            self.status_chip.setStyleSheet(f"""
-                background: {Theme.ERROR_BG};
-                color: {Theme.ERROR};
-                {base_style}
-            """)
-            self.status_chip.setText(text or "Critical")
-        else:
-            self.status_chip.setStyleSheet(f"""
-                background: {Theme.BG_CARD_HOVER};
-                color: {Theme.TEXT_SECONDARY};
-                {base_style}
-            """)
-            self.status_chip.setText(text or "Unknown")
+        state, default_text = self._CHIP_STATES.get(status, ("unknown", "Unknown"))
+        set_style_state(self.status_chip, state)
+        self.status_chip.setText(text or default_text)
     
     def clear_info(self):
         """Clear all info rows"""
@@ -10039,8 +10236,6 @@ class HardwareDetailCard(QFrame):
         self.is_expanded = True
         self.info_rows = []
         self.setup_ui()
-        # Apply card shadow per UI spec section 14.6
-        Theme.apply_card_shadow(self)
     
     def setup_ui(self):
         # Use object name for more reliable stylesheet targeting
@@ -10117,16 +10312,38 @@ class HardwareDetailCard(QFrame):
                 background: {Theme.BG_CARD};
                 border: none;
             }}
+            QLabel#infoLabel, QLabel#infoValue, QLabel#infoHighlight {{
+                background: transparent;
+                font-size: 12px;
+            }}
+            QLabel#infoLabel {{
+                color: {Theme.TEXT_TERTIARY};
+            }}
+            QLabel#infoHighlight {{
+                color: {Theme.ACCENT_LIGHT};
+            }}
+            QLabel#infoSection {{
+                background: transparent;
+                color: {self.accent_color};
+                font-size: 12px;
+                font-weight: 700;
+                margin-top: 8px;
+                margin-bottom: 4px;
+            }}
         """)
-        self.content_layout = QVBoxLayout(self.content)
+        # One grid lays out every row (label | value) and section header,
+        # instead of a nested layout and container widget per row
+        self.content_layout = QGridLayout(self.content)
         self.content_layout.setContentsMargins(20, 12, 20, 16)
-        self.content_layout.setSpacing(6)
+        self.content_layout.setHorizontalSpacing(16)
+        self.content_layout.setVerticalSpacing(10)
+        self.content_layout.setColumnStretch(1, 1)
+        self._next_row = 0
         
         self.main_layout.addWidget(self.content)
     
     def eventFilter(self, watched, event):
         """Handle header clicks via event filter"""
-        from PyQt6.QtCore import QEvent
         if watched == self.header and event is not None:
             if event.type() == QEvent.Type.MouseButtonPress:
                 self.setExpanded(not self.is_expanded)
@@ -10159,42 +10376,31 @@ class HardwareDetailCard(QFrame):
                 if widget:
                     widget.deleteLater()
         self.info_rows = []
+        self._next_row = 0  # QGridLayout.rowCount() never shrinks
     
     def add_section_header(self, title: str):
         """Add a section header"""
         label = QLabel(title)
-        label.setStyleSheet(f"""
-            background: transparent;
-            color: {self.accent_color};
-            font-size: 12px;
-            font-weight: 700;
-            margin-top: 8px;
-            margin-bottom: 4px;
-        """)
-        self.content_layout.addWidget(label)
+        label.setObjectName("infoSection")
+        self.content_layout.addWidget(label, self._next_row, 0, 1, 2)
+        self._next_row += 1
     
     def add_info_row(self, label: str, value: str, highlight: bool = False):
         """Add an info row with label and value"""
-        row = QHBoxLayout()
-        row.setSpacing(16)
-        row.setContentsMargins(0, 2, 0, 2)
-        
+        # Labels are styled by object name from the content sheet, so a card
+        # with dozens of rows does not parse a stylesheet per label
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"background: transparent; color: {Theme.TEXT_TERTIARY}; font-size: 12px;")
+        label_widget.setObjectName("infoLabel")
         label_widget.setFixedWidth(140)
-        row.addWidget(label_widget)
+        self.content_layout.addWidget(label_widget, self._next_row, 0)
         
-        value_color = Theme.ACCENT_LIGHT if highlight else Theme.TEXT_PRIMARY
         value_widget = QLabel(str(value) if value else "—")
-        value_widget.setStyleSheet(f"background: transparent; color: {value_color}; font-size: 12px;")
+        value_widget.setObjectName("infoHighlight" if highlight else "infoValue")
         value_widget.setWordWrap(True)
-        row.addWidget(value_widget, 1)
+        self.content_layout.addWidget(value_widget, self._next_row, 1)
         
-        container = QWidget()
-        container.setStyleSheet("background: transparent;")
-        container.setLayout(row)
-        self.content_layout.addWidget(container)
-        self.info_rows.append(container)
+        self._next_row += 1
+        self.info_rows.append((label_widget, value_widget))
     
     def set_count(self, count: int, unit: str = "items"):
         """Set the item count display"""
@@ -10217,8 +10423,6 @@ class HardwareSummaryGrid(QFrame):
                 border-radius: {Theme.RADIUS_LG}px;
             }}
         """)
-        # Shadow per spec section 14.6 - standard card shadow
-        Theme.apply_shadow(self, blur_radius=12, offset_y=3, opacity=60)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(24, 20, 24, 20)
@@ -10263,26 +10467,14 @@ class HardwareSummaryGrid(QFrame):
         
         # Label at top - uppercase, smaller
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_TERTIARY};
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        label_widget.setStyleSheet(STAT_LABEL_STYLE)
         label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label_widget)
         
         # Value - large and colored
         value_widget = QLabel(value)
         value_widget.setObjectName("value")
-        value_widget.setStyleSheet(f"""
-            background: transparent;
-            color: {color};
-            font-size: 28px;
-            font-weight: 700;
-        """)
+        value_widget.setStyleSheet(stat_value_style(color, 28))
         value_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(value_widget)
         
@@ -10336,12 +10528,7 @@ class HardwarePage(QWidget):
         header.setSpacing(16)
         
         title = QLabel("Hardware Information")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         header.addWidget(title)
         header.addStretch()
         
@@ -10519,7 +10706,6 @@ class HardwarePage(QWidget):
         
         # Background worker setup
         self._worker = None
-        self._thread = None
     
     def _setup_details_tab(self):
         """Setup the Full Details tab with expandable sections for each hardware component"""
@@ -10592,16 +10778,11 @@ class HardwarePage(QWidget):
         self.status_label.setVisible(True)
         
         # Run scan in background thread to avoid UI freeze
-        self._thread = QThread(self)
         self._worker = HardwareScanWorker()
-        self._worker.moveToThread(self._thread)
-        
-        self._thread.started.connect(self._worker.run)
         self._worker.finished.connect(self._on_hardware_scan_complete)
-        self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         
-        self._thread.start()
+        start_worker(self._worker)
     
     def display_cached_data(self, data: dict):
         """Display hardware info from cached data (from full scan)"""
@@ -11049,7 +11230,6 @@ class HardwarePage(QWidget):
     
     def open_device_manager(self):
         """Open Windows Device Manager"""
-        import subprocess
         try:
             subprocess.Popen(["mmc", "devmgmt.msc"], shell=True)
         except Exception as e:
@@ -11088,12 +11268,7 @@ class SettingsPage(QWidget):
         
         # Header
         title = QLabel("Settings")
-        title.setStyleSheet(f"""
-            background: transparent;
-            color: {Theme.TEXT_PRIMARY};
-            font-size: 28px;
-            font-weight: 600;
-        """)
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         
         # Appearance section
@@ -11275,8 +11450,6 @@ class SettingsPage(QWidget):
     
     def _create_dropdown(self, options: list, setting_key: str | None = None) -> QWidget:
         """Create a styled dropdown"""
-        from PyQt6.QtWidgets import QComboBox, QMessageBox
-        
         combo = QComboBox()
         combo.addItems(options)
         combo.setFixedWidth(120)
@@ -11331,7 +11504,6 @@ class SettingsPage(QWidget):
     
     def eventFilter(self, watched, event):
         """Handle toggle clicks via event filter"""
-        from PyQt6.QtCore import QEvent
         if event is not None and event.type() == QEvent.Type.MouseButtonPress:
             if isinstance(watched, QFrame) and watched.property("checked") is not None:
                 checked = not watched.property("checked")
@@ -11537,8 +11709,7 @@ class MainWindow(QMainWindow):
         self._resize_start_geo = None
         self.setMouseTracking(True)
         
-        # Initialize backends
-        self.scanner = DriverScanner()
+        # Initialize backends (driver scanning lives on DriversPage)
         self.health_checker = HealthChecker()
         self.disk_manager = DiskManager()
         
@@ -11554,7 +11725,8 @@ class MainWindow(QMainWindow):
             "last_scan": None,    # Timestamp of last full scan
         }
         
-        self._active_threads = []  # Track active threads to prevent GC crashes
+        # Page refreshes from the last full scan, run when the page is next shown
+        self._pending_page_fills: dict[str, Callable[[], None]] = {}
         
         self.setWindowTitle("Windows Health Checker Pro")
         # Per spec: Min 1100x720, Default 1280x800
@@ -11595,6 +11767,8 @@ class MainWindow(QMainWindow):
         
         # Content stack (with smooth page transitions)
         self.content_stack = AnimatedStackedWidget()
+        # Hold off layout/repaint of the stack until every page is in
+        self.content_stack.setUpdatesEnabled(False)
         
         # Create pages
         self.overview = OverviewPage()
@@ -11604,16 +11778,6 @@ class MainWindow(QMainWindow):
         
         self.pages: dict[str, QWidget] = {"overview": self.overview}
         
-        modules = [
-            # All module pages are now dedicated pages - no generic ModulePage needed
-            # Updates uses WindowsUpdatePage
-            # Storage uses StoragePage
-            # Security uses SecurityPage
-            # Hardware uses HardwarePage
-            # System uses SystemPage
-            # Events uses EventsPage
-        ]
-        
         # Map module IDs to check methods
         self.check_methods = {
             "updates": self.check_windows_updates,
@@ -11624,37 +11788,6 @@ class MainWindow(QMainWindow):
             "events": self.check_event_logs,
         }
         
-        # Add Windows Update page (comprehensive update management)
-        self.updates_page = WindowsUpdatePage()
-        self.pages["updates"] = self.updates_page
-        self.content_stack.addWidget(self.updates_page)
-        
-        # Add Storage page (comprehensive storage management)
-        self.storage_page = StoragePage()
-        self.pages["storage"] = self.storage_page
-        self.content_stack.addWidget(self.storage_page)
-        
-        # Add Security page (Defender, Firewall status, Firewall rules)
-        self.security_page = SecurityPage()
-        self.pages["security"] = self.security_page
-        self.content_stack.addWidget(self.security_page)
-        
-        # Add System page (comprehensive system configuration)
-        self.system_page = SystemPage()
-        self.pages["system"] = self.system_page
-        self.content_stack.addWidget(self.system_page)
-        
-        for module_id, title, icon in modules:
-            page = ModulePage(title, icon)
-            page.run_check_clicked.connect(lambda mid=module_id: self.run_module_check(mid))
-            self.pages[module_id] = page
-            self.content_stack.addWidget(page)
-        
-        # Add Hardware page (comprehensive hardware info)
-        self.hardware_page = HardwarePage()
-        self.pages["hardware"] = self.hardware_page
-        self.content_stack.addWidget(self.hardware_page)
-        
         # Add Drivers page
         self.drivers_page = DriversPage()
         self.pages["drivers"] = self.drivers_page
@@ -11665,22 +11798,23 @@ class MainWindow(QMainWindow):
         self.pages["startup"] = self.startup_page
         self.content_stack.addWidget(self.startup_page)
         
-        # Add Events page (dedicated event log analysis)
-        self.events_page = EventsPage()
-        self.pages["events"] = self.events_page
-        self.content_stack.addWidget(self.events_page)
-        
-        # Add Audio page (audio device testing with oscilloscope)
-        self.audio_page = AudioPage()
-        self.pages["audio"] = self.audio_page
-        self.content_stack.addWidget(self.audio_page)
-        
-        # Add Settings page
-        self.settings_page = SettingsPage()
-        self.pages["settings"] = self.settings_page
-        self.content_stack.addWidget(self.settings_page)
+        # Pages built on first visit rather than at startup (see _ensure_page):
+        # the module pages (Windows Update, Storage, Security incl. firewall,
+        # System, Hardware, Events), Audio (device testing with oscilloscope)
+        # and Settings
+        self._page_factories: dict[str, Callable[[], QWidget]] = {
+            "updates": lambda: self._build_page("updates_page", WindowsUpdatePage),
+            "storage": lambda: self._build_page("storage_page", StoragePage),
+            "security": lambda: self._build_page("security_page", SecurityPage),
+            "system": lambda: self._build_page("system_page", SystemPage),
+            "hardware": lambda: self._build_page("hardware_page", HardwarePage),
+            "events": lambda: self._build_page("events_page", EventsPage),
+            "audio": lambda: self._build_page("audio_page", AudioPage),
+            "settings": lambda: self._build_page("settings_page", SettingsPage),
+        }
         
         main_layout.addWidget(self.content_stack, 1)
+        self.content_stack.setUpdatesEnabled(True)
         
         # Status bar
         status_bar = self.statusBar()
@@ -11715,18 +11849,11 @@ class MainWindow(QMainWindow):
     
     def _prefetch_security(self):
         """Prefetch Defender/security status in background"""
-        self._prefetch_security_thread = QThread(self)
         self._prefetch_security_worker = SecurityCheckWorker(self.health_checker)
-        self._prefetch_security_worker.moveToThread(self._prefetch_security_thread)
-        self._active_threads.append(self._prefetch_security_thread)  # Prevent GC
-        
-        self._prefetch_security_thread.started.connect(self._prefetch_security_worker.run)
         self._prefetch_security_worker.finished.connect(self._on_prefetch_security_done)
-        self._prefetch_security_worker.finished.connect(self._prefetch_security_thread.quit)
         self._prefetch_security_worker.finished.connect(self._prefetch_security_worker.deleteLater)
-        self._prefetch_security_thread.finished.connect(lambda: self._cleanup_thread(self._prefetch_security_thread))
         
-        self._prefetch_security_thread.start()
+        start_worker(self._prefetch_security_worker)
     
     def _on_prefetch_security_done(self, result: dict):
         """Cache prefetched security data"""
@@ -11735,29 +11862,17 @@ class MainWindow(QMainWindow):
     
     def _prefetch_storage(self):
         """Prefetch storage/disk info in background"""
-        self._prefetch_storage_thread = QThread(self)
         self._prefetch_storage_worker = StorageCheckWorker(self.disk_manager)
-        self._prefetch_storage_worker.moveToThread(self._prefetch_storage_thread)
-        self._active_threads.append(self._prefetch_storage_thread)  # Prevent GC
-        
-        self._prefetch_storage_thread.started.connect(self._prefetch_storage_worker.run)
         self._prefetch_storage_worker.finished.connect(self._on_prefetch_storage_done)
-        self._prefetch_storage_worker.finished.connect(self._prefetch_storage_thread.quit)
         self._prefetch_storage_worker.finished.connect(self._prefetch_storage_worker.deleteLater)
-        self._prefetch_storage_thread.finished.connect(lambda: self._cleanup_thread(self._prefetch_storage_thread))
         
-        self._prefetch_storage_thread.start()
+        start_worker(self._prefetch_storage_worker)
     
     def _on_prefetch_storage_done(self, result: dict):
         """Cache prefetched storage data"""
         if result and 'Error' not in result:
             self.cached_data["storage"] = result
     
-    def _cleanup_thread(self, thread: QThread):
-        """Safely remove thread from active list after it finishes"""
-        if thread in self._active_threads:
-            self._active_threads.remove(thread)
-    
     def create_sidebar(self):
         sidebar = QFrame()
         sidebar.setFixedWidth(Theme.SIDEBAR_W)
@@ -11861,24 +11976,52 @@ class MainWindow(QMainWindow):
         self.current_nav = nav_id
         
         # Switch page
-        if nav_id in self.pages:
-            self.content_stack.setCurrentWidget(self.pages[nav_id])
+        page = self._ensure_page(nav_id)
+        if page is not None:
+            self._run_page_fill(nav_id)
+            self.content_stack.setCurrentWidget(page)
             
             # Auto-populate page with cached data if available and page hasn't been loaded
             self._auto_populate_page(nav_id)
     
+    def _ensure_page(self, nav_id: str) -> QWidget | None:
+        """Return the page for nav_id, building it on its first visit"""
+        page = self.pages.get(nav_id)
+        if page is None:
+            factory = self._page_factories.pop(nav_id, None)
+            if factory is None:
+                return None
+            page = factory()
+            self.pages[nav_id] = page
+            self.content_stack.addWidget(page)
+        return page
+    
+    def _build_page(self, attr: str, page_cls: type[QWidget]) -> QWidget:
+        """Construct a deferred page and store it under its usual attribute"""
+        page = page_cls()
+        setattr(self, attr, page)
+        return page
+    
+    def _run_page_fill(self, nav_id: str):
+        """Rebuild a page from the last full scan if that is still pending"""
+        fill = self._pending_page_fills.pop(nav_id, None)
+        if fill is not None:
+            fill()
+    
     def _auto_populate_page(self, nav_id: str):
         """Auto-populate a page with cached data if available"""
-        # Map navigation IDs to cache keys and pages
+        # Map navigation IDs to cache keys and display methods; pages are
+        # looked up by ID since deferred ones may not have been built yet
         cache_map = {
-            "startup": ("startup", self.startup_page, "display_cached_data"),
-            "events": ("events", self.events_page, None),  # Events page loads its own data
-            "hardware": ("hardware", self.hardware_page, "display_cached_data"),
-            "security": ("security", self.security_page, "display_defender_data"),
+            "startup": ("startup", "display_cached_data"),
+            "events": ("events", None),  # Events page loads its own data
+            "hardware": ("hardware", "display_cached_data"),
+            "security": ("security", "display_defender_data"),
         }
         
-        if nav_id in cache_map:
-            cache_key, page, method_name = cache_map[nav_id]
+        if nav_id in cache_map and nav_id in self.pages:
+            cache_key, method_name = cache_map[nav_id]
+            page = self.pages[nav_id]
             
             # Check if page has a 'loaded' attribute and if it's been loaded
             if hasattr(page, 'loaded') and page.loaded:
@@ -11897,8 +12040,6 @@ class MainWindow(QMainWindow):
     
     def refresh_accent_colors(self):
         """Refresh all UI elements that use the accent color"""
-        from PyQt6.QtWidgets import QPushButton
-        
         # Refresh sidebar items
         for nav_id, item in self.nav_items.items():
             item._update_style()
@@ -11976,28 +12117,26 @@ class MainWindow(QMainWindow):
         self.scan_dialog = dialog
         self.scan_results = {}  # Store results from each check
         self.scan_start_times = {}  # Track start time per task
-        self.scan_total_tasks = 7
+        self.scan_total_tasks = len(ScanProgressDialog.TASKS)
         self.scan_completed_tasks = 0
-        self.scan_start_time = time.time()
+        self.scan_start_time = time.monotonic()
+        self._scan_task_updates = []  # Completed rows not yet shown (see _flush_scan_updates)
         
-        # Define all tasks
-        task_ids = ["update", "defender", "smart", "memory", "events", "services", "sfc"]
+        task_ids = [task_id for task_id, _ in ScanProgressDialog.TASKS]
         
-        # Mark all as running and record start times
+        # Mark all as running; they are launched together so share one start time
         for task_id in task_ids:
-            self.scan_dialog.update_task(task_id, "running")
-            self.scan_start_times[task_id] = time.time()
-        
-        self.scan_dialog.set_progress(5, "Running all checks...")
+            self.scan_start_times[task_id] = self.scan_start_time
+        self.scan_dialog.update_tasks(
+            [(task_id, "running", None) for task_id in task_ids],
+            5, "Running all checks..."
+        )
         
-        # Start all scans in parallel (using QTimer to stagger slightly for UI)
-        QTimer.singleShot(10, self._scan_windows_updates)
-        QTimer.singleShot(20, self._scan_security)
-        QTimer.singleShot(30, self._scan_storage)
-        QTimer.singleShot(40, self._scan_hardware)
-        QTimer.singleShot(50, self._scan_events)
-        QTimer.singleShot(60, self._scan_system)
-        QTimer.singleShot(70, self._scan_startup)
+        # Start all scans in parallel; each only hands a worker to the pool
+        for start_scan in (self._scan_windows_updates, self._scan_security,
+                           self._scan_storage, self._scan_hardware, self._scan_events,
+                           self._scan_system, self._scan_startup):
+            start_scan()
     
     def _complete_scan_task(self, task_id: str, results: dict):
         """Called when a scan task completes - handles parallel completion"""
@@ -12006,42 +12145,43 @@ class MainWindow(QMainWindow):
         # Calculate elapsed time for this task
         elapsed_ms = None
         if task_id in self.scan_start_times:
-            elapsed_ms = (time.time() - self.scan_start_times[task_id]) * 1000
-        
-        # Mark task complete with timing
-        self.scan_dialog.update_task(task_id, "complete", time_ms=elapsed_ms)
+            elapsed_ms = (time.monotonic() - self.scan_start_times[task_id]) * 1000
         
         # Store results
         self.scan_results[task_id] = results
         self.scan_completed_tasks += 1
         
-        # Update progress
-        progress = int((self.scan_completed_tasks / self.scan_total_tasks) * 100)
-        remaining = self.scan_total_tasks - self.scan_completed_tasks
-        if remaining > 0:
-            self.scan_dialog.set_progress(progress, f"{remaining} checks remaining...")
-        else:
-            self.scan_dialog.set_progress(100, "Finalizing...")
+        # Mark task complete with timing; tasks finishing in the same event
+        # loop pass are shown together, followed by one progress update
+        if not self._scan_task_updates:
+            QTimer.singleShot(0, self._flush_scan_updates)
+        self._scan_task_updates.append((task_id, "complete", elapsed_ms))
         
         # Check if all tasks are done
         if self.scan_completed_tasks >= self.scan_total_tasks:
             QTimer.singleShot(200, self._finalize_scan)
     
+    def _flush_scan_updates(self):
+        """Show all task completions queued since the last flush in one repaint"""
+        updates, self._scan_task_updates = self._scan_task_updates, []
+        if not updates:
+            return
+        
+        progress = int((self.scan_completed_tasks / self.scan_total_tasks) * 100)
+        remaining = self.scan_total_tasks - self.scan_completed_tasks
+        if remaining > 0:
+            self.scan_dialog.update_tasks(updates, progress, f"{remaining} checks remaining...")
+        else:
+            self.scan_dialog.update_tasks(updates, 100, "Finalizing...")
+    
     def _scan_windows_updates(self):
         """Scan Windows Update status for full scan - runs in background thread"""
         # Create worker and thread
-        self._update_thread = QThread(self)
         self._update_worker = WindowsUpdateWorker(self.health_checker)
-        self._update_worker.moveToThread(self._update_thread)
-        
-        # Connect signals
-        self._update_thread.started.connect(self._update_worker.run)
         self._update_worker.finished.connect(self._on_update_scan_complete)
-        self._update_worker.finished.connect(self._update_thread.quit)
         self._update_worker.finished.connect(self._update_worker.deleteLater)
         
-        # Start the thread
-        self._update_thread.start()
+        start_worker(self._update_worker)
     
     def _on_update_scan_complete(self, update_info: dict):
         """Handle Windows Update scan completion"""
@@ -12063,18 +12203,11 @@ class MainWindow(QMainWindow):
     def _scan_security(self):
         """Scan security status for full scan - runs in background thread"""
         # Create worker and thread
-        self._security_thread = QThread(self)
         self._security_worker = SecurityCheckWorker(self.health_checker)
-        self._security_worker.moveToThread(self._security_thread)
-        
-        # Connect signals
-        self._security_thread.started.connect(self._security_worker.run)
         self._security_worker.finished.connect(self._on_security_scan_complete)
-        self._security_worker.finished.connect(self._security_thread.quit)
         self._security_worker.finished.connect(self._security_worker.deleteLater)
         
-        # Start the thread
-        self._security_thread.start()
+        start_worker(self._security_worker)
     
     def _on_security_scan_complete(self, defender: dict):
         """Handle security scan completion"""
@@ -12100,18 +12233,11 @@ class MainWindow(QMainWindow):
     def _scan_storage(self):
         """Scan storage health for full scan - runs in background thread"""
         # Create worker and thread
-        self._storage_thread = QThread(self)
         self._storage_worker = StorageCheckWorker(self.health_checker)
-        self._storage_worker.moveToThread(self._storage_thread)
-        
-        # Connect signals
-        self._storage_thread.started.connect(self._storage_worker.run)
         self._storage_worker.finished.connect(self._on_storage_scan_complete)
-        self._storage_worker.finished.connect(self._storage_thread.quit)
         self._storage_worker.finished.connect(self._storage_worker.deleteLater)
         
-        # Start the thread
-        self._storage_thread.start()
+        start_worker(self._storage_worker)
     
     def _on_storage_scan_complete(self, volume_info: list):
         """Handle storage scan completion"""
@@ -12145,18 +12271,11 @@ class MainWindow(QMainWindow):
     def _scan_hardware(self):
         """Scan hardware info for full scan - runs in background thread"""
         # Create worker and thread to avoid blocking UI
-        self._hardware_scan_thread = QThread(self)
         self._hardware_scan_worker = HardwareMemoryWorker()
-        self._hardware_scan_worker.moveToThread(self._hardware_scan_thread)
-        
-        # Connect signals
-        self._hardware_scan_thread.started.connect(self._hardware_scan_worker.run)
         self._hardware_scan_worker.finished.connect(self._on_hardware_scan_complete)
-        self._hardware_scan_worker.finished.connect(self._hardware_scan_thread.quit)
         self._hardware_scan_worker.finished.connect(self._hardware_scan_worker.deleteLater)
         
-        # Start the thread
-        self._hardware_scan_thread.start()
+        start_worker(self._hardware_scan_worker)
     
     def _on_hardware_scan_complete(self, hw_data: dict):
         """Handle hardware scan completion"""
@@ -12180,18 +12299,11 @@ class MainWindow(QMainWindow):
     def _scan_events(self):
         """Scan event logs for full scan - runs in background thread"""
         # Create worker and thread to avoid blocking UI
-        self._event_scan_thread = QThread(self)
         self._event_scan_worker = EventScanWorker()
-        self._event_scan_worker.moveToThread(self._event_scan_thread)
-        
-        # Connect signals
-        self._event_scan_thread.started.connect(self._event_scan_worker.run)
         self._event_scan_worker.finished.connect(self._on_event_scan_complete)
-        self._event_scan_worker.finished.connect(self._event_scan_thread.quit)
         self._event_scan_worker.finished.connect(self._event_scan_worker.deleteLater)
         
-        # Start the thread
-        self._event_scan_thread.start()
+        start_worker(self._event_scan_worker)
     
     def _on_event_scan_complete(self, event_data: dict):
         """Handle event scan completion"""
@@ -12232,18 +12344,11 @@ class MainWindow(QMainWindow):
     def _scan_startup(self):
         """Scan startup items for full scan - runs in background thread"""
         # Create worker and thread to avoid blocking UI
-        self._startup_scan_thread = QThread(self)
         self._startup_scan_worker = StartupScanWorker()
-        self._startup_scan_worker.moveToThread(self._startup_scan_thread)
-        
-        # Connect signals
-        self._startup_scan_thread.started.connect(self._startup_scan_worker.run)
         self._startup_scan_worker.finished.connect(self._on_startup_full_scan_complete)
-        self._startup_scan_worker.finished.connect(self._startup_scan_thread.quit)
         self._startup_scan_worker.finished.connect(self._startup_scan_worker.deleteLater)
         
-        # Start the thread
-        self._startup_scan_thread.start()
+        start_worker(self._startup_scan_worker)
     
     def _on_startup_full_scan_complete(self, startup_items: list):
         """Handle startup scan completion during full scan"""
@@ -12269,10 +12374,10 @@ class MainWindow(QMainWindow):
     
     def _finalize_scan(self):
         """Finalize the full scan and update all pages"""
-        import datetime
+        now = datetime.now()
         
         # Update timestamp
-        self.cached_data["last_scan"] = datetime.datetime.now()
+        self.cached_data["last_scan"] = now
         
         # Calculate overall health score
         total_checks = len(self.scan_results)
@@ -12332,30 +12437,16 @@ class MainWindow(QMainWindow):
             self.overview.startup_card.summary_label.setText(f"{enabled_count} enabled, {total_count - enabled_count} disabled")
             if enabled_count > 15:
                 self.overview.startup_card.status_chip.setText("Warning")
-                self.overview.startup_card.status_chip.setStyleSheet(f"""
-                    background: {Theme.WARNING_BG};
-                    color: {Theme.WARNING};
-                    font-size: 10px;
-                    font-weight: 600;
-                    padding: 3px 8px;
-                    border-radius: 4px;
-                """)
+                set_style_state(self.overview.startup_card.status_chip, "warn")
             else:
                 self.overview.startup_card.status_chip.setText("Healthy")
-                self.overview.startup_card.status_chip.setStyleSheet(f"""
-                    background: {Theme.SUCCESS_BG};
-                    color: {Theme.SUCCESS};
-                    font-size: 10px;
-                    font-weight: 600;
-                    padding: 3px 8px;
-                    border-radius: 4px;
-                """)
+                set_style_state(self.overview.startup_card.status_chip, "ok")
         
         # Add activity entry
         self.overview.add_activity(
             "success" if errors == 0 else "warning",
             f"Full scan completed - {passed} passed, {warnings} warnings, {errors} issues",
-            datetime.datetime.now().strftime("%I:%M %p")
+            f"{now:%I:%M %p}"
         )
         
         # Populate detail pages with cached data
@@ -12371,19 +12462,24 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(800, self.scan_dialog.accept)
     
     def _populate_pages_from_cache(self):
-        """Populate all detail pages with cached scan data"""
+        """Queue every detail page to be rebuilt from the cached scan data.
+        
+        Each page is rebuilt when it is next shown (see _run_page_fill) rather
+        than all at once, so a full scan only pays for the pages that are viewed.
+        """
+        fills = self._pending_page_fills
+        
         # Populate Startup page
         if self.cached_data.get("startup"):
-            self.startup_page.display_cached_data(self.cached_data["startup"])  # type: ignore[arg-type]
+            fills["startup"] = lambda data=self.cached_data["startup"]: self.startup_page.display_cached_data(data)  # type: ignore[arg-type]
         
         # Populate Events page with cached event data
         if self.cached_data.get("events"):
-            event_data = self.cached_data["events"]
-            self.events_page.display_cached_data(event_data)  # type: ignore[arg-type]
+            fills["events"] = lambda data=self.cached_data["events"]: self.events_page.display_cached_data(data)  # type: ignore[arg-type]
         
         # Populate System Files page - trigger detailed scan
         if self.scan_results.get("services"):
-            self.system_page.display_cached_data(self.scan_results.get("services"))  # type: ignore[arg-type]
+            fills["system"] = lambda data=self.scan_results["services"]: self.system_page.display_cached_data(data)  # type: ignore[arg-type]
         
         # Populate Drivers page - trigger a scan if not already done
         if not self.cached_data.get("drivers"):
@@ -12392,30 +12488,38 @@ class MainWindow(QMainWindow):
         
         # Populate Windows Update page - trigger detailed check
         if self.cached_data.get("updates"):
-            self.updates_page.display_cached_data(self.cached_data["updates"])  # type: ignore[arg-type]
+            fills["updates"] = lambda data=self.cached_data["updates"]: self.updates_page.display_cached_data(data)  # type: ignore[arg-type]
         
         # Populate Storage page with cached volume data
         if self.cached_data.get("storage"):
-            self.storage_page.display_cached_data(self.cached_data["storage"])  # type: ignore[arg-type]
+            fills["storage"] = lambda data=self.cached_data["storage"]: self.storage_page.display_cached_data(data)  # type: ignore[arg-type]
         
-        # Populate Security page with cached defender data
+        # Populate Security page with cached defender data; the page's own
+        # cache is set with it so _auto_populate_page doesn't show it again
         if self.cached_data.get("security"):
-            defender = self.cached_data["security"]
-            # Store in security page's cache and display
-            self.security_page.cached_defender_data = defender  # type: ignore[assignment]
-            self.security_page.display_defender_data(defender)  # type: ignore[arg-type]
+            fills["security"] = lambda data=self.cached_data["security"]: self._fill_security_page(data)
         
         if self.cached_data.get("hardware"):
-            hw_data = self.cached_data["hardware"]
-            self.hardware_page.display_cached_data(hw_data)  # type: ignore[arg-type]
+            fills["hardware"] = lambda data=self.cached_data["hardware"]: self.hardware_page.display_cached_data(data)  # type: ignore[arg-type]
+        
+        # The page on screen is refreshed right away
+        self._run_page_fill(self.current_nav)
         
         # Trigger audio device scan (runs in background)
         QTimer.singleShot(500, self._scan_audio_devices)
     
+    def _fill_security_page(self, defender: dict):
+        """Show full-scan Defender data on the Security page"""
+        self.security_page.cached_defender_data = defender  # type: ignore[assignment]
+        self.security_page.display_defender_data(defender)  # type: ignore[arg-type]
+    
     def _scan_audio_devices(self):
         """Scan audio devices in background after full scan"""
-        if hasattr(self, 'audio_page'):
+        if "audio" in self.pages:
             self.audio_page.scan_devices()
+        else:
+            # Replayed when the page is first opened
+            self._pending_page_fills["audio"] = self._scan_audio_devices
     
     def _update_scan(self):
         """Legacy method - no longer used but kept for compatibility"""
@@ -12455,7 +12559,6 @@ class MainWindow(QMainWindow):
     
     def _open_windows_update(self):
         """Open Windows Update settings"""
-        import subprocess
         try:
             subprocess.Popen(["ms-settings:windowsupdate"], shell=True)
         except Exception as e:
@@ -12463,7 +12566,6 @@ class MainWindow(QMainWindow):
     
     def _open_windows_security(self):
         """Open Windows Security app"""
-        import subprocess
         try:
             subprocess.Popen(["ms-settings:windowsdefender"], shell=True)
         except Exception as e:
@@ -12471,8 +12573,6 @@ class MainWindow(QMainWindow):
     
     def _update_defender_definitions(self):
         """Trigger Windows Defender definition update"""
-        import subprocess
-        from PyQt6.QtWidgets import QMessageBox
         try:
             # Run Update-MpSignature
             subprocess.Popen(
@@ -12490,8 +12590,6 @@ class MainWindow(QMainWindow):
     
     def _run_quick_scan(self):
         """Run Windows Defender quick scan"""
-        import subprocess
-        from PyQt6.QtWidgets import QMessageBox
         try:
             subprocess.Popen(
                 ['powershell', '-Command', 'Start-MpScan -ScanType QuickScan'],
@@ -12508,8 +12606,6 @@ class MainWindow(QMainWindow):
     
     def _trigger_update_check(self):
         """Trigger a Windows Update check"""
-        import subprocess
-        from PyQt6.QtWidgets import QMessageBox
         try:
             # Open Windows Update and trigger check
             subprocess.Popen(["ms-settings:windowsupdate-action"], shell=True)
@@ -12560,16 +12656,11 @@ class MainWindow(QMainWindow):
         self.security_page.set_checking()
         
         # Run check in background thread
-        self._security_thread = QThread(self)
         self._security_worker = SecurityCheckWorker(self.health_checker)
-        self._security_worker.moveToThread(self._security_thread)
-        
-        self._security_thread.started.connect(self._security_worker.run)
         self._security_worker.finished.connect(self._on_security_check_complete)
-        self._security_worker.finished.connect(self._security_thread.quit)
         self._security_worker.finished.connect(self._security_worker.deleteLater)
         
-        self._security_thread.start()
+        start_worker(self._security_worker)
     
     def _on_security_check_complete(self, defender: dict):
         """Handle completion of security check"""
@@ -12645,7 +12736,6 @@ class MainWindow(QMainWindow):
     def _run_sfc_scan(self):
         """Run SFC /scannow in an elevated terminal"""
         try:
-            import subprocess
             # Open elevated command prompt with SFC command
             subprocess.Popen(
                 ['powershell', '-Command', 
@@ -12667,7 +12757,6 @@ class MainWindow(QMainWindow):
     def _run_dism_repair(self):
         """Run DISM repair commands in an elevated terminal"""
         try:
-            import subprocess
             # Open elevated command prompt with DISM commands
             dism_cmd = 'DISM /Online /Cleanup-Image /RestoreHealth && pause'
             subprocess.Popen(
@@ -12682,6 +12771,7 @@ class MainWindow(QMainWindow):
     def check_event_logs(self):
         """Check Windows event logs - delegates to EventsPage"""
         # EventsPage handles its own scanning and display
+        self._ensure_page("events")
         self.events_page.load_events()
     
     def _get_resize_direction(self, pos):
@@ -12730,8 +12820,6 @@ class MainWindow(QMainWindow):
     
     def event(self, event):  # type: ignore[override]
         """Override event to handle cursor changes for resize zones"""
-        from PyQt6.QtCore import QEvent
-        
         # Handle hover/mouse move to update cursor for resize areas
         if event is not None and event.type() == QEvent.Type.HoverMove:
             if not self._resize_dir:  # Only update cursor when not actively resizing
@@ -12805,47 +12893,19 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):  # type: ignore[override]
         """Clean up all running threads before closing"""
-        # Helper to safely stop a thread
-        def stop_thread(thread_attr):
-            thread = getattr(self, thread_attr, None)
-            if thread is not None and thread.isRunning():
-                thread.quit()
-                if not thread.wait(1000):  # Wait up to 1 second
-                    thread.terminate()
-                    thread.wait(500)
-        
-        # Stop MainWindow threads
-        for attr in ['_update_thread', '_security_thread', '_storage_thread', '_startup_scan_thread']:
-            stop_thread(attr)
-        
-        # Stop page threads
-        pages_with_threads = [
-            ('drivers_page', ['_driver_scan_thread', '_unused_scan_thread']),
-            ('updates_page', ['_wu_check_thread']),
-            ('security_page', ['_fw_status_thread', '_fw_rules_thread', '_thread']),
-            ('hardware_page', ['_thread']),
-            ('storage_page', ['_thread']),
-            ('startup_page', ['_thread']),
-            ('events_page', ['_thread']),
-            ('audio_page', ['_thread']),
-            ('overview', ['_thread']),
-        ]
-        
-        for page_attr, thread_attrs in pages_with_threads:
-            page = getattr(self, page_attr, None)
-            if page:
-                for thread_attr in thread_attrs:
-                    thread = getattr(page, thread_attr, None)
-                    if thread is not None and hasattr(thread, 'isRunning') and thread.isRunning():
-                        thread.quit()
-                        if not thread.wait(500):
-                            thread.terminate()
-                            thread.wait(250)
-        
         # Stop the metrics collector in overview page
         if hasattr(self, 'overview') and hasattr(self.overview, 'metrics_collector'):
             self.overview.metrics_collector.stop()  # type: ignore[attr-defined]
         
+        # Drop queued workers and give running ones a moment to finish
+        pool = QThreadPool.globalInstance()
+        pool.clear()
+        if not pool.waitForDone(1000):
+            # A worker is still blocked in a PowerShell/WMI call. Close the
+            # window anyway; the process ends normally (settings and cache
+            # writes intact) once that call returns or hits its timeout.
+            print(f"Closing with {pool.activeThreadCount()} background task(s) still running")
+        
         if event is not None:
             event.accept()
 
@@ -12888,6 +12948,20 @@ def run_splash_process(pipe_conn):
     }
     
     class SplashWindow(QWidget):
+        # (indicator, name, status) stylesheets per task status, built once
+        TASK_STYLES = {
+            status: (
+                f"background: {color}; border-radius: 4px;",
+                f"background: transparent; color: {name_color}; font-size: 12px;",
+                f"background: transparent; color: {color}; font-size: 10px;",
+            )
+            for status, color, name_color in (
+                ("running", THEME['warning'], THEME['text_primary']),
+                ("complete", THEME['success'], THEME['success']),
+                ("error", THEME['error'], THEME['error']),
+            )
+        }
+        
         def __init__(self):
             super().__init__()
             self.setWindowFlags(
@@ -13092,27 +13166,28 @@ def run_splash_process(pipe_conn):
         
         def update_task(self, task_id: str, status: str, time_ms: float | None = None):
             """Update a task's status and time"""
-            if task_id in self.task_labels:
-                labels = self.task_labels[task_id]
-                if status == "running":
-                    labels["indicator"].setStyleSheet(f"background: {THEME['warning']}; border-radius: 4px;")
-                    labels["name"].setStyleSheet(f"background: transparent; color: {THEME['text_primary']}; font-size: 12px;")
-                    labels["status"].setText("...")
-                    labels["status"].setStyleSheet(f"background: transparent; color: {THEME['warning']}; font-size: 10px;")
-                elif status == "complete":
-                    labels["indicator"].setStyleSheet(f"background: {THEME['success']}; border-radius: 4px;")
-                    labels["name"].setStyleSheet(f"background: transparent; color: {THEME['success']}; font-size: 12px;")
-                    if time_ms is not None:
-                        if time_ms >= 1000:
-                            labels["status"].setText(f"{time_ms/1000:.1f}s")
-                        else:
-                            labels["status"].setText(f"{time_ms:.0f}ms")
-                        labels["status"].setStyleSheet(f"background: transparent; color: {THEME['success']}; font-size: 10px;")
-                elif status == "error":
-                    labels["indicator"].setStyleSheet(f"background: {THEME['error']}; border-radius: 4px;")
-                    labels["name"].setStyleSheet(f"background: transparent; color: {THEME['error']}; font-size: 12px;")
-                    labels["status"].setText("Error")
-                    labels["status"].setStyleSheet(f"background: transparent; color: {THEME['error']}; font-size: 10px;")
+            labels = self.task_labels.get(task_id)
+            styles = self.TASK_STYLES.get(status)
+            if labels is None or styles is None:
+                return
+            
+            if status == "running":
+                labels["status"].setText("...")
+            elif status == "error":
+                labels["status"].setText("Error")
+            elif time_ms is not None:
+                if time_ms >= 1000:
+                    labels["status"].setText(f"{time_ms/1000:.1f}s")
+                else:
+                    labels["status"].setText(f"{time_ms:.0f}ms")
+            
+            # Restyle only when the task moves to a new status
+            if labels.get("shown") != status:
+                labels["shown"] = status
+                indicator_style, name_style, status_style = styles
+                labels["indicator"].setStyleSheet(indicator_style)
+                labels["name"].setStyleSheet(name_style)
+                labels["status"].setStyleSheet(status_style)
         
         def check_pipe(self):
             """Check for messages from main process"""
@@ -13253,6 +13328,8 @@ def main():
     
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    pool = QThreadPool.globalInstance()
+    pool.setMaxThreadCount(max(pool.maxThreadCount(), MIN_WORKER_THREADS))
     qt_time = (time.time() - task_start) * 1000
     splash.update_task("qt", "complete", qt_time)
     
@@ -13266,9 +13343,12 @@ def main():
     perms_time = (time.time() - task_start) * 1000
     splash.update_task("permissions", "complete", perms_time)
     
-    if not admin_check:
+    # Don't re-ask on every relaunch if the user recently declined elevation
+    declined_at = app_settings.get("admin_prompt_declined_at", 0)
+    prompt_suppressed = time.time() - declined_at < ADMIN_PROMPT_SNOOZE_SECONDS
+    
+    if not admin_check and not prompt_suppressed:
         splash.close()  # Close splash before showing dialog
-        from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             None,
             "Administrator Required",
@@ -13279,6 +13359,7 @@ def main():
         if reply == QMessageBox.StandardButton.Yes:
             run_as_admin()
             sys.exit()
+        app_settings.set("admin_prompt_declined_at", time.time())
         # If user says no, restart splash
         splash = SplashController()
         splash.start()
@@ -3,16 +3,21 @@ Hardware Scanner Module for Windows Health Checker Pro
 Collects comprehensive hardware information via WMI, Registry, and ctypes.
 
 Optimizations:
-- Static data (BIOS, motherboard) cached for 5 minutes
+- Static data (BIOS, motherboard) cached for 5 minutes in memory and for
+  a day on disk, so later launches skip the WMI queries; Secure Boot and
+  TPM state is cached in memory only
 - Timing instrumentation for profiling
 - Separate functions for static vs dynamic data
 """
 
 import subprocess
 import re
+import os
+import json
+import time
 import ctypes
 from ctypes import wintypes
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, replace
 from typing import List, Dict, Optional, Any
 from enum import Enum
 import winreg
@@ -861,10 +866,111 @@ def collect_ram_info() -> RAMInfo:
     return ram
 
 
+# On-disk copy of the static motherboard/BIOS info, reused across launches
+STATIC_CACHE_FILE = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"),
+    "WindowsHealthChecker", "static.json"
+)
+STATIC_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Firmware settings rather than hardware facts: they can be toggled in firmware
+# setup without a BIOS update, so they are never cached
+FIRMWARE_SECURITY_FIELDS = ("bios_mode", "secure_boot", "tpm_present", "tpm_version")
+
+
+def _static_cache_key() -> Dict[str, str]:
+    """Machine and firmware identity from the registry (no WMI); a change invalidates the disk cache"""
+    return {
+        "machine_guid": _get_registry_value(r"SOFTWARE\Microsoft\Cryptography", "MachineGuid") or "",
+        "bios_version": _get_registry_value(r"HARDWARE\DESCRIPTION\System\BIOS", "BIOSVersion") or "",
+        "bios_date": _get_registry_value(r"HARDWARE\DESCRIPTION\System\BIOS", "BIOSReleaseDate") or "",
+    }
+
+
+def _load_static_cache(key: Dict[str, str]) -> Optional[MotherboardInfo]:
+    """Motherboard info from the disk cache, or None if missing, stale or for other firmware"""
+    try:
+        if time.time() - os.path.getmtime(STATIC_CACHE_FILE) > STATIC_CACHE_MAX_AGE:
+            return None
+        with open(STATIC_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") != key:
+            return None
+        fields = data["motherboard"]
+        fields["status"] = HealthStatus(fields["status"])
+        return MotherboardInfo(**fields)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_static_cache(key: Dict[str, str], mb: MotherboardInfo):
+    """Write motherboard info to the disk cache; failures only cost the next launch a probe"""
+    fields = asdict(mb)
+    fields["status"] = mb.status.value
+    for name in FIRMWARE_SECURITY_FIELDS:
+        del fields[name]
+    try:
+        os.makedirs(os.path.dirname(STATIC_CACHE_FILE), exist_ok=True)
+        with open(STATIC_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "motherboard": fields}, f)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
 @timed("collect_motherboard_info")
-@cached("hw_motherboard", ttl_seconds=300)  # Cache for 5 min - static data
 def collect_motherboard_info() -> MotherboardInfo:
-    """Collect comprehensive motherboard and BIOS information (cached - static data)"""
+    """Collect comprehensive motherboard and BIOS information.
+    
+    The static part is cached in memory and on disk; Secure Boot and TPM
+    state only in memory, so a firmware setting change shows on the next launch.
+    """
+    # Copy with the security fields filled in; the cached instance is shared
+    return replace(_static_motherboard_info(), **_firmware_security())
+
+
+@cached("hw_motherboard", ttl_seconds=300)  # Cache for 5 min - static data
+def _static_motherboard_info() -> MotherboardInfo:
+    """Motherboard, BIOS, system and chassis info, from the disk cache while valid"""
+    key = _static_cache_key()
+    mb = _load_static_cache(key)
+    if mb is None:
+        mb = _probe_motherboard_info()
+        if mb.status == HealthStatus.HEALTHY:  # Don't persist a failed probe
+            _save_static_cache(key, mb)
+    return mb
+
+
+@cached("hw_firmware_security", ttl_seconds=300)  # Changes only across a reboot into firmware setup
+def _firmware_security() -> Dict[str, Any]:
+    """Boot mode, Secure Boot and TPM state, keyed by FIRMWARE_SECURITY_FIELDS"""
+    mb = MotherboardInfo()
+    try:
+        # Check UEFI/Secure Boot via registry
+        firmware_type = _get_registry_value(
+            r"SYSTEM\CurrentControlSet\Control\SecureBoot\State",
+            "UEFISecureBootEnabled"
+        )
+        if firmware_type is not None:
+            mb.bios_mode = "UEFI"
+            mb.secure_boot = firmware_type == "1"
+        else:
+            # Check via bcdedit
+            bcdedit_out = _run_powershell("bcdedit | Select-String 'path.*efi'")
+            mb.bios_mode = "UEFI" if "efi" in bcdedit_out.lower() else "Legacy"
+        
+        # TPM check
+        tpm_results = _run_wmic("path Win32_Tpm", ["IsEnabled_InitialValue", "SpecVersion"])
+        if tpm_results:
+            r = tpm_results[0]
+            mb.tpm_present = r.get("IsEnabled_InitialValue", "").lower() == "true"
+            mb.tpm_version = r.get("SpecVersion", "Unknown").split(",")[0] if r.get("SpecVersion") else "Unknown"
+    except Exception:
+        pass
+    return {name: getattr(mb, name) for name in FIRMWARE_SECURITY_FIELDS}
+
+
+def _probe_motherboard_info() -> MotherboardInfo:
+    """Query motherboard, BIOS, system and chassis info via WMI"""
     mb = MotherboardInfo()
     
     try:
@@ -971,26 +1077,6 @@ def collect_motherboard_info() -> MotherboardInfo:
             if chassis_num:
                 mb.chassis_type = chassis_type_map.get(chassis_num.group(), chassis_type_raw)
         
-        # Check UEFI/Secure Boot via registry
-        firmware_type = _get_registry_value(
-            r"SYSTEM\CurrentControlSet\Control\SecureBoot\State",
-            "UEFISecureBootEnabled"
-        )
-        if firmware_type is not None:
-            mb.bios_mode = "UEFI"
-            mb.secure_boot = firmware_type == "1"
-        else:
-            # Check via bcdedit
-            bcdedit_out = _run_powershell("bcdedit | Select-String 'path.*efi'")
-            mb.bios_mode = "UEFI" if "efi" in bcdedit_out.lower() else "Legacy"
-        
-        # TPM check
-        tpm_results = _run_wmic("path Win32_Tpm", ["IsEnabled_InitialValue", "SpecVersion"])
-        if tpm_results:
-            r = tpm_results[0]
-            mb.tpm_present = r.get("IsEnabled_InitialValue", "").lower() == "true"
-            mb.tpm_version = r.get("SpecVersion", "Unknown").split(",")[0] if r.get("SpecVersion") else "Unknown"
-        
         mb.status = HealthStatus.HEALTHY
         
     except Exception:
@@ -1521,7 +1607,7 @@ def collect_hardware_snapshot() -> HardwareSnapshot:
     snapshot.cpu = collect_cpu_info()
     snapshot.gpus = collect_gpu_info()
     snapshot.ram = collect_ram_info()
-    snapshot.motherboard = collect_motherboard_info()  # Cached
+    snapshot.motherboard = collect_motherboard_info()  # Static part cached
     snapshot.storage = collect_storage_info()
     snapshot.network_adapters = collect_network_info()
     snapshot.sensors = collect_sensor_info()
@@ -7,6 +7,7 @@ Provides threading helpers, caching, timing instrumentation, and debouncing.
 import time
 import functools
 import threading
+from collections import deque
 from typing import Any, Callable, Optional, Dict
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -16,7 +17,7 @@ from dataclasses import dataclass, field
 # TIMING INSTRUMENTATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TimingResult:
     """Result of a timed operation"""
     operation: str
@@ -45,8 +46,8 @@ class PerfLogger:
             return
         self._initialized = True
         self.enabled = True
-        self.results: list[TimingResult] = []
         self.max_results = 100  # Keep last N results
+        self.results: deque[TimingResult] = deque(maxlen=self.max_results)
     
     def log(self, result: TimingResult):
         """Log a timing result"""
@@ -54,8 +55,6 @@ class PerfLogger:
             return
         
         self.results.append(result)
-        if len(self.results) > self.max_results:
-            self.results.pop(0)
         
         # Print to console
         status = "OK" if result.success else f"FAIL: {result.error}"
@@ -156,7 +155,7 @@ class TimingContext:
 # CACHING
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Single cache entry with TTL"""
     value: Any
@@ -108,7 +108,7 @@ KNOWN_VENDORS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class StartupEntry:
     """Represents a single startup entry from any source"""
     name: str